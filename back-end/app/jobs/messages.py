@@ -1,3 +1,4 @@
+from datetime import datetime
 from injector import Injector
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
@@ -6,14 +7,19 @@ from app.services import MessageProcessorService
 
 def register(_: Settings, injector: Injector):
 
-    async def periodic_send_message():
+    async def sync_message_schedule():
+        # sends are driven by the processor's own due-time scheduler; this
+        # only picks up messages enabled or removed outside of the API
         message_processor: MessageProcessorService = injector.get(MessageProcessorService)
-        await message_processor.periodic_send()
+        await message_processor.sync_schedule()
 
     scheduler = injector.get(AsyncIOScheduler)
     scheduler.add_job(
-        id      = 'periodic_send_message',
-        func    = periodic_send_message,
-        trigger = 'interval',
-        seconds = 60,
+        id            = 'sync_message_schedule',
+        func          = sync_message_schedule,
+        trigger       = 'interval',
+        minutes       = 10,
+        next_run_time = datetime.now(),
+        max_instances = 1,
+        coalesce      = True,
     )
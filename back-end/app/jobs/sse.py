@@ -10,7 +10,7 @@ def register(settings: Settings, injector: Injector):
 
     async def send_ping():
         events = injector.get(EventsService)
-        await events.broadcast_public("ping")
+        await events.broadcast_keepalive()
 
     if settings.SSE_PING_INTERVAL > 0:
         scheduler.add_job(
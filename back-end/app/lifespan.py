@@ -8,8 +8,15 @@ from contextlib import asynccontextmanager
 from app.app_container import bind_client_session, init_container
 from app.settings import Settings
 from app.jobs import register_jobs
+from app.repositories import (
+    IExtDataRepository,
+    IStationsDataRepository,
+    IStationsRepository,
+    IUsersRepository,
+    LatestStateCache,
+)
 from app.routes import register_routes
-from app.services import AuthorizationService, BeanieInitializer, BotsService, TelegramService, DeyeApiService
+from app.services import AuthorizationService, BeanieInitializer, BotsService, TelegramService, DeyeApiService, MessageProcessorService
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from shared.services.events.service import EventsService
@@ -29,6 +36,22 @@ async def setup_bots(injector: Injector):
     for bot in bots:
         await telegram_service.add_bot(bot.id, bot.token, bot.hook_enabled)
 
+async def warm_up_latest_state(injector: Injector):
+    latest_state = injector.get(LatestStateCache)
+    await latest_state.init()
+
+    stations = await injector.get(IStationsRepository).get_stations(all=True)
+    for station in stations:
+        latest_state.set_station_object_id(station.station_id, station.id)
+    await injector.get(IStationsDataRepository).get_last_station_data_by_station_ids(
+        [station.id for station in stations]
+    )
+
+    users = await injector.get(IUsersRepository).get_users(all=True)
+    await injector.get(IExtDataRepository).get_last_ext_data_by_user_ids(
+        [user.id for user in users if user.is_reporter]
+    )
+
 async def make_shutdown_handler(events: EventsService):
     async def shutdown(signum: int):
         await events.request_shutdown()
@@ -52,10 +75,15 @@ async def lifespan(app: FastAPI):
     events: EventsService = injector.get(EventsService)
     await events.start()
 
+    await warm_up_latest_state(injector)
+
     scheduler = injector.get(AsyncIOScheduler)
     register_jobs(settings, injector)
     scheduler.start()
 
+    message_processor = injector.get(MessageProcessorService)
+    await message_processor.start()
+
     register_routes(app)
 
     await setup_bots(injector)
@@ -72,6 +100,7 @@ async def lifespan(app: FastAPI):
     except Exception:
         pass
 
+    await message_processor.shutdown()
     await events.shutdown()
     await telegram_service.shutdown()
     await deye_service.shutdown()
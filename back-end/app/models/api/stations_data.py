@@ -1,13 +1,18 @@
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel, Field, model_validator
 
 
+# buckets a chart can use; more only costs a bigger $group per request
+MAX_RECORDS_COUNT = 2000
+
+
 class StationsDataRequest(BaseModel):
     last_seconds: Optional[int] = Field(None, alias="lastSeconds")
     start_date: Optional[datetime] = Field(None, alias="startDate")
     end_date: Optional[datetime] = Field(None, alias="endDate")
-    records_count: Optional[int] = Field(250, alias="recordsCount")
+    records_count: Optional[int] = Field(250, alias="recordsCount", ge=0, le=MAX_RECORDS_COUNT)
+    downsampling: Literal["avg", "lttb"] = Field("avg", alias="downsampling")
 
     @model_validator(mode="after")
     def validate_time_range(self):
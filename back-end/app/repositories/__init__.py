@@ -11,11 +11,14 @@ from .interfaces import (
     IExtDataRepository,
     IExtDeviceRepository,
     IDashboardRepository,
+    IPowerTimelineRepository,
 )
+from .cache import LatestStateCache
 from .container import RepositoryContainer
 
 
 __all__ = [IMessagesRepository, IBotsRepository, IStationsRepository, 
            IStationsDataRepository, ILookupsRepository, IChatsRepository,
            IUsersRepository, IVisitsCounterRepository, RepositoryContainer,
-           DataQuery, IExtDataRepository, IExtDeviceRepository, IDashboardRepository]
\ No newline at end of file
+           DataQuery, IExtDataRepository, IExtDeviceRepository, IDashboardRepository,
+           IPowerTimelineRepository, LatestStateCache]
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .latest_state import LatestStateCache, StationDataPair
+
+__all__ = [LatestStateCache, StationDataPair]
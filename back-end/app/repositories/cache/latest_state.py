@@ -0,0 +1,144 @@
+import logging
+from datetime import datetime, timezone
+from typing import Dict, NamedTuple, Optional
+from uuid import uuid4
+from beanie import PydanticObjectId
+from injector import inject
+
+from shared.models import ExtData, StationData
+from shared.services.events.models import EventItem
+from shared.services.events.service import EventsService
+
+
+logger = logging.getLogger(__name__)
+
+
+class StationDataPair(NamedTuple):
+    current: Optional[StationData]
+    previous: Optional[StationData]
+
+
+@inject
+class LatestStateCache:
+    """Per-process cache of the newest station_data / ext_data rows per key.
+
+    Every write or invalidation bumps `generation`; a populate started
+    before that passes the generation it read and is dropped, so a slow
+    query cannot put back a row older than the invalidation.
+    """
+
+    INVALIDATED_EVENT = "latest_state_invalidated"
+
+    def __init__(self, events: EventsService):
+        self._events = events
+        self._origin = uuid4().hex
+        self._station_data: Dict[PydanticObjectId, StationDataPair] = {}
+        self._station_ids: Dict[int, PydanticObjectId] = {}
+        self._ext_data: Dict[PydanticObjectId, Optional[ExtData]] = {}
+        self.generation = 0
+
+    async def init(self):
+        self._events.add_internal_handler(self._handle_internal_event)
+
+    # ---- station data ----
+
+    def has_station_data(self, station_id: PydanticObjectId) -> bool:
+        return station_id in self._station_data
+
+    def get_station_data(self, station_id: PydanticObjectId) -> StationDataPair | None:
+        return self._station_data.get(station_id)
+
+    def set_station_data(
+        self,
+        station_id: PydanticObjectId,
+        current: StationData | None,
+        previous: StationData | None = None,
+        generation: int | None = None,
+    ):
+        if generation is None or generation == self.generation:
+            self._station_data[station_id] = StationDataPair(current, previous)
+
+    async def push_station_data(self, station_id: PydanticObjectId, station_data: StationData):
+        self.generation += 1
+        pair = self._station_data.get(station_id)
+        if pair is not None and self._is_newer(station_data.last_update_time, pair.current):
+            self._station_data[station_id] = StationDataPair(station_data, pair.current)
+        await self._publish_invalidation(station_id=str(station_id))
+
+    def get_station_object_id(self, station_id: int) -> PydanticObjectId | None:
+        return self._station_ids.get(station_id)
+
+    def set_station_object_id(self, station_id: int, object_id: PydanticObjectId):
+        self._station_ids[station_id] = object_id
+
+    # ---- ext data ----
+
+    def has_ext_data(self, user_id: PydanticObjectId) -> bool:
+        return user_id in self._ext_data
+
+    def get_ext_data(self, user_id: PydanticObjectId) -> ExtData | None:
+        return self._ext_data.get(user_id)
+
+    def set_ext_data(self, user_id: PydanticObjectId, ext_data: ExtData | None, generation: int | None = None):
+        if generation is None or generation == self.generation:
+            self._ext_data[user_id] = ext_data
+
+    async def push_ext_data(self, user_id: PydanticObjectId, ext_data: ExtData):
+        self.generation += 1
+        if user_id in self._ext_data:
+            current = self._ext_data[user_id]
+            if self._is_newer(ext_data.received_at, current, "received_at"):
+                self._ext_data[user_id] = ext_data
+        await self._publish_invalidation(user_id=str(user_id))
+
+    async def invalidate_ext_data(self, user_id: PydanticObjectId):
+        self.generation += 1
+        self._ext_data.pop(user_id, None)
+        await self._publish_invalidation(user_id=str(user_id))
+
+    # ---- maintenance ----
+
+    async def invalidate_all(self):
+        self._clear()
+        await self._publish_invalidation()
+
+    def _clear(self):
+        # station object ids never change, so the mapping survives a reset
+        self.generation += 1
+        self._station_data.clear()
+        self._ext_data.clear()
+
+    def _is_newer(self, value: datetime | None, current, field: str = "last_update_time") -> bool:
+        current_value = getattr(current, field, None) if current else None
+        if value is None or current_value is None:
+            return True
+        return self._as_utc(value) >= self._as_utc(current_value)
+
+    def _as_utc(self, value: datetime) -> datetime:
+        return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+    async def _publish_invalidation(self, **keys: str):
+        try:
+            await self._events.broadcast_internal(
+                self.INVALIDATED_EVENT,
+                {"origin": self._origin, **keys},
+            )
+        except Exception:
+            logger.exception("Cannot publish latest state invalidation")
+
+    async def _handle_internal_event(self, event: EventItem):
+        if event.type != self.INVALIDATED_EVENT or not event.data:
+            return
+        if event.data.get("origin") == self._origin:
+            return
+
+        station_id = event.data.get("station_id")
+        user_id = event.data.get("user_id")
+        self.generation += 1
+
+        if station_id:
+            self._station_data.pop(PydanticObjectId(station_id), None)
+        elif user_id:
+            self._ext_data.pop(PydanticObjectId(user_id), None)
+        else:
+            self._clear()
@@ -1,4 +1,4 @@
-from injector import Binder, Module, noscope
+from injector import Binder, Module, noscope, singleton
 
 from .interfaces import (
     IMessagesRepository,
@@ -12,7 +12,9 @@ from .interfaces import (
     IExtDataRepository,
     IExtDeviceRepository,
     IDashboardRepository,
+    IPowerTimelineRepository,
 )
+from .cache import LatestStateCache
 from .implementations import (
     MessagesRepository,
     StationsRepository,
@@ -25,12 +27,15 @@ from .implementations import (
     ExtDataRepository,
     ExtDeviceRepository,
     DashboardRepository,
+    PowerTimelineRepository,
 )
 
 
 class RepositoryContainer(Module):
 
     def configure(self, binder: Binder):
+        binder.bind(LatestStateCache, scope=singleton)
+
         binder.bind(IMessagesRepository, to=MessagesRepository, scope=noscope)
         binder.bind(IStationsRepository, to=StationsRepository, scope=noscope)
         binder.bind(IStationsDataRepository, to=StationsDataRepository, scope=noscope)
@@ -42,3 +47,4 @@ class RepositoryContainer(Module):
         binder.bind(IExtDataRepository, to=ExtDataRepository, scope=noscope)
         binder.bind(IExtDeviceRepository, to=ExtDeviceRepository, scope=noscope)
         binder.bind(IDashboardRepository, to=DashboardRepository, scope=noscope)
+        binder.bind(IPowerTimelineRepository, to=PowerTimelineRepository, scope=noscope)
@@ -9,8 +9,10 @@ from .chats import ChatsRepository
 from .ext_data import ExtDataRepository
 from .ext_device import ExtDeviceRepository
 from .dashboard import DashboardRepository
+from .power_timeline import PowerTimelineRepository
 
 
 __all__ = [UsersRepository, MessagesRepository, BotsRepository, StationsRepository,
            StationsDataRepository, VisitsCounterRepository, LookupsRepository,
-           ChatsRepository, ExtDataRepository, ExtDeviceRepository, DashboardRepository]
\ No newline at end of file
+           ChatsRepository, ExtDataRepository, ExtDeviceRepository, DashboardRepository,
+           PowerTimelineRepository]
\ No newline at end of file
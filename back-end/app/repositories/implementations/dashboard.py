@@ -27,6 +27,23 @@ class DashboardRepository(IDashboardRepository):
             return await Building.find(fetch_links=True).to_list()
         return await Building.find({"enabled": True}, fetch_links=True).to_list()
 
+    async def get_buildings_by_members(
+        self,
+        station_ids: List[PydanticObjectId],
+        user_ids: List[PydanticObjectId],
+    ) -> List[Building]:
+        # links are stored as DBRefs; match on them before fetching anything
+        matched = await Building.find({
+            "enabled": True,
+            "$or": [
+                {"station.$id": {"$in": list(station_ids)}},
+                {"report_users.$id": {"$in": list(user_ids)}},
+            ],
+        }).to_list()
+        if not matched:
+            return []
+        return await self.get_buildings([building.id for building in matched])
+
     async def get_config(self) -> DashboardConfig:
         return await DashboardConfig.find_one()
 
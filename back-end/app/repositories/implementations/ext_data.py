@@ -1,12 +1,14 @@
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import List, Literal
+from typing import Dict, List, Literal
 from beanie import PydanticObjectId
+from injector import inject
 from pymongo import ASCENDING, DESCENDING
 
 from .base import BaseReadRepository
 from shared.models.ext_data import ExtData
 from app.models.sorting_config import SortingConfig
+from ..cache import LatestStateCache
 from ..interfaces import DataQuery
 from ..interfaces.ext_data import IExtDataRepository
 
@@ -14,9 +16,13 @@ from ..interfaces.ext_data import IExtDataRepository
 logger = logging.getLogger(__name__)
 
 
+@inject
 class ExtDataRepository(IExtDataRepository, BaseReadRepository[ExtData]):
     model = ExtData
 
+    def __init__(self, latest_state: LatestStateCache):
+        self._latest_state = latest_state
+
     def build_reference_joins(self, sorting: SortingConfig | None) -> list[dict]:
         if sorting and sorting.column == "user_id":
             return [
@@ -53,13 +59,54 @@ class ExtDataRepository(IExtDataRepository, BaseReadRepository[ExtData]):
         return await ExtData.get(ext_data_id)
 
     async def get_last_ext_data_by_user_id(self, user_id: PydanticObjectId) -> ExtData:
+        if self._latest_state.has_ext_data(user_id):
+            return self._latest_state.get_ext_data(user_id)
+
+        generation = self._latest_state.generation
         documents = await ExtData.find(
             ExtData.user_id == user_id,
-            fetch_links = True
         ).sort(
             -ExtData.received_at
-        ).to_list()
-        return documents[0] if documents else None
+        ).limit(1).to_list()
+        ext_data = documents[0] if documents else None
+        self._latest_state.set_ext_data(user_id, ext_data, generation)
+        return ext_data
+
+    async def get_last_ext_data_by_user_ids(
+        self,
+        user_ids: List[PydanticObjectId],
+    ) -> Dict[PydanticObjectId, ExtData]:
+        missing_ids = [
+            user_id for user_id in set(user_ids)
+            if not self._latest_state.has_ext_data(user_id)
+        ]
+
+        loaded = {}
+        if missing_ids:
+            generation = self._latest_state.generation
+            pipeline = [
+                {"$match": {"user_id": {"$in": missing_ids}}},
+                {"$sort": {"user_id": ASCENDING, "received_at": DESCENDING}},
+                {
+                    "$group": {
+                        "_id": "$user_id",
+                        "last": {"$first": "$$ROOT"},
+                    }
+                },
+            ]
+
+            result = await ExtData.aggregate(pipeline).to_list()
+            loaded = {item["_id"]: ExtData(**item["last"]) for item in result}
+
+            for user_id in missing_ids:
+                self._latest_state.set_ext_data(user_id, loaded.get(user_id), generation)
+
+        result = {}
+        for user_id in user_ids:
+            ext_data = loaded[user_id] if user_id in loaded else self._latest_state.get_ext_data(user_id)
+            if ext_data is not None:
+                result[user_id] = ext_data
+        return result
 
     async def add_ext_data(
         self,
@@ -73,15 +120,31 @@ class ExtDataRepository(IExtDataRepository, BaseReadRepository[ExtData]):
             received_at = date,
         )
         await ext_data.insert()
+        await self._latest_state.push_ext_data(user_id, ext_data)
         return ext_data.id
 
     async def delete(self, ext_data_id: PydanticObjectId) -> bool:
         ext_data = await ExtData.get(ext_data_id)
         if ext_data:
             await ext_data.delete()
+            await self._latest_state.invalidate_ext_data(ext_data.user_id)
             return True
         return False
 
+    async def get_ext_data_by_user_ids(
+        self,
+        user_ids: List[PydanticObjectId],
+        start_date: datetime | None = None,
+    ) -> List[ExtData]:
+        query = {"user_id": {"$in": user_ids}}
+        if start_date is not None:
+            query["received_at"] = {"$gte": start_date}
+        return await ExtData.find(
+            query,
+        ).sort(
+            ExtData.received_at
+        ).to_list()
+
     async def get_ext_data_statistics(
         self,
         user_id: PydanticObjectId,
@@ -118,3 +181,4 @@ class ExtDataRepository(IExtDataRepository, BaseReadRepository[ExtData]):
         await ExtData.find(
             ExtData.received_at < timeout
         ).delete()
+        await self._latest_state.invalidate_all()
@@ -22,6 +22,10 @@ class MessagesRepository(IMessagesRepository):
         query = {} if all else {"enabled": True}
         return await Message.find(query, fetch_links=True).to_list()
 
+    async def get_messages_by_ids(self, message_ids: List[PydanticObjectId]) -> List[Message]:
+        query = {"_id": {"$in": list(message_ids)}, "enabled": True}
+        return await Message.find(query, fetch_links=True).to_list()
+
     async def get_message(self, message_id: PydanticObjectId) -> Message:
         return await self._get_message(message_id, True)
     
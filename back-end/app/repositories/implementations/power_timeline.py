@@ -0,0 +1,89 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import List
+from beanie import PydanticObjectId
+
+from shared.models.power_timeline import PowerPeriod, PowerPeriodKind, PowerTimeline
+from ..interfaces.power_timeline import IPowerTimelineRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class PowerTimelineRepository(IPowerTimelineRepository):
+
+    async def get_timeline(self, building_id: PydanticObjectId) -> PowerTimeline | None:
+        return await PowerTimeline.find_one(PowerTimeline.building_id == building_id)
+
+    async def get_timelines_by_report_user(self, user_id: PydanticObjectId) -> List[PowerTimeline]:
+        return await PowerTimeline.find({"report_user_ids": user_id}).to_list()
+
+    async def get_timelines_by_station(self, station_id: PydanticObjectId) -> List[PowerTimeline]:
+        return await PowerTimeline.find(PowerTimeline.station_id == station_id).to_list()
+
+    async def save_timeline(self, timeline: PowerTimeline):
+        await timeline.save()
+
+    async def add_period(self, period: PowerPeriod):
+        await period.insert()
+
+    async def replace_periods(
+        self,
+        building_id: PydanticObjectId,
+        kind: PowerPeriodKind,
+        periods: List[PowerPeriod],
+        since: datetime | None = None,
+    ):
+        query = [
+            PowerPeriod.building_id == building_id,
+            PowerPeriod.kind == kind,
+        ]
+        if since is not None:
+            query.append(PowerPeriod.end_time >= since)
+
+        await PowerPeriod.find(*query).delete()
+        if periods:
+            await PowerPeriod.insert_many(periods)
+
+    async def get_last_period_before(
+        self,
+        building_id: PydanticObjectId,
+        kind: PowerPeriodKind,
+        before: datetime,
+    ) -> PowerPeriod | None:
+        return await PowerPeriod.find(
+            PowerPeriod.building_id == building_id,
+            PowerPeriod.kind == kind,
+            PowerPeriod.end_time <= before,
+        ).sort(
+            -PowerPeriod.end_time,
+            +PowerPeriod.start_time,
+        ).first_or_none()
+
+    async def get_periods(
+        self,
+        building_id: PydanticObjectId,
+        kind: PowerPeriodKind,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[PowerPeriod]:
+        return await PowerPeriod.find(
+            PowerPeriod.building_id == building_id,
+            PowerPeriod.kind == kind,
+            PowerPeriod.end_time > start_date,
+            PowerPeriod.start_time < end_date,
+        ).sort(
+            PowerPeriod.start_time
+        ).to_list()
+
+    async def delete_timeline(self, building_id: PydanticObjectId):
+        await PowerPeriod.find(PowerPeriod.building_id == building_id).delete()
+        await PowerTimeline.find(PowerTimeline.building_id == building_id).delete()
+
+    async def delete_old_periods(self, keep_days: int):
+        timeout = datetime.now(timezone.utc) - timedelta(days = keep_days)
+        logger.info(f"removing power periods older than {timeout}")
+
+        await PowerPeriod.find(
+            PowerPeriod.end_time < timeout
+        ).delete()
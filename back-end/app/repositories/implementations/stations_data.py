@@ -1,13 +1,15 @@
 import logging
 from datetime import datetime, timedelta, timezone
 import traceback
-from typing import List, Optional, get_origin, get_args
+from typing import Dict, Iterable, List, Optional, Tuple, get_origin, get_args
 
 from beanie import PydanticObjectId
 from injector import inject
+from pymongo import ASCENDING, DESCENDING
 
 from app.settings import Settings
 from app.models import AssumedStationStatus, StationStatisticData
+from ..cache import LatestStateCache, StationDataPair
 from ..interfaces.stations_data import IStationsDataRepository
 from shared.models import Station, StationData
 from app.models.deye import DeyeStationData
@@ -22,38 +24,81 @@ class StationsDataRepository(IStationsDataRepository):
     def __init__(
         self,
         settings: Settings,
+        latest_state: LatestStateCache,
     ):
         self._settings = settings
+        self._latest_state = latest_state
+
+    def _build_station_data(self, station: Station, station_data: DeyeStationData) -> StationData:
+        return StationData(
+            station_id          = station.id,
+            battery_power       = station_data.battery_power,
+            battery_soc         = station_data.battery_soc,
+            charge_power        = station_data.charge_power,
+            code                = station_data.code,
+            consumption_power   = station_data.consumption_power,
+            discharge_power     = station_data.discharge_power,
+            generation_power    = station_data.generation_power,
+            grid_power          = station_data.grid_power,
+            irradiate_intensity = station_data.irradiate_intensity,
+            last_update_time    = datetime.fromtimestamp(station_data.last_update_time, timezone.utc),
+            msg                 = station_data.msg,
+            purchase_power      = station_data.purchase_power,
+            request_id          = station_data.request_id,
+            wire_power          = station_data.wire_power
+        )
 
-    async def add_station_data(self, station: Station, station_data: DeyeStationData):
+    async def add_station_data(self, station: Station, station_data: DeyeStationData) -> StationData | None:
         try:
-            last_update_time = datetime.fromtimestamp(station_data.last_update_time, timezone.utc)
+            new_record = self._build_station_data(station, station_data)
             existing_record = await StationData.find_one(
                 StationData.station_id == station.id,
-                StationData.last_update_time == last_update_time,
+                StationData.last_update_time == new_record.last_update_time,
             )
 
             if not existing_record:
-                new_record = StationData(
-                    station_id          = station.id,
-                    battery_power       = station_data.battery_power,
-                    battery_soc         = station_data.battery_soc,
-                    charge_power        = station_data.charge_power,
-                    code                = station_data.code,
-                    consumption_power   = station_data.consumption_power,
-                    discharge_power     = station_data.discharge_power,
-                    generation_power    = station_data.generation_power,
-                    grid_power          = station_data.grid_power,
-                    irradiate_intensity = station_data.irradiate_intensity,
-                    last_update_time    = last_update_time,
-                    msg                 = station_data.msg,
-                    purchase_power      = station_data.purchase_power,
-                    request_id          = station_data.request_id,
-                    wire_power          = station_data.wire_power
-                )
                 await new_record.insert()
+                await self._latest_state.push_station_data(station.id, new_record)
+                return new_record
+        except Exception as e:
+            logger.error(f"Error updating station data:", exc_info=True)
+        return None
+
+    async def add_station_data_many(
+        self,
+        items: List[tuple[Station, DeyeStationData]],
+    ) -> List[StationData]:
+        try:
+            records = [self._build_station_data(station, station_data) for station, station_data in items]
+            if not records:
+                return []
+
+            # time-series collections cannot carry a unique index, so dedup
+            # against the newest known row per station (served from cache)
+            last_station_data = await self.get_last_station_data_by_station_ids(
+                [record.station_id for record in records]
+            )
+
+            new_records = []
+            for record in records:
+                last = last_station_data.get(record.station_id)
+                if last and self._as_utc(last.last_update_time) >= record.last_update_time:
+                    continue
+                record.id = PydanticObjectId()
+                new_records.append(record)
+
+            if new_records:
+                await StationData.insert_many(new_records)
+                for record in new_records:
+                    await self._latest_state.push_station_data(record.station_id, record)
+
+            return new_records
         except Exception as e:
             logger.error(f"Error updating station data:", exc_info=True)
+            return []
+
+    def _as_utc(self, value: datetime) -> datetime:
+        return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
 
     async def get_full_station_data(self, station_id: PydanticObjectId, last_seconds: int) -> List[StationData]:
         try:
@@ -105,26 +150,158 @@ class StationsDataRepository(IStationsDataRepository):
             return []
 
 
-    async def get_last_station_data(
+    DOWNSAMPLED_COLUMNS = {
+        "battery_soc": {"$ifNull": ["$battery_soc", 0]},
+        "discharge_power": {"$ifNull": ["$discharge_power", 0]},
+        "charge_power": {"$abs": {"$ifNull": ["$charge_power", 0]}},
+        "consumption_power": {"$ifNull": ["$consumption_power", 0]},
+    }
+
+    async def get_downsampled_station_data(
+        self,
+        station_ids: List[PydanticObjectId],
+        start_date: datetime,
+        end_date: datetime,
+        buckets: int,
+    ) -> Dict[PydanticObjectId, List[dict]]:
+        if not station_ids:
+            return {}
+
+        bucket_ms = max(1, int((end_date - start_date).total_seconds() * 1000 / max(1, buckets)))
+        accumulators = {"count": {"$sum": 1}, "time": {"$avg": {"$toLong": "$last_update_time"}}}
+        for column, expression in self.DOWNSAMPLED_COLUMNS.items():
+            accumulators[column] = {"$avg": expression}
+            accumulators[f"{column}_min"] = {"$min": expression}
+            accumulators[f"{column}_max"] = {"$max": expression}
+
+        pipeline = [
+            {"$match": self._build_range_match(start_date, end_date, {"$in": list(station_ids)})},
+            {
+                "$group": {
+                    "_id": {
+                        "station_id": "$station_id",
+                        "bucket": {
+                            "$floor": {
+                                "$divide": [{"$subtract": ["$last_update_time", start_date]}, bucket_ms]
+                            }
+                        },
+                    },
+                    **accumulators,
+                }
+            },
+            {"$sort": {"_id.station_id": ASCENDING, "_id.bucket": ASCENDING}},
+            {
+                "$project": {
+                    "_id": 0,
+                    "station_id": "$_id.station_id",
+                    "last_update_time": {"$toDate": {"$toLong": "$time"}},
+                    "count": 1,
+                    **{key: 1 for key in accumulators if key not in ("count", "time")},
+                }
+            },
+        ]
+
+        result: Dict[PydanticObjectId, List[dict]] = {station_id: [] for station_id in station_ids}
+        for item in await StationData.aggregate(pipeline).to_list():
+            result.setdefault(item.pop("station_id"), []).append(item)
+        return result
+
+    async def get_generator_samples(
         self,
         station_id: PydanticObjectId,
-    ) -> StationData:
-        station = await (
+        start_date: datetime | None = None,
+    ) -> List[tuple[datetime, bool]]:
+        # mirrors app.utils.is_generator_running, evaluated server-side
+        pipeline = [
+            {"$match": self._build_range_match(start_date, None, station_id)},
+            {"$sort": {"last_update_time": ASCENDING}},
+            {
+                "$project": {
+                    "_id": 0,
+                    "last_update_time": 1,
+                    "running": {
+                        "$and": [
+                            {"$gt": [{"$multiply": [{"$ifNull": ["$charge_power", 0]}, -1]}, 200]},
+                            {"$gt": [{"$ifNull": ["$generation_power", 0]}, 0]},
+                            {"$eq": [{"$ifNull": ["$wire_power", 0]}, 0]},
+                        ]
+                    },
+                }
+            },
+        ]
+
+        result = await StationData.aggregate(pipeline).to_list()
+        return [(item["last_update_time"], item["running"]) for item in result]
+
+
+    async def _load_station_data_pair(self, station_id: PydanticObjectId) -> StationDataPair:
+        generation = self._latest_state.generation
+        stations = await (
             StationData.find(
                 StationData.station_id == station_id,
             )
             .sort(-StationData.last_update_time)
-            .first_or_none()
+            .limit(2)
+            .to_list()
         )
-        return station
 
-    async def get_station_data_average_column(
+        current = stations[0] if stations else None
+        previous = stations[1] if len(stations) == 2 else None
+        self._latest_state.set_station_data(station_id, current, previous, generation)
+        return StationDataPair(current, previous)
+
+    async def get_last_station_data(
         self,
-        start_date: datetime | None,
-        end_date: datetime | None,
-        station_id: int,
-        column_name: str,
-    ) -> float:
+        station_id: PydanticObjectId,
+    ) -> StationData:
+        pair = self._latest_state.get_station_data(station_id)
+        if pair is None:
+            pair = await self._load_station_data_pair(station_id)
+        return pair.current
+
+    async def get_last_station_data_by_station_ids(
+        self,
+        station_ids: List[PydanticObjectId],
+    ) -> Dict[PydanticObjectId, StationData]:
+        missing_ids = [
+            station_id for station_id in set(station_ids)
+            if not self._latest_state.has_station_data(station_id)
+        ]
+
+        loaded_pairs: Dict[PydanticObjectId, StationDataPair] = {}
+        if missing_ids:
+            generation = self._latest_state.generation
+            pipeline = [
+                {"$match": {"station_id": {"$in": missing_ids}}},
+                # walks the {station_id, last_update_time desc} index, so
+                # $firstN stops at the two newest rows of each station
+                {"$sort": {"station_id": ASCENDING, "last_update_time": DESCENDING}},
+                {
+                    "$group": {
+                        "_id": "$station_id",
+                        "last": {"$firstN": {"input": "$$ROOT", "n": 2}},
+                    }
+                },
+            ]
+
+            result = await StationData.aggregate(pipeline).to_list()
+            loaded = {item["_id"]: item["last"] for item in result}
+
+            for station_id in missing_ids:
+                rows = [StationData(**row) for row in loaded.get(station_id, [])]
+                current = rows[0] if rows else None
+                previous = rows[1] if len(rows) == 2 else None
+                self._latest_state.set_station_data(station_id, current, previous, generation)
+                loaded_pairs[station_id] = StationDataPair(current, previous)
+
+        result = {}
+        for station_id in station_ids:
+            pair = loaded_pairs.get(station_id) or self._latest_state.get_station_data(station_id)
+            if pair is not None and pair.current is not None:
+                result[station_id] = pair.current
+        return result
+
+    def _validate_numeric_column(self, column_name: str):
         if column_name not in StationData.model_fields:
             raise ValueError(f"Field '{column_name}' does not exist in StationData model.")
 
@@ -140,6 +317,12 @@ class StationsDataRepository(IStationsDataRepository):
                 f"Field '{column_name}' is not numeric (expected int or float; got {field_type})"
             )
 
+    def _build_range_match(
+        self,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        station_id,
+    ) -> dict:
         match: dict = {
             "station_id": station_id,
         }
@@ -154,6 +337,18 @@ class StationsDataRepository(IStationsDataRepository):
             if not match["last_update_time"]:
                 del match["last_update_time"]
 
+        return match
+
+    async def get_station_data_average_column(
+        self,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        station_id: int,
+        column_name: str,
+    ) -> float:
+        self._validate_numeric_column(column_name)
+        match = self._build_range_match(start_date, end_date, station_id)
+
         pipeline = [
             {"$match": match},
             {
@@ -175,31 +370,99 @@ class StationsDataRepository(IStationsDataRepository):
 
         return float(result[0]["avg_value"])
 
+    async def get_station_data_averages(
+        self,
+        station_id: PydanticObjectId,
+        end_date: datetime,
+        windows: Iterable[Tuple[str, datetime | None]],
+    ) -> Dict[Tuple[str, datetime | None], float]:
+        """Averages several (column, start date) windows of one station in one aggregation."""
+        windows = list(dict.fromkeys(windows))
+        if not windows:
+            return {}
+        for column_name, _ in windows:
+            self._validate_numeric_column(column_name)
+
+        starts = [start_date for _, start_date in windows]
+        start_date = None if None in starts else min(starts)
+        match = self._build_range_match(start_date, end_date, station_id)
+
+        # $avg skips nulls, so documents before a window's own start are
+        # masked out instead of being matched by a separate query
+        group: dict = {"_id": None}
+        for index, (column_name, window_start) in enumerate(windows):
+            value = {"$ifNull": [f"${column_name}", 0]}
+            if window_start is not None and window_start != start_date:
+                value = {"$cond": [{"$gte": ["$last_update_time", window_start]}, value, None]}
+            group[f"avg_{index}"] = {"$avg": value}
+
+        result = await StationData.aggregate([
+            {"$match": match},
+            {"$group": group},
+        ]).to_list()
+        row = result[0] if result else {}
+
+        return {
+            window: float(row.get(f"avg_{index}") or 0.0)
+            for index, window in enumerate(windows)
+        }
+
+    async def get_station_data_average_column_by_station_ids(
+        self,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        station_ids: List[PydanticObjectId],
+        column_name: str,
+    ) -> Dict[PydanticObjectId, float]:
+        self._validate_numeric_column(column_name)
+        if not station_ids:
+            return {}
+
+        match = self._build_range_match(start_date, end_date, {"$in": list(station_ids)})
+
+        pipeline = [
+            {"$match": match},
+            {
+                "$group": {
+                    "_id": "$station_id",
+                    "avg_value": {
+                        "$avg": {
+                            "$ifNull": [f"${column_name}", 0]
+                        }
+                    },
+                }
+            },
+        ]
+
+        result = await StationData.aggregate(pipeline).to_list()
+
+        return {
+            item["_id"]: float(item["avg_value"])
+            for item in result
+            if item.get("avg_value") is not None
+        }
+
     async def get_station_data_tuple(
         self,
         station_id: str,
     ) -> Optional[StationStatisticData]:
         try:
-            station = await Station.find_one(Station.station_id == station_id)
-            if not station:
+            object_id = self._latest_state.get_station_object_id(station_id)
+            if object_id is None:
+                station = await Station.find_one(Station.station_id == station_id)
+                if not station:
+                    return None
+                object_id = station.id
+                self._latest_state.set_station_object_id(station_id, object_id)
+
+            pair = self._latest_state.get_station_data(object_id)
+            if pair is None:
+                pair = await self._load_station_data_pair(object_id)
+
+            if pair.current is None:
                 return None
 
-            stations = (
-                await StationData.find(
-                    StationData.station_id == station.id
-                )
-                .sort("-last_update_time")
-                .limit(2)
-                .to_list()
-            )
-
-            if not stations:
-                return None
-
-            previous = stations[1] if len(stations) == 2 else None
-            current = stations[0]
-
-            return StationStatisticData(previous, current)
+            return StationStatisticData(pair.previous, pair.current)
 
         except Exception as e:
             logger.error(f"Error fetching station data tuple: {e}")
@@ -212,21 +475,20 @@ class StationsDataRepository(IStationsDataRepository):
         await StationData.find(
             StationData.last_update_time < timeout
         ).delete()
+        await self._latest_state.invalidate_all()
 
     async def get_assumed_connection_status(self, station_id: int) -> AssumedStationStatus:
-        station_data = await StationData.find(
-            StationData.station_id == station_id
-        ).sort(
-            -StationData.last_update_time
-        ).limit(1).to_list()
+        station_data = await self.get_last_station_data(station_id)
+        return self.assume_connection_status(station_data)
 
+    def assume_connection_status(self, station_data: StationData | None) -> AssumedStationStatus:
         if not station_data:
             return AssumedStationStatus.OFFLINE
 
         report_interval_seconds: int = self._settings.DEYE_REPORT_INTERVAL
         offline_reports_cnt: int = self._settings.DEYE_ASSUMED_OFFLINE_REPORTS
 
-        latest_update = station_data[0].last_update_time.replace(tzinfo=timezone.utc)
+        latest_update = station_data.last_update_time.replace(tzinfo=timezone.utc)
         current_time = datetime.now(timezone.utc)
 
         time_elapsed = (current_time - latest_update).total_seconds()
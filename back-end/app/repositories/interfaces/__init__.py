@@ -10,9 +10,11 @@ from .chats import IChatsRepository
 from .ext_data import IExtDataRepository
 from .ext_device import IExtDeviceRepository
 from .dashboard import IDashboardRepository
+from .power_timeline import IPowerTimelineRepository
 
 
 __all__ = [DataQuery, IBotsRepository, IUsersRepository, IMessagesRepository,
            ILookupsRepository, LookupDefinition, IStationsRepository, 
            IStationsDataRepository, IVisitsCounterRepository, IChatsRepository,
-           IExtDataRepository, IExtDeviceRepository, IDashboardRepository]
\ No newline at end of file
+           IExtDataRepository, IExtDeviceRepository, IDashboardRepository,
+           IPowerTimelineRepository]
\ No newline at end of file
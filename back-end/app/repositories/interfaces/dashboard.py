@@ -29,6 +29,15 @@ class IDashboardRepository(ABC):
     async def get_buildings(self, ids: List[PydanticObjectId] = None, all: bool = False) -> List[Building]:
         ...
 
+    @abstractmethod
+    async def get_buildings_by_members(
+        self,
+        station_ids: List[PydanticObjectId],
+        user_ids: List[PydanticObjectId],
+    ) -> List[Building]:
+        """Enabled buildings bound to any of these stations or reporters."""
+        ...
+
     @abstractmethod
     async def get_config(self) -> DashboardConfig:
         ...
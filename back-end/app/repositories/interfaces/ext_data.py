@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List
+from typing import Dict, List
 from beanie import PydanticObjectId
 
 from shared.models.ext_data import ExtData
@@ -20,6 +20,13 @@ class IExtDataRepository(ABC):
     async def get_last_ext_data_by_user_id(self, user_id: PydanticObjectId) -> ExtData:
         ...
 
+    @abstractmethod
+    async def get_last_ext_data_by_user_ids(
+        self,
+        user_ids: List[PydanticObjectId],
+    ) -> Dict[PydanticObjectId, ExtData]:
+        ...
+
     @abstractmethod
     async def add_ext_data(
         self,
@@ -33,6 +40,14 @@ class IExtDataRepository(ABC):
     async def delete(self, ext_data_id: PydanticObjectId) -> bool:
         ...
 
+    @abstractmethod
+    async def get_ext_data_by_user_ids(
+        self,
+        user_ids: List[PydanticObjectId],
+        start_date: datetime | None = None,
+    ) -> List[ExtData]:
+        ...
+
     @abstractmethod
     async def get_ext_data_statistics(
         self,
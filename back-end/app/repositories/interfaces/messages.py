@@ -12,6 +12,10 @@ class IMessagesRepository(ABC):
     async def get_messages(self, all: bool = False) -> List[Message]:
         ...
 
+    @abstractmethod
+    async def get_messages_by_ids(self, message_ids: List[PydanticObjectId]) -> List[Message]:
+        ...
+
     @abstractmethod
     async def get_message(self, message_id: PydanticObjectId) -> Message:
         ...
@@ -0,0 +1,65 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+from beanie import PydanticObjectId
+
+from shared.models.power_timeline import PowerPeriod, PowerPeriodKind, PowerTimeline
+
+
+class IPowerTimelineRepository(ABC):
+    @abstractmethod
+    async def get_timeline(self, building_id: PydanticObjectId) -> PowerTimeline | None:
+        ...
+
+    @abstractmethod
+    async def get_timelines_by_report_user(self, user_id: PydanticObjectId) -> List[PowerTimeline]:
+        ...
+
+    @abstractmethod
+    async def get_timelines_by_station(self, station_id: PydanticObjectId) -> List[PowerTimeline]:
+        ...
+
+    @abstractmethod
+    async def save_timeline(self, timeline: PowerTimeline):
+        ...
+
+    @abstractmethod
+    async def add_period(self, period: PowerPeriod):
+        ...
+
+    @abstractmethod
+    async def replace_periods(
+        self,
+        building_id: PydanticObjectId,
+        kind: PowerPeriodKind,
+        periods: List[PowerPeriod],
+        since: datetime | None = None,
+    ):
+        ...
+
+    @abstractmethod
+    async def get_last_period_before(
+        self,
+        building_id: PydanticObjectId,
+        kind: PowerPeriodKind,
+        before: datetime,
+    ) -> PowerPeriod | None:
+        ...
+
+    @abstractmethod
+    async def get_periods(
+        self,
+        building_id: PydanticObjectId,
+        kind: PowerPeriodKind,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[PowerPeriod]:
+        ...
+
+    @abstractmethod
+    async def delete_timeline(self, building_id: PydanticObjectId):
+        ...
+
+    @abstractmethod
+    async def delete_old_periods(self, keep_days: int):
+        ...
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from beanie import PydanticObjectId
 
@@ -12,7 +12,14 @@ from app.models.deye import DeyeStationData
 class IStationsDataRepository(ABC):
 
     @abstractmethod
-    async def add_station_data(self, station: Station, station_data: DeyeStationData):
+    async def add_station_data(self, station: Station, station_data: DeyeStationData) -> StationData | None:
+        ...
+
+    @abstractmethod
+    async def add_station_data_many(
+        self,
+        items: List[tuple[Station, DeyeStationData]],
+    ) -> List[StationData]:
         ...
 
     @abstractmethod
@@ -28,14 +35,43 @@ class IStationsDataRepository(ABC):
     ) -> List[StationData]:
         ...
 
+    @abstractmethod
+    async def get_downsampled_station_data(
+        self,
+        station_ids: List[PydanticObjectId],
+        start_date: datetime,
+        end_date: datetime,
+        buckets: int,
+    ) -> Dict[PydanticObjectId, List[dict]]:
+        ...
+
+    @abstractmethod
+    async def get_generator_samples(
+        self,
+        station_id: PydanticObjectId,
+        start_date: datetime | None = None,
+    ) -> List[tuple[datetime, bool]]:
+        ...
+
     @abstractmethod
     async def get_assumed_connection_status(self, station_id: int) -> AssumedStationStatus:
         ...
 
+    @abstractmethod
+    def assume_connection_status(self, station_data: StationData | None) -> AssumedStationStatus:
+        ...
+
     @abstractmethod
     async def get_last_station_data(self, station_id: PydanticObjectId) -> StationData:
         ...
 
+    @abstractmethod
+    async def get_last_station_data_by_station_ids(
+        self,
+        station_ids: List[PydanticObjectId],
+    ) -> Dict[PydanticObjectId, StationData]:
+        ...
+
     @abstractmethod
     async def get_station_data_average_column(
         self,
@@ -46,6 +82,25 @@ class IStationsDataRepository(ABC):
     ) -> float:
         ...
 
+    @abstractmethod
+    async def get_station_data_averages(
+        self,
+        station_id: PydanticObjectId,
+        end_date: datetime,
+        windows: Iterable[Tuple[str, datetime | None]],
+    ) -> Dict[Tuple[str, datetime | None], float]:
+        ...
+
+    @abstractmethod
+    async def get_station_data_average_column_by_station_ids(
+        self,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        station_ids: List[PydanticObjectId],
+        column_name: str,
+    ) -> Dict[PydanticObjectId, float]:
+        ...
+
     @abstractmethod
     async def get_station_data_tuple(station_id: str) -> Optional[StationStatisticData]:
         ...
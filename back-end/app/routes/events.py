@@ -1,21 +1,35 @@
 import asyncio
-import json
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Header, HTTPException, Query
 from fastapi_injector import Injected
 from starlette.responses import StreamingResponse
 
 from app.utils.jwt_dependencies import get_jwt_from_query
 from shared import BoundedQueue
 from shared.services.events.service import EventsService
+from shared.services.events import EventFrame, StreamEncoder
 
 
 def register(app: FastAPI):
     @app.get("/api/events")
     async def events(
         claims: dict | None = Depends(get_jwt_from_query),
+        last_event_id: str | None = Query(default=None, alias="lastEventId"),
+        last_event_id_header: str | None = Header(default=None, alias="Last-Event-ID"),
+        compact: bool = Query(default=False),
+        deflate: bool = Query(default=False),
+        accept_encoding: str | None = Header(default=None),
         events = Injected(EventsService)
     ):
-        q = BoundedQueue(maxsize=100)
+        if events.draining:
+            raise HTTPException(
+                status_code=503,
+                detail="Events stream is shutting down",
+                headers={"Retry-After": str(events.retry_after())},
+            )
+
+        q = BoundedQueue(maxsize=100, key=EventFrame.dedup_key)
+        last_event_id = last_event_id_header or last_event_id
+        encoder = StreamEncoder.negotiate(compact, deflate, accept_encoding)
 
         user = claims["sub"] if claims else None
         is_auth = user is not None
@@ -24,22 +38,29 @@ def register(app: FastAPI):
         if is_auth:
             events.add_private_client(q)
 
+        # subscribed first, so nothing published during the replay is lost
+        backlog = await events.replay(last_event_id, is_auth) if last_event_id else []
+        replayed_until = backlog[-1].event.id if backlog else None
+
         async def event_generator():
             try:
+                for frame in backlog:
+                    yield encoder.encode(frame, user)
+
                 while True:
-                    event = await q.async_get()
-                    if event is None:
+                    frame = await q.async_get()
+                    if frame is None:
                         break
 
-                    if event.private and not is_auth:
+                    if frame.private and not is_auth:
+                        continue
+
+                    if not frame.published_after(replayed_until):
                         continue
 
-                    if user:
-                        event.user = user
+                    yield encoder.encode(frame, user)
 
-                    yield f"data: {json.dumps(event.to_dict())}\n\n"
-                    
-                    if event.type == "shutdown":
+                    if frame.type == "shutdown":
                         await asyncio.sleep(0)
                         break
             finally:
@@ -51,5 +72,6 @@ def register(app: FastAPI):
             headers={
                 "Cache-Control": "no-cache",
                 "X-Accel-Buffering": "no",
+                **encoder.headers,
             },
         )
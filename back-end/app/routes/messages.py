@@ -14,9 +14,11 @@ from app.models.api import (
     SaveMessageStateRequest,
 )
 from app.services import (
+    MessageProcessorService,
     MessagesService,
     TelegramService,
 )
+from app.utils import template_cache
 from app.utils.jwt_dependencies import jwt_required
 
 
@@ -76,6 +78,21 @@ def register(app: FastAPI):
             raise HTTPException(status_code=500, detail=str(e))
 
 
+    @app.get("/api/messages/templateCache")
+    async def get_template_cache_stats(
+        _ = Depends(jwt_required),
+    ):
+        return template_cache.stats()
+
+
+    @app.get("/api/messages/processorStats")
+    async def get_processor_stats(
+        _ = Depends(jwt_required),
+        message_processor = Injected(MessageProcessorService),
+    ):
+        return message_processor.stats()
+
+
     @app.patch("/api/messages/{message_id}/state")
     async def save_message_state(
         message_id: PydanticObjectId,
@@ -1,8 +1,8 @@
-from datetime import timedelta, timezone
-from statistics import mean
+from datetime import datetime, timedelta, timezone
 from fastapi import FastAPI, Depends, HTTPException, Body, Path
 from fastapi_injector import Injected
 from app.services import StationsService
+from app.utils import StationSeries
 from app.utils.jwt_dependencies import jwt_required
 from app.models.api import StationsDataRequest
 
@@ -14,6 +14,42 @@ def register(app: FastAPI):
         _ = Depends(jwt_required),
         stations = Injected(StationsService)
     ):
+        if body.records_count:
+            end_date = body.end_date or datetime.now(timezone.utc)
+            start_date = body.start_date or end_date - timedelta(seconds=body.last_seconds)
+            stations_data = await stations.get_stations_data_downsampled(
+                start_date,
+                end_date,
+                body.records_count,
+                body.downsampling,
+            )
+
+            return [
+                {
+                    "id": str(station.id),
+                    "name": station.station_name,
+                    "data": [
+                        {
+                            "batterySoc": d["battery_soc"],
+                            "batterySocMin": d["battery_soc_min"],
+                            "batterySocMax": d["battery_soc_max"],
+                            "dischargePower": d["discharge_power"],
+                            "dischargePowerMin": d["discharge_power_min"],
+                            "dischargePowerMax": d["discharge_power_max"],
+                            "chargePower": d["charge_power"],
+                            "chargePowerMin": d["charge_power_min"],
+                            "chargePowerMax": d["charge_power_max"],
+                            "consumptionPower": d["consumption_power"],
+                            "consumptionPowerMin": d["consumption_power_min"],
+                            "consumptionPowerMax": d["consumption_power_max"],
+                            "date": d["last_update_time"].replace(tzinfo=timezone.utc).isoformat()
+                        }
+                        for d in station_data
+                    ]
+                }
+                for (station, station_data) in stations_data
+            ]
+
         is_range_request = body.start_date is not None and body.end_date is not None
         stations_data = await (
             stations.get_stations_data_range(
@@ -23,58 +59,21 @@ def register(app: FastAPI):
             else stations.get_stations_data(body.last_seconds)
         )
 
-        def downsample_data(data, max_records):
-            if not max_records or len(data) <= max_records:
-                return data
-
-            result = [data[0]]
-            n_segments = max_records - 2
-            if n_segments <= 0:
-                return [data[0], data[-1]]
-
-            chunk_size = len(data) / n_segments
-            start_time = data[0].last_update_time
-            end_time = data[-1].last_update_time
-            total_duration = (end_time - start_time).total_seconds()
-
-            for i in range(n_segments):
-                start_idx = int(i * chunk_size)
-                end_idx = int((i + 1) * chunk_size)
-                chunk = data[start_idx:end_idx]
-                if not chunk:
-                    continue
-
-                avg_record = {
-                    "battery_soc": mean(d.battery_soc or 0 for d in chunk),
-                    "discharge_power": mean(d.discharge_power or 0 for d in chunk),
-                    "charge_power": mean(abs(d.charge_power) if d.charge_power else 0 for d in chunk),
-                    "consumption_power": mean(d.consumption_power or 0 for d in chunk),
-                    "last_update_time": start_time + timedelta(seconds=((i + 1) * total_duration / (n_segments + 1)))
-                }
-                result.append(avg_record)
-
-            result.append(data[-1])
-            return result
-
-        def get_station_data(station, station_data):
-            station_data = downsample_data(station_data, body.records_count)
-            return {
+        return [
+            {
                 "id": str(station.id),
                 "name": station.station_name,
                 "data": [
                     {
-                        "batterySoc": d["battery_soc"] if isinstance(d, dict) else d.battery_soc,
-                        "dischargePower": d["discharge_power"] if isinstance(d, dict) else (d.discharge_power or 0),
-                        "chargePower": d["charge_power"] if isinstance(d, dict) else (abs(d.charge_power) if d.charge_power else 0),
-                        "consumptionPower": d["consumption_power"] if isinstance(d, dict) else (d.consumption_power or 0),
-                        "date": (d["last_update_time"] if isinstance(d, dict) else d.last_update_time).replace(tzinfo=timezone.utc).isoformat()
+                        "batterySoc": d.battery_soc,
+                        "dischargePower": d.discharge_power or 0,
+                        "chargePower": abs(d.charge_power) if d.charge_power else 0,
+                        "consumptionPower": d.consumption_power or 0,
+                        "date": d.last_update_time.replace(tzinfo=timezone.utc).isoformat()
                     }
                     for d in station_data
                 ]
             }
-
-        return [
-            get_station_data(station, station_data)
             for (station, station_data) in stations_data
         ]
 
@@ -113,6 +112,7 @@ def register(app: FastAPI):
             }
             for data in station_data
         ]
+        series = StationSeries.from_station_data(station_data)
 
         return {
             "station": {
@@ -126,5 +126,14 @@ def register(app: FastAPI):
                 "lastUpdateTime": station.last_update_time,
             },
             "data": data_list,
-            "dataCount": len(data_list)
+            "dataCount": len(data_list),
+            "energy": {
+                "generatorSeconds": int(series.generator_seconds()),
+                "chargingSeconds": int(series.mask_seconds(series.charging_mask())),
+                "dischargingSeconds": int(series.mask_seconds(series.discharging_mask())),
+                "chargedKwh": round(series.energy_kwh("charge_power", sign=-1), 2),
+                "dischargedKwh": round(series.energy_kwh("discharge_power"), 2),
+                "consumedKwh": round(series.energy_kwh("consumption_power"), 2),
+                "generatedKwh": round(series.energy_kwh("generation_power"), 2),
+            },
         }
@@ -14,6 +14,7 @@ from .lookups import LookupsService
 from .chats import ChatsService
 from .ext_data import ExtDataService
 from .dashboard import DashboardService
+from .power_timeline import PowerTimelineService
 from .maintenance import MaintenanceService
 from .message_processor import MessageProcessorService
 from .interfaces import IMessageGeneratorService, MessageItem, IExtDeviceService
@@ -25,4 +26,5 @@ __all__ = [BeanieInitializer, BotsService, DeyeConfig, DeyeApiService,
            MessagesService, OutagesScheduleService, StationsService, LookupsService,
            ChatsService, ExtDataService, DashboardService, UsersService,
            MaintenanceService, IMessageGeneratorService, MessageItem,
-           MessageProcessorService, TranslationService, IExtDeviceService]
+           MessageProcessorService, TranslationService, IExtDeviceService,
+           PowerTimelineService]
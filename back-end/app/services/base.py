@@ -1,11 +1,12 @@
+from typing import Hashable
 from shared.services import EventsService
 
 class BaseService:
     def __init__(self, events: EventsService):
         self._events = events
 
-    async def broadcast_private(self, type: str, data: dict = None):
-        await self._events.broadcast_private(type, data)
+    async def broadcast_private(self, type: str, data: dict = None, coalesce_key: Hashable = None):
+        await self._events.broadcast_private(type, data, coalesce_key)
 
-    async def broadcast_public(self, type: str, data: dict = None):
-        await self._events.broadcast_public(type, data)
+    async def broadcast_public(self, type: str, data: dict = None, coalesce_key: Hashable = None):
+        await self._events.broadcast_public(type, data, coalesce_key)
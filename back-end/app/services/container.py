@@ -17,9 +17,10 @@ from .lookups import LookupsService
 from .ext_data import ExtDataService
 from .ext_device import ExtDeviceService
 from .dashboard import DashboardService
+from .power_timeline import PowerTimelineService
 from .maintenance import MaintenanceService
 from .message_generator import MessageGeneratorService, MessageGeneratorConfig
-from .message_processor import MessageProcessorService
+from .message_processor import MessageProcessorService, MessageProcessorConfig
 from .interfaces import IMessageGeneratorService, IExtDeviceService
 
 
@@ -41,7 +42,19 @@ class ServicesContainer(Module):
 
         binder.bind(StationsService, scope=noscope)
 
-        events_service_config = EventsServiceConfig(str(self._settings.REDIS_URI), self._settings.DEBUG)
+        events_service_config = EventsServiceConfig(
+            redis_uri               = str(self._settings.REDIS_URI),
+            is_debug                = self._settings.DEBUG,
+            max_lag_seconds         = self._settings.SSE_MAX_LAG_SECONDS,
+            coalesce_window_seconds = self._settings.SSE_COALESCE_WINDOW,
+            transport               = self._settings.SSE_TRANSPORT,
+            stream_maxlen           = self._settings.SSE_STREAM_MAXLEN,
+            redis_max_connections   = self._settings.SSE_REDIS_MAX_CONNECTIONS,
+            publish_queue_size      = self._settings.SSE_PUBLISH_QUEUE_SIZE,
+            publish_overflow        = self._settings.SSE_PUBLISH_OVERFLOW,
+            reconnect_delay_ms      = (self._settings.SSE_RECONNECT_MIN_MS, self._settings.SSE_RECONNECT_MAX_MS),
+            drain_seconds           = self._settings.SSE_DRAIN_SECONDS,
+        )
         binder.bind(EventsServiceConfig, to=events_service_config, scope=noscope)
         binder.bind(EventsService, to=EventsService(events_service_config), scope=singleton)
         binder.bind(OutagesScheduleService, scope=singleton)
@@ -55,7 +68,8 @@ class ServicesContainer(Module):
         binder.bind(MessageGeneratorConfig, scope=noscope)
         binder.bind(IMessageGeneratorService, to=MessageGeneratorService, scope=noscope)
 
-        binder.bind(MessageProcessorService, scope=noscope)
+        binder.bind(MessageProcessorConfig, scope=noscope)
+        binder.bind(MessageProcessorService, scope=singleton)
 
         binder.bind(VisitCounterService, scope=noscope)
 
@@ -66,6 +80,7 @@ class ServicesContainer(Module):
         binder.bind(ExtDataService, scope=noscope)
         binder.bind(IExtDeviceService, to=ExtDeviceService)
 
+        binder.bind(PowerTimelineService, scope=singleton)
         binder.bind(DashboardService, scope=noscope)
 
         scheduler = AsyncIOScheduler()
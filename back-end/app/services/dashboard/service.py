@@ -1,14 +1,16 @@
 import asyncio
 from datetime import datetime, timedelta, timezone
-from typing import List
+from typing import Dict, List
 from beanie import PydanticObjectId
 from injector import inject
 
 from shared.models.building import Building
 from shared.models.dashboard_config import DashboardConfig
 from shared.models.ext_data import ExtData
+from shared.models.station_data import StationData
 from shared.services.events.service import EventsService
 from ..base import BaseService
+from ..power_timeline import PowerTimelineService
 from app.repositories import (
     IDashboardRepository,
     IExtDataRepository,
@@ -34,6 +36,9 @@ from app.utils import get_estimate_charge_time, get_estimate_discharge_time
 
 @inject
 class DashboardService(BaseService):
+    SUMMARY_AVERAGE_MINUTES = 25
+    SUMMARY_UPDATED_EVENT = "building_summary_updated"
+
     def __init__(
         self,
         events: EventsService,
@@ -42,8 +47,10 @@ class DashboardService(BaseService):
         stations: IStationsRepository,
         stations_data: IStationsDataRepository,
         users: IUsersRepository,
+        power_timeline: PowerTimelineService,
     ):
         super().__init__(events)
+        self._power_timeline = power_timeline
         self._dashboard = dashboard
         self._ext_data = ext_data
         self._stations = stations
@@ -110,6 +117,7 @@ class DashboardService(BaseService):
             building.enabled = request.enabled
 
             await self._dashboard.edit_building(building)
+            await self._power_timeline.rebuild(building)
             await self.broadcast_public("buildings_updated")
             return building_id
 
@@ -131,6 +139,7 @@ class DashboardService(BaseService):
         )
 
         building_id = await self._dashboard.create_building(building)
+        await self._power_timeline.rebuild(building)
         await self.broadcast_public("buildings_updated")
         return building_id
 
@@ -139,6 +148,7 @@ class DashboardService(BaseService):
         building = await self._dashboard.get_building(building_id)
         if building:
             await self._dashboard.delete_building(building)
+            await self._power_timeline.remove(building_id)
             await self.broadcast_public("buildings_updated")
             return True
         return False
@@ -149,15 +159,21 @@ class DashboardService(BaseService):
         return [self._process_building(building) for building in buildings]
 
 
-    async def _process_building_summary(self, building: Building, minutes) -> BuildingSummaryResponse:
+    def _process_building_summary(
+        self,
+        building: Building,
+        last_ext_data: Dict[PydanticObjectId, ExtData],
+        last_station_data: Dict[PydanticObjectId, StationData],
+        average_consumption: Dict[PydanticObjectId, float],
+    ) -> BuildingSummaryResponse:
         result = BuildingSummaryResponse(
             id    = building.id
         )
 
-        ext_datas: List[ExtData] = await asyncio.gather(
-            *(self._ext_data.get_last_ext_data_by_user_id(report_user.id)
-                for report_user in building.report_users)
-        )
+        ext_datas: List[ExtData] = [
+            last_ext_data.get(report_user.id)
+            for report_user in (building.report_users or [])
+        ]
         if ext_datas and len(ext_datas) > 0:
             result.is_grid_available = any(x and x.grid_state for x in ext_datas)
             true_count = sum(x.grid_state for x in ext_datas if x)
@@ -168,25 +184,20 @@ class DashboardService(BaseService):
 
         if building.station:
             station_id = building.station.id
-            station_data = await self._stations_data.get_last_station_data(station_id)
+            station_data = last_station_data.get(station_id)
             if station_data is None:
                 return result
 
             is_discharging = (station_data.discharge_power or 0) > 200
             is_charging = (station_data.charge_power or 0) * -1 > 200
 
-            assumed_offline = await self._stations_data.get_assumed_connection_status(station_id) == AssumedStationStatus.OFFLINE
+            assumed_offline = self._stations_data.assume_connection_status(station_data) == AssumedStationStatus.OFFLINE
             result.is_offline = building.station.connection_status == 'ALL_OFFLINE' or assumed_offline
             result.is_charging = is_charging
             result.is_discharging = is_discharging
             result.battery_percent = station_data.battery_soc
 
-            average_consumption_w = await self._stations_data.get_station_data_average_column(
-                datetime.now(timezone.utc) - timedelta(minutes=minutes),
-                datetime.now(timezone.utc),
-                station_id,
-                "consumption_power",
-            ) or 0
+            average_consumption_w = average_consumption.get(station_id) or 0
 
             result.consumption_power = f"{(average_consumption_w / 1000):.2f}"
 
@@ -218,54 +229,69 @@ class DashboardService(BaseService):
         return result
 
 
+    async def _process_buildings_summary(self, buildings: List[Building], minutes) -> List[BuildingSummaryResponse]:
+        station_ids = list({b.station.id for b in buildings if b.station})
+        user_ids = list({u.id for b in buildings for u in (b.report_users or [])})
+        now = datetime.now(timezone.utc)
+
+        last_ext_data, last_station_data, average_consumption = await asyncio.gather(
+            self._ext_data.get_last_ext_data_by_user_ids(user_ids),
+            self._stations_data.get_last_station_data_by_station_ids(station_ids),
+            self._stations_data.get_station_data_average_column_by_station_ids(
+                now - timedelta(minutes=minutes),
+                now,
+                station_ids,
+                "consumption_power",
+            ),
+        )
+
+        return [
+            self._process_building_summary(b, last_ext_data, last_station_data, average_consumption)
+            for b in buildings
+        ]
+
+
     async def get_buildings_summary(self, building_ids: List[PydanticObjectId]) -> List[BuildingSummaryResponse]:
         buildings = await self._dashboard.get_buildings(building_ids)
-        minutes = 25
+        return await self._process_buildings_summary(buildings, self.SUMMARY_AVERAGE_MINUTES)
 
-        return await asyncio.gather(
-            *(self._process_building_summary(b, minutes) for b in buildings)
-        )
+
+    async def publish_buildings_summary(
+        self,
+        station_ids: List[PydanticObjectId] = None,
+        user_ids: List[PydanticObjectId] = None,
+    ):
+        """Broadcasts the fresh summary of every building bound to these stations or reporters."""
+        station_ids = set(station_ids or [])
+        user_ids = set(user_ids or [])
+        if not station_ids and not user_ids:
+            return
+
+        buildings = await self._dashboard.get_buildings_by_members(station_ids, user_ids)
+        if not buildings:
+            return
+
+        summaries = await self._process_buildings_summary(buildings, self.SUMMARY_AVERAGE_MINUTES)
+        for summary in summaries:
+            await self.broadcast_public(
+                self.SUMMARY_UPDATED_EVENT,
+                summary.model_dump(mode="json", by_alias=True),
+                coalesce_key = (self.SUMMARY_UPDATED_EVENT, summary.id),
+            )
 
 
     async def get_buildings_with_summary(self) -> List[BuildingWithSummaryResponse]:
         buildings = await self._dashboard.get_buildings()
-        minutes = 25
+        summaries = await self._process_buildings_summary(buildings, self.SUMMARY_AVERAGE_MINUTES)
 
-        async def process_building(building: Building) -> BuildingWithSummaryResponse:
-            res = await self._process_building_summary(building, minutes)
-
-            return BuildingWithSummaryResponse(
+        return [
+            BuildingWithSummaryResponse(
                 **res.model_dump(),
                 name  = building.name,
                 color = building.color,
             )
-
-        return [await process_building(b) for b in buildings]
-
-
-    async def _compute_total_generator_time(
-        self,
-        station_id: str,
-        start_date: datetime,
-        end_date: datetime,
-    ) -> int:
-        data = await self._stations_data.get_full_station_data_range(
-            station_id,
-            start_date,
-            end_date,
-        )
-        if data and len(data) > 1:
-            total_seconds = 0
-            for i in range(1, len(data)):
-                prev = data[i - 1]
-                curr = data[i]
-
-                if (prev.charge_power or 0) * -1 > 200 and (prev.generation_power or 0) > 0 and (prev.wire_power or 0) == 0:
-                    delta = (curr.last_update_time - prev.last_update_time).total_seconds()
-                    total_seconds += delta
-
-            return total_seconds
-        return 0
+            for building, res in zip(buildings, summaries)
+        ]
 
 
     async def get_power_logs(
@@ -281,111 +307,27 @@ class DashboardService(BaseService):
         if not building.report_users or len(building.report_users) == 0:
             return None
 
-        all_records_by_user = await asyncio.gather(
-            *(self._ext_data.get_ext_data_statistics(report_user.id, start_date, end_date)
-              for report_user in building.report_users)
+        timeline = await self._power_timeline.get_timeline(building)
+        availability, total_generator_seconds = await asyncio.gather(
+            self._power_timeline.get_availability_periods(timeline, start_date, end_date),
+            self._power_timeline.get_generator_seconds(timeline, start_date, end_date),
         )
 
-        last_before_by_user = await asyncio.gather(
-            *(self._ext_data.get_last_ext_data_before_date(report_user.id, start_date)
-              for report_user in building.report_users)
-        )
-
-        total_generator_seconds = await self._compute_total_generator_time(
-            building.station.id,
-            start_date,
-            end_date
-        ) if building.station else 0
-
-        all_events = []
-
-        for user_idx, records in enumerate(all_records_by_user):
-            if records:
-                for record in records:
-                    all_events.append({
-                        'timestamp': record.received_at.replace(tzinfo=timezone.utc) if record.received_at.tzinfo is None else record.received_at,
-                        'user_idx': user_idx,
-                        'grid_state': record.grid_state
-                    })
-
-        if not all_events:
-            initial_state = any(last and last.grid_state for last in last_before_by_user if last)
-            duration_seconds = (end_date - start_date).total_seconds()
-
-            return PowerLogsResponse(
-                periods = [PeriodResponse(
-                    start_time       = start_date.isoformat(),
-                    end_time         = end_date.isoformat(),
-                    is_available     = initial_state,
-                    duration_seconds = int(duration_seconds)
-                )],
-                total_available_seconds   = int(duration_seconds) if initial_state else 0,
-                total_unavailable_seconds = int(duration_seconds) if not initial_state else 0,
-                total_generator_seconds   = int(total_generator_seconds),
-                total_seconds             = int(duration_seconds)
-            )
-
-        all_events.sort(key=lambda e: e['timestamp'])
-
-        reporter_states = [
-            (last.grid_state if last else False) 
-            for last in last_before_by_user
-        ]
-
-        if all_events[0]['timestamp'] > start_date:
-            initial_aggregate_state = any(reporter_states)
-            all_events.insert(0, {
-                'timestamp': start_date,
-                'user_idx': -1, 
-                'grid_state': initial_aggregate_state,
-                'is_synthetic': True
-            })
-
         periods = []
         total_available_seconds = 0
         total_unavailable_seconds = 0
 
-        current_time = start_date
-        current_aggregate_state = any(reporter_states)  # OR logic (pessimistic strategy)
-
-        for event in all_events:
-            event_time = event['timestamp']
-
-            if event['user_idx'] >= 0:
-                reporter_states[event['user_idx']] = event['grid_state']
-
-            new_aggregate_state = any(reporter_states)
-
-            if new_aggregate_state != current_aggregate_state or event_time == start_date:
-                if event_time > current_time:
-                    duration_seconds = (event_time - current_time).total_seconds()
-
-                    periods.append(PeriodResponse(
-                        start_time       = current_time.isoformat(),
-                        end_time         = event_time.isoformat(),
-                        is_available     = current_aggregate_state,
-                        duration_seconds = int(duration_seconds)
-                    ))
-
-                    if current_aggregate_state:
-                        total_available_seconds += duration_seconds
-                    else:
-                        total_unavailable_seconds += duration_seconds
-
-                current_time = event_time
-                current_aggregate_state = new_aggregate_state
-
-        if current_time < end_date:
-            duration_seconds = (end_date - current_time).total_seconds()
+        for period_start, period_end, is_available in availability:
+            duration_seconds = (period_end - period_start).total_seconds()
 
             periods.append(PeriodResponse(
-                start_time       = current_time.isoformat(),
-                end_time         = end_date.isoformat(),
-                is_available     = current_aggregate_state,
+                start_time       = period_start.isoformat(),
+                end_time         = period_end.isoformat(),
+                is_available     = is_available,
                 duration_seconds = int(duration_seconds)
             ))
 
-            if current_aggregate_state:
+            if is_available:
                 total_available_seconds += duration_seconds
             else:
                 total_unavailable_seconds += duration_seconds
@@ -12,6 +12,9 @@ class DeyeConfig:
     email: str
     password: str
     sync_stations_on_poll: bool
+    rate_limit: float
+    max_concurrency: int
+    request_timeout: int
 
     def __init__(self, settings: Settings):
         self.base_url = settings.DEYE_BASE_URL
@@ -20,10 +23,14 @@ class DeyeConfig:
         self.email = settings.DEYE_EMAIL
         self.password = settings.DEYE_PASSWORD
         self.sync_stations_on_poll = settings.DEYE_SYNC_STATIONS_ON_POLL
+        self.rate_limit = settings.DEYE_RATE_LIMIT
+        self.max_concurrency = settings.DEYE_MAX_CONCURRENCY
+        self.request_timeout = settings.DEYE_REQUEST_TIMEOUT
 
     def __str__(self):
         return (
             f"DeyeConfig(base_url='{self.base_url}', app_id='{self.app_id}', "
             f"app_secret='***', email='{self.email}', password='***', "
-            f"sync_stations_on_poll={self.sync_stations_on_poll})"
+            f"sync_stations_on_poll={self.sync_stations_on_poll}, rate_limit={self.rate_limit}, "
+            f"max_concurrency={self.max_concurrency}, request_timeout={self.request_timeout})"
         )
@@ -1,8 +1,9 @@
 import logging
+from typing import Dict, List
 from injector import inject
 from aiohttp import ClientSession
 
-from shared.services.deye_api import BaseDeyeClient, DeyeCredentials
+from shared.services.deye_api import BaseDeyeClient, DeyeCredentials, TokenBucket
 from app.models.deye import DeyeStationList, DeyeStationData
 from .models import DeyeConfig
 
@@ -20,7 +21,9 @@ class DeyeApiService:
             email      = config.email,
             password   = config.password,
         )
-        self._client = BaseDeyeClient(creds, session)
+        self._client = BaseDeyeClient(creds, session, TokenBucket(config.rate_limit))
+        self._max_concurrency = config.max_concurrency
+        self._request_timeout = config.request_timeout
 
     async def init(self):
         await self._client.init()
@@ -32,11 +35,19 @@ class DeyeApiService:
         await self._client.refresh_token()
 
     async def get_station_list(self) -> DeyeStationList | None:
-        data = await self._client.get_station_list()
-        if data is None or not data.get("success", False):
-            logger.error(f"API error: {data.get('msg') if data else 'No data'}")
-            return None
-        return DeyeStationList.model_validate(data)
+        result = None
+        async for data in self._client.iter_station_pages():
+            if data is None or not data.get("success", False):
+                # a partial list would look like the rest of the fleet is gone
+                logger.error(f"API error: {data.get('msg') if data else 'No data'}")
+                return None
+
+            page = DeyeStationList.model_validate(data)
+            if result is None:
+                result = page
+            else:
+                result.station_list.extend(page.station_list)
+        return result
 
     async def get_station_data(self, station_id: int) -> DeyeStationData | None:
         data = await self._client.get_station_data(station_id)
@@ -44,3 +55,21 @@ class DeyeApiService:
             logger.error(f"API error: {data.get('msg') if data else 'No data'}")
             return None
         return DeyeStationData.model_validate(data)
+
+    def _parse_station_data(self, station_id: int, data: dict | None) -> DeyeStationData | None:
+        if data is None or not data.get("success", False):
+            logger.error(f"API error for station {station_id}: {data.get('msg') if data else 'No data'}")
+            return None
+        return DeyeStationData.model_validate(data)
+
+    async def get_stations_data(self, station_ids: List[int]) -> Dict[int, DeyeStationData]:
+        result = {}
+        async for station_id, data in self._client.iter_stations_data(
+            station_ids,
+            concurrency = self._max_concurrency,
+            timeout     = self._request_timeout,
+        ):
+            station_data = self._parse_station_data(station_id, data)
+            if station_data is not None:
+                result[station_id] = station_data
+        return result
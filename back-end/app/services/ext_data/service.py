@@ -5,6 +5,8 @@ from injector import inject
 from shared.models.ext_data import ExtData
 from shared.models.user import User
 from ..base import BaseService
+from ..dashboard import DashboardService
+from ..power_timeline import PowerTimelineService
 from app.models.api import ExtDataItemResponse, ExtDataListRequest, ExtDataListResponse
 from shared.services.events.service import EventsService
 from app.repositories import DataQuery, IExtDataRepository, IUsersRepository
@@ -17,10 +19,14 @@ class ExtDataService(BaseService):
         events: EventsService,
         ext_data: IExtDataRepository,
         users: IUsersRepository,
+        power_timeline: PowerTimelineService,
+        dashboard: DashboardService,
     ):
         super().__init__(events)
         self._ext_data = ext_data
         self._users = users
+        self._power_timeline = power_timeline
+        self._dashboard = dashboard
 
 
     def _process_ext_data(self, ext_data: ExtData):
@@ -34,7 +40,9 @@ class ExtDataService(BaseService):
 
     async def _add_ext_data(self, user: User, grid_state: bool, date: datetime) -> PydanticObjectId:
         id = await self._ext_data.add_ext_data(user.id, grid_state, date)
+        await self._power_timeline.on_ext_data(user.id, date)
         await self.broadcast_public("ext_data_updated")
+        await self._dashboard.publish_buildings_summary(user_ids=[user.id])
         return id
 
 
@@ -86,7 +94,10 @@ class ExtDataService(BaseService):
 
 
     async def delete_ext_data(self, ext_data_id: PydanticObjectId):
-        if await self._ext_data.delete(ext_data_id):
+        ext_data = await self._ext_data.get_ext_data_by_id(ext_data_id)
+        if ext_data and await self._ext_data.delete(ext_data_id):
+            await self._power_timeline.on_ext_data_removed(ext_data.user_id, ext_data.received_at)
             await self.broadcast_public("ext_data_updated")
+            await self._dashboard.publish_buildings_summary(user_ids=[ext_data.user_id])
             return True
         return False
@@ -5,6 +5,8 @@ from injector import inject
 from shared.models.ext_device import ExtDevice
 
 from ..base import BaseService
+from ..dashboard import DashboardService
+from ..power_timeline import PowerTimelineService
 from app.repositories import IExtDeviceRepository, IUsersRepository, IExtDataRepository
 from shared.services.events.service import EventsService
 from ..interfaces import IExtDeviceService
@@ -21,24 +23,35 @@ class ExtDeviceService(BaseService, IExtDeviceService):
         ext_device: IExtDeviceRepository,
         users: IUsersRepository,
         ext_data: IExtDataRepository,
+        power_timeline: PowerTimelineService,
+        dashboard: DashboardService,
     ):
         super().__init__(events)
+        self._power_timeline = power_timeline
+        self._dashboard = dashboard
         self._ext_device = ext_device
         self._users = users
         self._ext_data = ext_data
 
 
-    async def _update_grid_state(self, user_id, active: bool, now: datetime):
-        last_data = await self._ext_data.get_last_ext_data_by_user_id(user_id)
+    async def _update_grid_state(self, user_id, active: bool, now: datetime, last_data = None) -> bool:
+        """Records a grid state change; the caller publishes the building summaries."""
+        if last_data is None:
+            last_data = await self._ext_data.get_last_ext_data_by_user_id(user_id)
 
         if active:
             if not last_data or last_data.grid_state == False:
                 await self._ext_data.add_ext_data(user_id, grid_state=True, date=now)
+                await self._power_timeline.on_ext_data(user_id, now)
                 await self._events.broadcast_public("ext_data_updated")
+                return True
         else:
             if last_data and last_data.grid_state == True:
                 await self._ext_data.add_ext_data(user_id, grid_state=False, date=now)
+                await self._power_timeline.on_ext_data(user_id, now)
                 await self._events.broadcast_public("ext_data_updated")
+                return True
+        return False
 
 
     async def process_ping_request(
@@ -70,15 +83,19 @@ class ExtDeviceService(BaseService, IExtDeviceService):
             await self._ext_device.update_device(device)
         await self._events.broadcast_private("ext_device_updated")
 
-        await self._update_grid_state(user.id, active=True, now=datetime.now(timezone.utc))
+        if await self._update_grid_state(user.id, active=True, now=datetime.now(timezone.utc)):
+            await self._dashboard.publish_buildings_summary(user_ids=[user.id])
 
 
     async def get_all_devices(self) -> list[ExtDeviceResponse]:
         devices = await self._ext_device.get_all_devices()
-        
+        last_ext_data = await self._ext_data.get_last_ext_data_by_user_ids(
+            [device.user.id for device in devices if device.user]
+        )
+
         result = []
         for device in devices:
-            last_data = await self._ext_data.get_last_ext_data_by_user_id(device.user.id) if device.user else None
+            last_data = last_ext_data.get(device.user.id) if device.user else None
             
             result.append(ExtDeviceResponse(
                 mac_address = device.mac_address,
@@ -111,6 +128,13 @@ class ExtDeviceService(BaseService, IExtDeviceService):
                 user_devices[user_id] = []
             user_devices[user_id].append(device)
 
+        last_ext_data = await self._ext_data.get_last_ext_data_by_user_ids(list(user_devices))
+
+        changed_user_ids = []
         for user_id, devices in user_devices.items():
             active = any((now - d.updated_at).total_seconds() < 120 for d in devices)
-            await self._update_grid_state(user_id, active, now)
+            if await self._update_grid_state(user_id, active, now, last_ext_data.get(user_id)):
+                changed_user_ids.append(user_id)
+
+        # one summary pass for the whole check, not one per changed reporter
+        await self._dashboard.publish_buildings_summary(user_ids=changed_user_ids)
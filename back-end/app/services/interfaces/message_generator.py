@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from shared.models.message import Message
+from app.utils import TemplateDataCache
 
 
 @dataclass
@@ -11,6 +12,8 @@ class MessageItem:
     timeout: int
     should_send: bool
     next_send_time: datetime
+    # should_send or the timeout can change with time alone, not just with data
+    depends_on_time: bool = False
 
 
 class IMessageGeneratorService(ABC):
@@ -21,5 +24,6 @@ class IMessageGeneratorService(ABC):
         message: Message,
         force = False,
         include_data = False,
+        data_cache: TemplateDataCache | None = None,
     ) -> MessageItem | None:
         ...
\ No newline at end of file
@@ -1,6 +1,7 @@
 from injector import inject
 
 from app.repositories import IStationsDataRepository, IExtDataRepository
+from ..power_timeline import PowerTimelineService
 
 
 @inject
@@ -9,11 +10,14 @@ class MaintenanceService:
         self,
         stations_data: IStationsDataRepository,
         ext_data: IExtDataRepository,
+        power_timeline: PowerTimelineService,
     ):
         self._stations_data = stations_data
         self._ext_data = ext_data
+        self._power_timeline = power_timeline
 
     
     async def delete_old_data(self, keep_days: int):
         await self._stations_data.delete_old_data(keep_days)
-        await self._ext_data.delete_old_data(keep_days)
\ No newline at end of file
+        await self._ext_data.delete_old_data(keep_days)
+        await self._power_timeline.delete_old_periods(keep_days)
\ No newline at end of file
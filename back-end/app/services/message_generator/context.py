@@ -1,9 +1,12 @@
 
+import asyncio
+from collections import defaultdict
 from collections.abc import Set
-from typing import Any, Dict
+from typing import Any, Dict, Hashable, List
 
 from injector import Injector
 
+from app.utils import TemplateDataCache
 from .models import TemplateRequest
 
 
@@ -25,11 +28,41 @@ class TemplateRequestResolver:
         self,
         collector: TemplateRequestCollector,
         injector: Injector,
+        data_cache: TemplateDataCache,
     ) -> Dict[TemplateRequest, Any]:
-        results = {}
+        # requests already resolved or in flight for another message are
+        # awaited from the cache; only the rest is queried
+        futures = {}
+        batches: Dict[Hashable, List[TemplateRequest]] = defaultdict(list)
         for request in collector.requests:
-            results[request] = await request.resolve(injector)
-        return results
+            future = data_cache.lookup(request)
+            if future is None:
+                future = data_cache.reserve(request, getattr(request, "station_id", None))
+                key = request.batch_key()
+                batches[(request,) if key is None else key].append(request)
+            futures[request] = future
+
+        await asyncio.gather(*(
+            self._resolve_batch(batch, injector, data_cache, futures)
+            for batch in batches.values()
+        ))
+        return {request: await future for request, future in futures.items()}
+
+    async def _resolve_batch(
+        self,
+        batch: List[TemplateRequest],
+        injector: Injector,
+        data_cache: TemplateDataCache,
+        futures: Dict[TemplateRequest, asyncio.Future],
+    ):
+        try:
+            resolved = await type(batch[0]).resolve_batch(batch, injector)
+        except BaseException as e:
+            for request in batch:
+                data_cache.fail(request, futures[request], e)
+            raise
+        for request in batch:
+            data_cache.fulfill(futures[request], resolved[request])
 
 
 class ResolvedValue:
@@ -87,8 +120,8 @@ class TemplateRequestContext:
         self._collector.add(request)
         return request
 
-    async def resolve_requests(self, injector: Injector):
-        self._resolved = await self._resolver.resolve_requests(self._collector, injector)
+    async def resolve_requests(self, injector: Injector, data_cache: TemplateDataCache):
+        self._resolved = await self._resolver.resolve_requests(self._collector, injector, data_cache)
 
     def get_resolved_value(self, request: TemplateRequest) -> ResolvedValue:
         resolved_request = self._resolved[request]
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Dict, Hashable, List
 
 from injector import Injector, inject
 
@@ -24,6 +24,14 @@ class TemplateRequest(ABC):
     async def resolve(self, injector: Injector) -> Any:
         ...
 
+    def batch_key(self) -> Hashable | None:
+        """Requests sharing a key are resolved together by one `resolve_batch` call."""
+        return None
+
+    @classmethod
+    async def resolve_batch(cls, requests: List["TemplateRequest"], injector: Injector) -> Dict["TemplateRequest", Any]:
+        return {request: await request.resolve(injector) for request in requests}
+
 
 @dataclass(frozen=True)
 class NumericTemplateRequest(TemplateRequest):
@@ -2,7 +2,9 @@ from .assumed_state_request import AssumedStateRequest
 from .average_request import AverageRequest
 from .average_minutes_request import AverageMinutesRequest
 from .estimate_discharge_time_request import EstimateDischargeTimeRequest
+from .station_average_request import StationAverageRequest
 
 __all__ = [
     AssumedStateRequest, AverageRequest, AverageMinutesRequest, EstimateDischargeTimeRequest,
+    StationAverageRequest,
 ]
\ No newline at end of file
@@ -1,23 +1,12 @@
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from dataclasses import dataclass
-from injector import Injector
 
-from ..models import NumericTemplateRequest
-from app.repositories import IStationsDataRepository
+from .station_average_request import StationAverageRequest
 
 
 @dataclass(frozen=True)
-class AverageMinutesRequest(NumericTemplateRequest):
-    station_id: int
-    column: str
+class AverageMinutesRequest(StationAverageRequest):
     minutes: int
 
-    async def resolve(self, injector: Injector) -> float:
-        stations_data = injector.get(IStationsDataRepository)
-        now = datetime.now(timezone.utc)
-        return await stations_data.get_station_data_average_column(
-            start_date  = now - timedelta(minutes=self.minutes),
-            end_date    = now,
-            station_id  = self.station_id,
-            column_name = self.column,
-        )
\ No newline at end of file
+    def window_start(self, now: datetime) -> datetime | None:
+        return now - timedelta(minutes=self.minutes)
\ No newline at end of file
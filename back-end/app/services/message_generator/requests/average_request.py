@@ -1,24 +1,16 @@
 from datetime import datetime, timezone
 from dataclasses import dataclass
-from injector import Injector
 
-from ..models import NumericTemplateRequest
-from app.repositories import IStationsDataRepository
+from .station_average_request import StationAverageRequest
 
 
 @dataclass(frozen=True)
-class AverageRequest(NumericTemplateRequest):
-    station_id: int
-    column: str
+class AverageRequest(StationAverageRequest):
     start_date: datetime
 
-    async def resolve(self, injector: Injector) -> float:
-        stations_data = injector.get(IStationsDataRepository)
-        now = datetime.now(timezone.utc)
-        return await stations_data.get_station_data_average_column(
-            start_date  = self.start_date,
-            end_date    = now,
-            station_id  = self.station_id,
-            column_name = self.column,
-        )
+    def window_start(self, now: datetime) -> datetime | None:
+        if self.start_date is None or self.start_date.tzinfo is not None:
+            return self.start_date
+        # last_sent_time comes back from Mongo as naive UTC
+        return self.start_date.replace(tzinfo=timezone.utc)
 
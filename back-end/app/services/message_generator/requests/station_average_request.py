@@ -0,0 +1,40 @@
+from abc import abstractmethod
+from datetime import datetime, timezone
+from dataclasses import dataclass
+from typing import Dict, Hashable, List
+from injector import Injector
+
+from ..models import NumericTemplateRequest
+from app.repositories import IStationsDataRepository
+
+
+@dataclass(frozen=True)
+class StationAverageRequest(NumericTemplateRequest):
+    station_id: int
+    column: str
+
+    @abstractmethod
+    def window_start(self, now: datetime) -> datetime | None:
+        ...
+
+    def batch_key(self) -> Hashable:
+        return (StationAverageRequest, self.station_id)
+
+    async def resolve(self, injector: Injector) -> float:
+        return (await self.resolve_batch([self], injector))[self]
+
+    @classmethod
+    async def resolve_batch(
+        cls,
+        requests: List["StationAverageRequest"],
+        injector: Injector,
+    ) -> Dict["StationAverageRequest", float]:
+        stations_data = injector.get(IStationsDataRepository)
+        now = datetime.now(timezone.utc)
+        windows = {request: (request.column, request.window_start(now)) for request in requests}
+        averages = await stations_data.get_station_data_averages(
+            station_id = requests[0].station_id,
+            end_date   = now,
+            windows    = windows.values(),
+        )
+        return {request: averages[window] for request, window in windows.items()}
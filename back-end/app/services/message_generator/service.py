@@ -8,7 +8,7 @@ from shared.models import Message
 from shared.models.station import Station
 from .models import MessageGeneratorConfig
 from .context import TemplateRequestContext
-from app.utils import generate_message, get_send_timeout, get_should_send
+from app.utils import TemplateDataCache, depends_on_time, generate_message, get_send_timeout, get_should_send
 from app.repositories import IMessagesRepository, IStationsDataRepository
 from ..interfaces import IMessageGeneratorService, MessageItem
 from .requests import (
@@ -43,13 +43,17 @@ class MessageGeneratorService(IMessageGeneratorService):
         self._stations_data = stations_data
         self._injector = injector
 
-    async def _populate_stations_data(self, template_data, stations: List[Station], force):
+    async def _populate_stations_data(self, template_data, stations: List[Station], force, data_cache: TemplateDataCache):
         message_station = None
         for station in stations:
             if not station.enabled and not force:
                 continue
 
-            data = await self._stations_data.get_station_data_tuple(station.station_id)
+            data = await data_cache.get_or_load(
+                ('station_data', station.id),
+                lambda: self._stations_data.get_station_data_tuple(station.station_id),
+                station.id,
+            )
 
             station_data = {
                 **(data.to_dict(self._message_timezone) if data is not None else {}),
@@ -114,7 +118,15 @@ class MessageGeneratorService(IMessageGeneratorService):
             ).bind(context, mode)
 
 
-    async def generate_message(self, message: Message, force = False, include_data = False) -> MessageItem | None:
+    async def generate_message(
+            self,
+            message: Message,
+            force = False,
+            include_data = False,
+            data_cache: TemplateDataCache | None = None) -> MessageItem | None:
+        if data_cache is None:
+            data_cache = TemplateDataCache()
+
         template_data = {
             'stations': [],
             'now': datetime.now(self._message_timezone),
@@ -128,7 +140,7 @@ class MessageGeneratorService(IMessageGeneratorService):
             logger.info(f"All stations for message '{message.name}' are disabled")
             return None
 
-        message_station = await self._populate_stations_data(template_data, stations, force)
+        message_station = await self._populate_stations_data(template_data, stations, force, data_cache)
         if len(stations) == 1 and message_station is None:
             logger.info(f"The station for message '{message.name}' is disabled")
             return None
@@ -144,7 +156,7 @@ class MessageGeneratorService(IMessageGeneratorService):
         ).replace(tzinfo=timezone.utc)
 
         _ = await generate_message(message.message_template, template_data)
-        await context.resolve_requests(self._injector)
+        await context.resolve_requests(self._injector, data_cache)
         self._add_methods(template_data, message.last_sent_time, TemplateMethodMode.Resolve, context)
         message_content = await generate_message(message.message_template, template_data)
 
@@ -153,4 +165,5 @@ class MessageGeneratorService(IMessageGeneratorService):
             should_send = should_send,
             timeout = timeout,
             next_send_time = next_send_time,
+            depends_on_time = depends_on_time(message.should_send_template, message.timeout_template),
         )
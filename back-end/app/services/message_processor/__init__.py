@@ -1,4 +1,5 @@
+from .models import MessageProcessorConfig
 from .service import MessageProcessorService
 
 
-__all__ = [MessageProcessorService]
\ No newline at end of file
+__all__ = [MessageProcessorConfig, MessageProcessorService]
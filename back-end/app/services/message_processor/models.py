@@ -0,0 +1,24 @@
+from injector import inject
+
+from app.settings import Settings
+
+
+@inject
+class MessageProcessorConfig:
+    max_concurrency: int
+    bot_concurrency: int
+    recheck_seconds: int
+    data_cache_ttl: int
+
+    def __init__(self, settings: Settings):
+        self.max_concurrency = settings.MESSAGES_MAX_CONCURRENCY
+        self.bot_concurrency = settings.MESSAGES_BOT_CONCURRENCY
+        self.recheck_seconds = settings.MESSAGES_RECHECK_SECONDS
+        self.data_cache_ttl = settings.MESSAGES_DATA_CACHE_TTL
+
+    def __str__(self):
+        return (
+            f"MessageProcessorConfig(max_concurrency={self.max_concurrency}, "
+            f"bot_concurrency={self.bot_concurrency}, recheck_seconds={self.recheck_seconds}, "
+            f"data_cache_ttl={self.data_cache_ttl})"
+        )
@@ -0,0 +1,101 @@
+import asyncio
+import heapq
+import itertools
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Set, Tuple
+
+from beanie import PydanticObjectId
+
+
+class MessageScheduler:
+    """Min-heap of messages ordered by the time they next need evaluating.
+
+    Rescheduling a message pushes a new heap entry and leaves the old one in
+    place; `_due` holds the live time per message and stale entries are
+    dropped when they surface at the top.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, int, PydanticObjectId]] = []
+        self._due: Dict[PydanticObjectId, datetime] = {}
+        self._counter = itertools.count()
+        self._changed = asyncio.Event()
+        self._station_messages: Dict[PydanticObjectId, Set[PydanticObjectId]] = defaultdict(set)
+        self._message_stations: Dict[PydanticObjectId, Set[PydanticObjectId]] = {}
+
+    def __len__(self):
+        return len(self._due)
+
+    def is_scheduled(self, message_id: PydanticObjectId) -> bool:
+        return message_id in self._due
+
+    def track(self, message_id: PydanticObjectId, station_ids: Iterable[PydanticObjectId]):
+        """Remembers which stations a message reads, for `messages_for`."""
+        self._untrack(message_id)
+        station_ids = set(station_ids)
+        self._message_stations[message_id] = station_ids
+        for station_id in station_ids:
+            self._station_messages[station_id].add(message_id)
+
+    def forget(self, message_id: PydanticObjectId):
+        self._untrack(message_id)
+        self._due.pop(message_id, None)
+
+    def tracked(self) -> Set[PydanticObjectId]:
+        return set(self._message_stations)
+
+    def messages_for(self, station_ids: Iterable[PydanticObjectId]) -> Set[PydanticObjectId]:
+        return {
+            message_id
+            for station_id in station_ids
+            for message_id in self._station_messages.get(station_id, ())
+        }
+
+    def schedule(self, message_id: PydanticObjectId, at: datetime):
+        """Schedules the message at `at`, unless it is already due earlier."""
+        current = self._due.get(message_id)
+        if current is not None and current <= at:
+            return
+
+        self._due[message_id] = at
+        heapq.heappush(self._heap, (at, next(self._counter), message_id))
+        if self._heap[0][2] == message_id:
+            self._changed.set()
+
+    def pop_due(self, now: datetime) -> List[PydanticObjectId]:
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            at, _, message_id = heapq.heappop(self._heap)
+            if self._due.get(message_id) == at:
+                del self._due[message_id]
+                due.append(message_id)
+        return due
+
+    async def wait_due(self) -> List[PydanticObjectId]:
+        """Sleeps until the earliest message is due and returns every due one."""
+        while True:
+            now = datetime.now(timezone.utc)
+            due = self.pop_due(now)
+            if due:
+                return due
+
+            self._discard_stale()
+            self._changed.clear()
+            timeout = (self._heap[0][0] - now).total_seconds() if self._heap else None
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _discard_stale(self):
+        while self._heap and self._due.get(self._heap[0][2]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def _untrack(self, message_id: PydanticObjectId):
+        for station_id in self._message_stations.pop(message_id, ()):
+            messages = self._station_messages.get(station_id)
+            if messages is not None:
+                messages.discard(message_id)
+                if not messages:
+                    del self._station_messages[station_id]
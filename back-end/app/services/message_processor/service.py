@@ -1,22 +1,32 @@
+import asyncio
 import logging
-from datetime import datetime, timezone
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List
 from beanie import PydanticObjectId
 from injector import inject
 
 from app.repositories import IBotsRepository, IChatsRepository, IMessagesRepository
+from app.utils import TemplateDataCache
 from ..interfaces import IMessageGeneratorService
 from ..telegram import TelegramService
 from shared.services.events.service import EventsService
 from ..base import BaseService
+from .models import MessageProcessorConfig
+from .scheduler import MessageScheduler
 
 
 logger = logging.getLogger(__name__)
 
+BATCH_RETRY_DELAY = timedelta(seconds=5)
+
 
 @inject
 class MessageProcessorService(BaseService):
     def __init__(
         self,
+        config: MessageProcessorConfig,
         events: EventsService,
         message_generator: IMessageGeneratorService,
         telegram: TelegramService,
@@ -30,29 +40,205 @@ class MessageProcessorService(BaseService):
         self._bots = bots
         self._chats = chats
         self._messages = messages
+        self._max_concurrency = max(config.max_concurrency, 1)
+        self._bot_concurrency = max(config.bot_concurrency, 1)
+        # shared by every batch, as batches run concurrently
+        self._pool = asyncio.Semaphore(self._max_concurrency)
+        self._bot_limits = defaultdict(lambda: asyncio.Semaphore(self._bot_concurrency))
+        self._recheck_interval = timedelta(seconds=config.recheck_seconds)
+        self._scheduler = MessageScheduler()
+        self._scheduler_task = None
+        self._batch_tasks = set()
+        # due again while a batch still holds them; rescheduled once it finishes
+        self._in_flight = set()
+        self._deferred = set()
+        # with a TTL the data outlives one batch; otherwise each batch gets its own
+        self._data_cache = TemplateDataCache(config.data_cache_ttl) if config.data_cache_ttl > 0 else None
+        self.batches = 0
+        self.messages_processed = 0
+        self.messages_sent = 0
+        self.batch_seconds = 0.0
+        self.last_batch_seconds = 0.0
+        self.max_batch_seconds = 0.0
 
     
-    async def _send_message(self, message, message_content):
+    async def _send_message(self, message, message_content) -> bool:
         try:
             await self._telegram.send_message(message.bot.id, message.channel_id, message_content)
             await self._messages.set_last_sent(message.id)
             message.last_sent_time = datetime.now(timezone.utc)
+            self.messages_sent += 1
+            return True
         except Exception as e:
             logger.error(f"Error sending message: {e}")
+            return False
 
 
-    async def periodic_send(self):
-        messages = await self._messages.get_messages()
+    async def _process_message(self, message, data_cache: TemplateDataCache) -> datetime | None:
+        """Sends the message if it is due and returns when to evaluate it next.
 
-        for message in messages:
+        None leaves it to station data changes and API edits to wake it up.
+        """
+        async with self._pool:
+            now = datetime.now(timezone.utc)
+            recheck_at = now + self._recheck_interval
             try:
-                info = await self._message_generator.generate_message(message)
+                info = await self._message_generator.generate_message(message, data_cache=data_cache)
                 if info is None:
-                    continue
-                if info.should_send and info.next_send_time <= datetime.now(timezone.utc):
-                    await self._send_message(message, info.message)
+                    # all stations disabled; cheap to check, as nothing is rendered
+                    return recheck_at
+                if not info.should_send:
+                    # only templates that read the clock can flip without new data
+                    return recheck_at if info.depends_on_time else None
+                if info.next_send_time > now:
+                    return min(info.next_send_time, recheck_at) if info.depends_on_time else info.next_send_time
+
+                # Telegram rate-limits per bot token, so sends to one bot are
+                # capped separately from the overall pool
+                async with self._bot_limits[message.bot.id]:
+                    sent = await self._send_message(message, info.message)
+                if not sent:
+                    return recheck_at
+                return datetime.now(timezone.utc) + timedelta(seconds=info.timeout)
             except Exception as e:
                 logger.error(f"Error sending message '{message.name}': {e}")
+                return recheck_at
+
+
+    async def _process_due(self, message_ids: List[PydanticObjectId]):
+        started = time.monotonic()
+        messages = await self._messages.get_messages_by_ids(message_ids)
+
+        for message_id in set(message_ids) - {message.id for message in messages}:
+            # deleted or disabled since it was scheduled
+            self._scheduler.forget(message_id)
+
+        if self._data_cache is not None:
+            self._data_cache.purge()
+            data_cache = self._data_cache
+        else:
+            data_cache = TemplateDataCache()
+        next_times = await asyncio.gather(*(
+            self._process_message(message, data_cache)
+            for message in messages
+        ))
+
+        for message, next_time in zip(messages, next_times):
+            self._scheduler.track(message.id, [station.id for station in message.stations])
+            if next_time is not None:
+                self._scheduler.schedule(message.id, next_time)
+
+        elapsed = time.monotonic() - started
+        self.batches += 1
+        self.messages_processed += len(messages)
+        self.batch_seconds += elapsed
+        self.last_batch_seconds = elapsed
+        self.max_batch_seconds = max(self.max_batch_seconds, elapsed)
+        logger.info(f"Processed {len(messages)} due messages in {elapsed:.2f}s")
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "messages_processed": self.messages_processed,
+            "messages_sent": self.messages_sent,
+            "batch_seconds": round(self.batch_seconds, 4),
+            "last_batch_seconds": round(self.last_batch_seconds, 4),
+            "max_batch_seconds": round(self.max_batch_seconds, 4),
+            "scheduled": len(self._scheduler),
+        }
+
+
+    async def _run_batch(self, message_ids: List[PydanticObjectId]):
+        try:
+            await self._process_due(message_ids)
+        except Exception as e:
+            logger.error(f"Error processing due messages: {e}")
+            # pop_due already dropped them, so they would never run again
+            retry_at = datetime.now(timezone.utc) + BATCH_RETRY_DELAY
+            for message_id in message_ids:
+                self._scheduler.schedule(message_id, retry_at)
+        finally:
+            self._in_flight.difference_update(message_ids)
+            now = datetime.now(timezone.utc)
+            for message_id in self._deferred.intersection(message_ids):
+                self._deferred.discard(message_id)
+                self._scheduler.schedule(message_id, now)
+
+
+    async def _run_scheduler(self):
+        while True:
+            try:
+                due = await self._scheduler.wait_due()
+                # a message is only ever in one batch, so it cannot be sent twice
+                self._deferred.update(message_id for message_id in due if message_id in self._in_flight)
+                due = [message_id for message_id in due if message_id not in self._in_flight]
+                if not due:
+                    continue
+
+                # batches run alongside the loop, so a slow one does not hold
+                # back messages that fall due meanwhile
+                self._in_flight.update(due)
+                task = asyncio.create_task(self._run_batch(due))
+                self._batch_tasks.add(task)
+                task.add_done_callback(self._batch_tasks.discard)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Message scheduler error: {e}")
+                await asyncio.sleep(1)
+
+
+    async def start(self):
+        if self._scheduler_task is None:
+            self._scheduler_task = asyncio.create_task(self._run_scheduler())
+
+
+    async def shutdown(self):
+        if self._scheduler_task is not None:
+            self._scheduler_task.cancel()
+            try:
+                await self._scheduler_task
+            except asyncio.CancelledError:
+                pass
+            self._scheduler_task = None
+
+        for task in list(self._batch_tasks):
+            task.cancel()
+        await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        self._batch_tasks.clear()
+
+
+    async def sync_schedule(self):
+        """Picks up enabled messages the scheduler does not know about yet and drops the rest."""
+        messages = await self._messages.get_messages()
+        now = datetime.now(timezone.utc)
+
+        enabled = {message.id for message in messages}
+        tracked = self._scheduler.tracked()
+        for message_id in tracked - enabled:
+            self._scheduler.forget(message_id)
+
+        for message in messages:
+            # tracked but unscheduled messages are waiting for data on purpose
+            is_new = message.id not in tracked
+            self._scheduler.track(message.id, [station.id for station in message.stations])
+            if is_new:
+                self._scheduler.schedule(message.id, now)
+
+
+    def reschedule(self, message_id: PydanticObjectId):
+        """Evaluates the message right away, e.g. after it was edited or toggled."""
+        self._scheduler.schedule(message_id, datetime.now(timezone.utc))
+
+
+    def on_stations_updated(self, station_ids: Iterable[PydanticObjectId]):
+        station_ids = set(station_ids)
+        if self._data_cache is not None:
+            self._data_cache.discard_stations(station_ids)
+
+        now = datetime.now(timezone.utc)
+        for message_id in self._scheduler.messages_for(station_ids):
+            self._scheduler.schedule(message_id, now)
 
 
     async def handle_incoming_message(self, bot_id: PydanticObjectId, message):
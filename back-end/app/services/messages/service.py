@@ -18,9 +18,11 @@ from app.models.api import (
 from app.repositories import IMessagesRepository, IStationsRepository
 from shared.models.message import Message
 from shared.services.events.service import EventsService
+from app.utils import template_cache
 from ..telegram import TelegramService
 from ..base import BaseService
 from ..interfaces import IMessageGeneratorService
+from ..message_processor import MessageProcessorService
 
 
 logger = logging.getLogger(__name__)
@@ -35,12 +37,14 @@ class MessagesService(BaseService):
         stations: IStationsRepository,
         message_generator: IMessageGeneratorService,
         telegram: TelegramService,
+        message_processor: MessageProcessorService,
     ):
         super().__init__(events)
         self._messages = messages
         self._stations = stations
         self._telegram = telegram
         self._message_generator = message_generator
+        self._message_processor = message_processor
 
 
     async def _get_bot_name(self, bot_id: str):
@@ -111,17 +115,27 @@ class MessagesService(BaseService):
 
     async def save_state(self, message_id: PydanticObjectId, state: bool):
         await self._messages.save_state(message_id, state)
+        self._message_processor.reschedule(message_id)
         self.broadcast_private("messages_updated")
 
 
     async def create_message(self, dto: MessageCreateRequest):
         message = await self._messages.create(dto.model_dump())
+        self._message_processor.reschedule(message.id)
         self.broadcast_private("messages_updated")
         return message.id
 
 
     async def update_message(self, id: PydanticObjectId, dto: MessageUpdateRequest):
+        previous = await self._messages.get_message(id)
         message = await self._messages.update(id, dto.model_dump())
+        if previous is not None:
+            template_cache.invalidate(
+                previous.message_template,
+                previous.timeout_template,
+                previous.should_send_template,
+            )
+        self._message_processor.reschedule(id)
         self.broadcast_private("messages_updated")
         return message.id
     
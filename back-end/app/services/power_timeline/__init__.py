@@ -0,0 +1,4 @@
+from .service import PowerTimelineService
+
+
+__all__ = [PowerTimelineService]
@@ -0,0 +1,306 @@
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List
+from beanie import PydanticObjectId
+from injector import inject
+import numpy as np
+
+from shared.models import Building, StationData
+from shared.models.power_timeline import PowerPeriod, PowerPeriodKind, PowerTimeline
+from app.repositories import IExtDataRepository, IPowerTimelineRepository, IStationsDataRepository
+from app.utils import StationSeries, is_generator_running
+
+
+logger = logging.getLogger(__name__)
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+@inject
+class PowerTimelineService:
+    """Maintains per-building availability and generator periods as data arrives."""
+
+    def __init__(
+        self,
+        timelines: IPowerTimelineRepository,
+        ext_data: IExtDataRepository,
+        stations_data: IStationsDataRepository,
+    ):
+        self._timelines = timelines
+        self._ext_data = ext_data
+        self._stations_data = stations_data
+        # these only serialize updates within one process; the back-end runs
+        # as a single replica (its APScheduler jobs assume that too), and a
+        # second one would need a shared lock, e.g. in Redis
+        self._locks: Dict[PydanticObjectId, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+    async def get_timeline(self, building: Building) -> PowerTimeline:
+        async with self._locks[building.id]:
+            timeline = await self._timelines.get_timeline(building.id)
+            if timeline is None:
+                timeline = await self._rebuild(building)
+            return timeline
+
+
+    async def rebuild(self, building: Building) -> PowerTimeline:
+        async with self._locks[building.id]:
+            return await self._rebuild(building)
+
+
+    async def remove(self, building_id: PydanticObjectId):
+        async with self._locks[building_id]:
+            await self._timelines.delete_timeline(building_id)
+
+
+    async def _rebuild(self, building: Building) -> PowerTimeline:
+        timeline = await self._timelines.get_timeline(building.id) or PowerTimeline(building_id=building.id)
+        timeline.report_user_ids = [user.id for user in building.report_users or [] if user]
+        timeline.station_id = building.station.id if building.station else None
+
+        await self._rebuild_availability(timeline)
+        await self._rebuild_generator(timeline)
+        await self._timelines.save_timeline(timeline)
+        return timeline
+
+
+    async def _get_anchor(self, timeline: PowerTimeline, kind: PowerPeriodKind, since: datetime | None) -> PowerPeriod | None:
+        """The first period to close at or before `since`; nothing ending before it depends on a change at `since`."""
+        if since is None:
+            return None
+        return await self._timelines.get_last_period_before(timeline.building_id, kind, since)
+
+
+    async def _rebuild_availability(self, timeline: PowerTimeline, since: datetime | None = None):
+        """Replays ext data from the last closed period before `since`, or the whole history without one."""
+        anchor = await self._get_anchor(timeline, PowerPeriodKind.AVAILABILITY, since)
+        start_time = _as_utc(anchor.start_time) if anchor else None
+        resume_at = _as_utc(anchor.end_time) if anchor else None
+
+        # replaying the change at resume_at re-emits the anchor itself
+        timeline.is_available = anchor.is_available if anchor else None
+        timeline.available_since = start_time
+        timeline.last_ext_data_at = None
+
+        periods = []
+        if timeline.report_user_ids:
+            reporter_states = {user_id: False for user_id in timeline.report_user_ids}
+            if resume_at is not None:
+                previous = await asyncio.gather(*(
+                    self._ext_data.get_last_ext_data_before_date(user_id, resume_at)
+                    for user_id in timeline.report_user_ids
+                ))
+                previous = [record for record in previous if record]
+                for record in previous:
+                    reporter_states[record.user_id] = record.grid_state
+                if previous:
+                    timeline.last_ext_data_at = max(_as_utc(record.received_at) for record in previous)
+
+            records = await self._ext_data.get_ext_data_by_user_ids(timeline.report_user_ids, start_date=resume_at)
+            for record in records:
+                reporter_states[record.user_id] = record.grid_state
+                period = self._apply_availability(timeline, any(reporter_states.values()), _as_utc(record.received_at))
+                if period:
+                    periods.append(period)
+
+        await self._timelines.replace_periods(timeline.building_id, PowerPeriodKind.AVAILABILITY, periods, since=resume_at)
+
+
+    async def _rebuild_generator(self, timeline: PowerTimeline, since: datetime | None = None):
+        """Replays generator samples from the last closed period before `since`, or the whole history without one."""
+        anchor = await self._get_anchor(timeline, PowerPeriodKind.GENERATOR, since)
+        start_time = _as_utc(anchor.start_time) if anchor else None
+        resume_at = _as_utc(anchor.end_time) if anchor else None
+
+        timeline.generator_since = None
+        timeline.last_station_data_at = None
+
+        periods = []
+        samples = await self._stations_data.get_generator_samples(timeline.station_id, start_date=start_time) if timeline.station_id else []
+        if samples:
+            series = StationSeries(
+                np.fromiter((_as_utc(time).timestamp() for time, _ in samples), dtype=np.float64, count=len(samples)),
+                {},
+            )
+            running = np.fromiter((running for _, running in samples), dtype=bool, count=len(samples))
+
+            periods = [
+                PowerPeriod(
+                    building_id = timeline.building_id,
+                    kind        = PowerPeriodKind.GENERATOR,
+                    start_time  = start_time,
+                    end_time    = end_time,
+                )
+                for start_time, end_time in series.mask_periods(running)
+            ]
+            timeline.generator_since = series.mask_open_since(running)
+            timeline.last_station_data_at = _as_utc(samples[-1][0])
+
+        await self._timelines.replace_periods(timeline.building_id, PowerPeriodKind.GENERATOR, periods, since=resume_at)
+
+
+    def _apply_availability(self, timeline: PowerTimeline, is_available: bool, time: datetime) -> PowerPeriod | None:
+        period = None
+        if timeline.is_available is None:
+            timeline.available_since = time
+        elif timeline.is_available != is_available:
+            period = PowerPeriod(
+                building_id  = timeline.building_id,
+                kind         = PowerPeriodKind.AVAILABILITY,
+                start_time   = _as_utc(timeline.available_since),
+                end_time     = time,
+                is_available = timeline.is_available,
+            )
+            timeline.available_since = time
+
+        timeline.is_available = is_available
+        timeline.last_ext_data_at = time
+        return period
+
+
+    def _apply_generator(self, timeline: PowerTimeline, running: bool, time: datetime) -> PowerPeriod | None:
+        # a sample accounts for the time until the next one, like the raw-data walk did
+        period = None
+        if timeline.generator_since is not None and not running:
+            period = PowerPeriod(
+                building_id = timeline.building_id,
+                kind        = PowerPeriodKind.GENERATOR,
+                start_time  = _as_utc(timeline.generator_since),
+                end_time    = time,
+            )
+            timeline.generator_since = None
+        elif timeline.generator_since is None and running:
+            timeline.generator_since = time
+
+        timeline.last_station_data_at = time
+        return period
+
+
+    async def on_ext_data(self, user_id: PydanticObjectId, date: datetime):
+        date = _as_utc(date)
+        timelines = await self._timelines.get_timelines_by_report_user(user_id)
+
+        for timeline in timelines:
+            async with self._locks[timeline.building_id]:
+                last_ext_data_at = _as_utc(timeline.last_ext_data_at)
+                if last_ext_data_at and date < last_ext_data_at:
+                    logger.info(f"Out of order ext data for building {timeline.building_id}, rebuilding from {date}")
+                    await self._rebuild_availability(timeline, since=date)
+                else:
+                    last_ext_data = await self._ext_data.get_last_ext_data_by_user_ids(timeline.report_user_ids)
+                    is_available = any(item.grid_state for item in last_ext_data.values())
+                    period = self._apply_availability(timeline, is_available, date)
+                    if period:
+                        await self._timelines.add_period(period)
+
+                await self._timelines.save_timeline(timeline)
+
+
+    async def on_ext_data_removed(self, user_id: PydanticObjectId, date: datetime):
+        date = _as_utc(date)
+        timelines = await self._timelines.get_timelines_by_report_user(user_id)
+
+        for timeline in timelines:
+            async with self._locks[timeline.building_id]:
+                await self._rebuild_availability(timeline, since=date)
+                await self._timelines.save_timeline(timeline)
+
+
+    async def on_station_data(self, station_id: PydanticObjectId, station_data: StationData):
+        time = _as_utc(station_data.last_update_time)
+        timelines = await self._timelines.get_timelines_by_station(station_id)
+
+        for timeline in timelines:
+            async with self._locks[timeline.building_id]:
+                last_station_data_at = _as_utc(timeline.last_station_data_at)
+                if last_station_data_at and time <= last_station_data_at:
+                    if time == last_station_data_at:
+                        continue
+                    logger.info(f"Out of order station data for building {timeline.building_id}, rebuilding from {time}")
+                    await self._rebuild_generator(timeline, since=time)
+                else:
+                    period = self._apply_generator(timeline, is_generator_running(station_data), time)
+                    if period:
+                        await self._timelines.add_period(period)
+
+                await self._timelines.save_timeline(timeline)
+
+
+    async def get_availability_periods(
+        self,
+        timeline: PowerTimeline,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[tuple[datetime, datetime, bool]]:
+        periods = [
+            (_as_utc(period.start_time), _as_utc(period.end_time), period.is_available)
+            for period in await self._timelines.get_periods(
+                timeline.building_id,
+                PowerPeriodKind.AVAILABILITY,
+                start_date,
+                end_date,
+            )
+        ]
+        if timeline.is_available is not None:
+            periods.append((_as_utc(timeline.available_since), end_date, timeline.is_available))
+
+        # before the first report every reporter counts as unavailable
+        result = []
+        current_time = start_date
+        for period_start, period_end, is_available in periods:
+            period_start = max(period_start, current_time)
+            period_end = min(period_end, end_date)
+            if period_end <= period_start:
+                continue
+            if period_start > current_time:
+                self._append_period(result, current_time, period_start, False)
+            self._append_period(result, period_start, period_end, is_available)
+            current_time = period_end
+
+        if current_time < end_date:
+            self._append_period(result, current_time, end_date, False)
+
+        return result
+
+
+    def _append_period(self, result: list, start: datetime, end: datetime, is_available: bool):
+        if result and result[-1][2] == is_available:
+            result[-1] = (result[-1][0], end, is_available)
+        else:
+            result.append((start, end, is_available))
+
+
+    async def get_generator_seconds(
+        self,
+        timeline: PowerTimeline,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> float:
+        periods = [
+            (_as_utc(period.start_time), _as_utc(period.end_time))
+            for period in await self._timelines.get_periods(
+                timeline.building_id,
+                PowerPeriodKind.GENERATOR,
+                start_date,
+                end_date,
+            )
+        ]
+        if timeline.generator_since is not None:
+            periods.append((_as_utc(timeline.generator_since), _as_utc(timeline.last_station_data_at)))
+
+        total_seconds = 0
+        for period_start, period_end in periods:
+            overlap = (min(period_end, end_date) - max(period_start, start_date)).total_seconds()
+            if overlap > 0:
+                total_seconds += overlap
+        return total_seconds
+
+
+    async def delete_old_periods(self, keep_days: int):
+        await self._timelines.delete_old_periods(keep_days)
@@ -7,19 +7,31 @@ from app.repositories import IStationsRepository, IStationsDataRepository
 from shared.models import Station, StationData
 from shared.services.events.service import EventsService
 from ..base import BaseService
+from ..dashboard import DashboardService
 from ..deye_api import DeyeApiService
+from ..message_processor import MessageProcessorService
+from ..power_timeline import PowerTimelineService
+from app.utils import largest_triangle_three_buckets
 
 
 @inject
 class StationsService(BaseService):
+    LTTB_OVERSAMPLING = 4
+
     def __init__(
         self,
         events: EventsService,
         deye_api: DeyeApiService,
         stations: IStationsRepository,
         stations_data: IStationsDataRepository,
+        power_timeline: PowerTimelineService,
+        dashboard: DashboardService,
+        message_processor: MessageProcessorService,
     ):
         super().__init__(events)
+        self._power_timeline = power_timeline
+        self._dashboard = dashboard
+        self._message_processor = message_processor
         self._deye_api = deye_api
         self._stations = stations
         self._stations_data = stations_data
@@ -60,6 +72,31 @@ class StationsService(BaseService):
 
         return await asyncio.gather(*tasks)
 
+    async def get_stations_data_downsampled(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        records_count: int,
+        method: str = "avg",
+    ) -> List[tuple[Station, List[dict]]]:
+        stations = await self._stations.get_stations()
+        # lttb picks its points from finer server-side buckets
+        buckets = records_count * self.LTTB_OVERSAMPLING if method == "lttb" else records_count
+        data = await self._stations_data.get_downsampled_station_data(
+            [station.id for station in stations],
+            start_date,
+            end_date,
+            buckets,
+        )
+
+        result = []
+        for station in stations:
+            points = data.get(station.id, [])
+            if method == "lttb":
+                points = largest_triangle_three_buckets(points, records_count, "consumption_power")
+            result.append((station, points))
+        return result
+
     async def edit_station(
         self,
         station_id: str,
@@ -83,11 +120,22 @@ class StationsService(BaseService):
 
     async def sync_stations_data(self):
         stations = await self._stations.get_stations()
+        stations_data = await self._deye_api.get_stations_data(
+            [station.station_id for station in stations]
+        )
 
-        for station in stations:
-            station_data = await self._deye_api.get_station_data(station.station_id)
-            if station_data is None:
-                continue
-
-            await self._stations_data.add_station_data(station, station_data)
+        new_records = await self._stations_data.add_station_data_many([
+            (station, stations_data[station.station_id])
+            for station in stations
+            if station.station_id in stations_data
+        ])
+        await asyncio.gather(*(
+            self._power_timeline.on_station_data(record.station_id, record)
+            for record in new_records
+        ))
         await self.broadcast_public("station_data_updated")
+        if new_records:
+            self._message_processor.on_stations_updated(record.station_id for record in new_records)
+            await self._dashboard.publish_buildings_summary(
+                station_ids=[record.station_id for record in new_records],
+            )
@@ -3,11 +3,17 @@ import os
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from shared.settings.base import BaseAppSettings, BaseJWTSettings, BaseMongoSettings, BaseRedisSettings
+from shared.settings.base import (
+    BaseAppSettings,
+    BaseEventsSettings,
+    BaseJWTSettings,
+    BaseMongoSettings,
+    BaseRedisSettings,
+)
 from shared.utils import generate_secret_key
 
 
-class Settings(BaseSettings, BaseAppSettings, BaseJWTSettings, BaseMongoSettings, BaseRedisSettings):
+class Settings(BaseSettings, BaseAppSettings, BaseJWTSettings, BaseMongoSettings, BaseRedisSettings, BaseEventsSettings):
     model_config = SettingsConfigDict(
         env_file="../.env",
         env_file_encoding="utf-8",
@@ -32,6 +38,9 @@ class Settings(BaseSettings, BaseAppSettings, BaseJWTSettings, BaseMongoSettings
 
     DEYE_FETCH_INTERVAL: int = Field(default=120)
     DEYE_SYNC_STATIONS_ON_POLL: bool = Field(default=False)
+    DEYE_RATE_LIMIT: float = Field(default=5.0)
+    DEYE_MAX_CONCURRENCY: int = Field(default=5)
+    DEYE_REQUEST_TIMEOUT: int = Field(default=15)
 
     DEYE_REPORT_INTERVAL: int = Field(default=300)
     DEYE_ASSUMED_OFFLINE_REPORTS: int = Field(default=2)
@@ -42,6 +51,10 @@ class Settings(BaseSettings, BaseAppSettings, BaseJWTSettings, BaseMongoSettings
     TG_HOOK_BASE_URL: str | None = None
 
     BOT_TIMEZONE: str = "utc"
+    MESSAGES_MAX_CONCURRENCY: int = Field(default=16)
+    MESSAGES_BOT_CONCURRENCY: int = Field(default=4)
+    MESSAGES_RECHECK_SECONDS: int = Field(default=60)
+    MESSAGES_DATA_CACHE_TTL: int = Field(default=0)
 
     # -------------------------
     # Auth / Admin
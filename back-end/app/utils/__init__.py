@@ -1,5 +1,9 @@
-from .templating import generate_message, get_send_timeout, get_should_send
-from .power_estimation import get_estimate_discharge_time, get_estimate_charge_time, get_kilowatthour_consumption
+from .templating import depends_on_time, generate_message, get_send_timeout, get_should_send, template_cache
+from .power_estimation import get_estimate_discharge_time, get_estimate_charge_time, get_kilowatthour_consumption, is_generator_running
+from .template_data_cache import TemplateDataCache
+from .station_analytics import StationSeries, largest_triangle_three_buckets, lttb_indices
 
-__all__ = [generate_message, get_kilowatthour_consumption,
-           get_send_timeout, get_should_send, get_estimate_discharge_time, get_estimate_charge_time]
\ No newline at end of file
+__all__ = [depends_on_time, generate_message, get_kilowatthour_consumption,
+           get_send_timeout, get_should_send, get_estimate_discharge_time, get_estimate_charge_time,
+           is_generator_running, StationSeries, largest_triangle_three_buckets, lttb_indices, template_cache,
+           TemplateDataCache]
\ No newline at end of file
@@ -19,4 +19,10 @@ def get_estimate_charge_time(batt_capacity_kwh: float, current_batt_soc: int, ch
 
     hours = int(time_left)
     minutes = int((time_left - hours) * 60)
-    return f"{hours:02d}:{minutes:02d}"
\ No newline at end of file
+    return f"{hours:02d}:{minutes:02d}"
+
+def is_generator_running(station_data) -> bool:
+    charge_power = station_data.charge_power or 0
+    generation_power = station_data.generation_power or 0
+    wire_power = station_data.wire_power or 0
+    return charge_power * -1 > 200 and generation_power > 0 and wire_power == 0
@@ -0,0 +1,143 @@
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+
+ACTIVITY_THRESHOLD_W = 200
+
+
+class StationSeries:
+    """Columnar (NumPy) view over a station's samples, ordered by time."""
+
+    COLUMNS = (
+        "charge_power",
+        "consumption_power",
+        "discharge_power",
+        "generation_power",
+        "wire_power",
+    )
+
+    def __init__(self, times: np.ndarray, columns: Dict[str, np.ndarray]):
+        self.times = times
+        self.columns = columns
+
+    @classmethod
+    def from_station_data(cls, rows: Sequence, columns: Iterable[str] = COLUMNS) -> "StationSeries":
+        """Builds the series from StationData models; missing values count as 0."""
+        columns = tuple(columns)
+        get = attrgetter("last_update_time", *columns)
+        records = [get(row) for row in rows]
+
+        times = np.fromiter((_timestamp(record[0]) for record in records), dtype=np.float64, count=len(records))
+        # one pass over the rows; None becomes NaN here and 0 below
+        values = np.array([record[1:] for record in records], dtype=np.float64).reshape(len(records), len(columns))
+        np.nan_to_num(values, copy=False)
+        return cls(times, {column: values[:, i] for i, column in enumerate(columns)})
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def column(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def generator_mask(self) -> np.ndarray:
+        """Vectorized app.utils.is_generator_running."""
+        return (
+            (self.column("charge_power") * -1 > ACTIVITY_THRESHOLD_W)
+            & (self.column("generation_power") > 0)
+            & (self.column("wire_power") == 0)
+        )
+
+    def charging_mask(self) -> np.ndarray:
+        return self.column("charge_power") * -1 > ACTIVITY_THRESHOLD_W
+
+    def discharging_mask(self) -> np.ndarray:
+        return self.column("discharge_power") > ACTIVITY_THRESHOLD_W
+
+    def mask_seconds(self, mask: np.ndarray) -> float:
+        """Sums the time from every sample matching `mask` to the next sample."""
+        if len(self) < 2:
+            return 0.0
+        return float(np.diff(self.times)[mask[:-1]].sum())
+
+    def generator_seconds(self) -> float:
+        return self.mask_seconds(self.generator_mask())
+
+    def energy_kwh(self, column: str, sign: float = 1.0) -> float:
+        """Trapezoidal integral of a power column (W); `sign` -1 counts the negative side, e.g. charging."""
+        if len(self) < 2:
+            return 0.0
+        values = np.clip(self.column(column) * sign, 0, None)
+        watt_seconds = np.sum((values[1:] + values[:-1]) * 0.5 * np.diff(self.times))
+        return float(watt_seconds / 3_600_000)
+
+    def mask_periods(self, mask: np.ndarray) -> List[tuple[datetime, datetime]]:
+        """Closed runs of `mask`; a run still active at the last sample is left out."""
+        if len(self) < 2:
+            return []
+        edges = np.diff(mask.astype(np.int8))
+        starts = np.flatnonzero(edges == 1) + 1
+        ends = np.flatnonzero(edges == -1) + 1
+        if mask[0]:
+            starts = np.concatenate(([0], starts))
+        return [
+            (_datetime(self.times[start]), _datetime(self.times[end]))
+            for start, end in zip(starts, ends)
+        ]
+
+    def mask_open_since(self, mask: np.ndarray) -> datetime | None:
+        """Start of the run of `mask` that is still active at the last sample."""
+        if len(self) == 0 or not mask[-1]:
+            return None
+        inactive = np.flatnonzero(~mask)
+        return _datetime(self.times[inactive[-1] + 1 if len(inactive) else 0])
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Indices of the points largest-triangle-three-buckets keeps."""
+    length = len(x)
+    if threshold <= 2 or length <= threshold:
+        return np.arange(length)
+
+    edges = (np.arange(threshold - 1) * (length - 2) / (threshold - 2)).astype(np.int64) + 1
+    edges[-1] = length - 1
+
+    # next-bucket centroids, the last bucket looks at the final point
+    next_x = np.append(np.add.reduceat(x[1:-1], edges[:-1] - 1) / np.diff(edges), x[-1])
+    next_y = np.append(np.add.reduceat(y[1:-1], edges[:-1] - 1) / np.diff(edges), y[-1])
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = length - 1
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        anchor = selected[i]
+        area = np.abs(
+            (x[anchor] - next_x[i + 1]) * (y[start:end] - y[anchor])
+            - (x[anchor] - x[start:end]) * (next_y[i + 1] - y[anchor])
+        )
+        selected[i + 1] = start + int(np.argmax(area))
+    return selected
+
+
+def largest_triangle_three_buckets(points: List[dict], threshold: int, value_key: str, time_key: str = "last_update_time") -> List[dict]:
+    """Picks `threshold` points that keep the visual shape of the `value_key` series."""
+    if threshold <= 2 or len(points) <= threshold:
+        return points
+
+    x = np.fromiter((_timestamp(point[time_key]) for point in points), dtype=np.float64, count=len(points))
+    y = np.fromiter((point[value_key] or 0 for point in points), dtype=np.float64, count=len(points))
+    return [points[i] for i in lttb_indices(x, y, threshold)]
+
+
+def _timestamp(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _datetime(value: float) -> datetime:
+    return datetime.fromtimestamp(float(value), timezone.utc)
+
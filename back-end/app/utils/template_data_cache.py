@@ -0,0 +1,75 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Tuple
+
+
+class TemplateDataCache:
+    """Memo of template data shared by the messages rendered in one cycle.
+
+    Entries hold futures, so concurrent lookups of a key that is still
+    loading wait for the first load instead of querying again. Without a
+    TTL the entries live as long as the cache; with one they expire, and
+    `discard_stations` drops everything tagged with a station whose data
+    changed.
+    """
+
+    def __init__(self, ttl_seconds: float | None = None):
+        self._ttl = ttl_seconds
+        self._entries: Dict[Hashable, Tuple[float, Hashable, asyncio.Future]] = {}
+
+    def lookup(self, key: Hashable) -> asyncio.Future | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, _, future = entry
+        if future.done() and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return future
+
+    def reserve(self, key: Hashable, station_id: Hashable = None) -> asyncio.Future:
+        """Registers a pending entry; the caller must `fulfill` or `fail` it."""
+        future = asyncio.get_running_loop().create_future()
+        expires_at = float("inf") if self._ttl is None else time.monotonic() + self._ttl
+        self._entries[key] = (expires_at, station_id, future)
+        return future
+
+    def fulfill(self, future: asyncio.Future, value: Any):
+        if not future.done():
+            future.set_result(value)
+
+    def fail(self, key: Hashable, future: asyncio.Future, error: BaseException):
+        entry = self._entries.get(key)
+        if entry is not None and entry[2] is future:
+            del self._entries[key]
+        if future.done():
+            return
+        if isinstance(error, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(error)
+            # waiters re-raise it; nobody waiting is not an error here
+            future.exception()
+
+    async def get_or_load(self, key: Hashable, load: Callable[[], Awaitable[Any]], station_id: Hashable = None) -> Any:
+        future = self.lookup(key)
+        if future is not None:
+            return await future
+
+        future = self.reserve(key, station_id)
+        try:
+            self.fulfill(future, await load())
+        except BaseException as e:
+            self.fail(key, future, e)
+            raise
+        return future.result()
+
+    def discard_stations(self, station_ids: Iterable[Hashable]):
+        station_ids = set(station_ids)
+        for key in [key for key, (_, station_id, _) in self._entries.items() if station_id in station_ids]:
+            del self._entries[key]
+
+    def purge(self):
+        now = time.monotonic()
+        for key in [key for key, (expires_at, _, future) in self._entries.items() if future.done() and expires_at <= now]:
+            del self._entries[key]
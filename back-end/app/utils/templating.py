@@ -1,25 +1,115 @@
-from jinja2 import Environment
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from jinja2 import Template, TemplateSyntaxError, nodes
+from jinja2.sandbox import SandboxedEnvironment
 
 
-def _create_template(template: str):
-    environment = Environment(
+logger = logging.getLogger(__name__)
+
+
+TEMPLATE_CACHE_SIZE = 256
+
+# values that change with the clock alone, without new station data
+TIME_DEPENDENT_NAMES = {"now"}
+TIME_DEPENDENT_METHODS = {"get_average_minutes", "get_assumed_state"}
+
+
+class TemplateCache:
+    """LRU of compiled templates keyed by a hash of their source."""
+
+    def __init__(self, environment: SandboxedEnvironment, maxsize: int = TEMPLATE_CACHE_SIZE):
+        self._environment = environment
+        self._maxsize = maxsize
+        self._templates: OrderedDict[str, Template] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.compile_seconds = 0.0
+
+    @staticmethod
+    def _key(source: str) -> str:
+        return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+    def get(self, source: str) -> Template:
+        key = self._key(source)
+        template = self._templates.get(key)
+        if template is not None:
+            self._templates.move_to_end(key)
+            self.hits += 1
+            return template
+
+        started = time.perf_counter()
+        template = self._environment.from_string(source)
+        elapsed = time.perf_counter() - started
+        self.misses += 1
+        self.compile_seconds += elapsed
+        logger.debug(f"Compiled template {key[:8]} in {elapsed * 1000:.1f} ms")
+
+        self._templates[key] = template
+        if len(self._templates) > self._maxsize:
+            self._templates.popitem(last=False)
+            self.evictions += 1
+        return template
+
+    def parse(self, source: str) -> nodes.Template:
+        return self._environment.parse(source)
+
+    def invalidate(self, *sources: str | None):
+        for source in sources:
+            if source is not None:
+                self._templates.pop(self._key(source), None)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._templates),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "compile_seconds": round(self.compile_seconds, 4),
+        }
+
+
+template_cache = TemplateCache(
+    SandboxedEnvironment(
         lstrip_blocks = True,
         trim_blocks = True,
         enable_async = True,
     )
-    return environment.from_string(template)
+)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _depends_on_time(template_str: str) -> bool:
+    try:
+        ast = template_cache.parse(template_str)
+    except TemplateSyntaxError:
+        return False
+    return (
+        any(node.name in TIME_DEPENDENT_NAMES for node in ast.find_all(nodes.Name))
+        or any(node.attr in TIME_DEPENDENT_METHODS for node in ast.find_all(nodes.Getattr))
+        or any(
+            isinstance(node.arg, nodes.Const) and node.arg.value in TIME_DEPENDENT_METHODS
+            for node in ast.find_all(nodes.Getitem)
+        )
+    )
 
+def depends_on_time(*template_strs: str | None) -> bool:
+    """Whether any of the templates can render differently as time passes, with the same data."""
+    return any(_depends_on_time(template_str) for template_str in template_strs if template_str)
 
 async def generate_message(template_str: str, data: dict):
     try:
-        template = _create_template(template_str)
+        template = template_cache.get(template_str)
         return await template.render_async(data)
     except Exception as e:
         raise Exception(f"Error in 'Message' template: {repr(e)}")
 
 async def get_send_timeout(template_str: str, data: dict) -> int:
     try:
-        template = _create_template(template_str)
+        template = template_cache.get(template_str)
         return int(await template.render_async(data))
     except Exception as e:
         raise Exception(f"Error in 'Send timeout' template: {repr(e)}")
@@ -28,7 +118,7 @@ async def get_should_send(template_str: str, data: dict) -> bool:
     if template_str is None:
         return True
     try:
-        template = _create_template(template_str)
+        template = template_cache.get(template_str)
         result = await template.render_async(data)
         return result is not None and result.lower().capitalize() == "True"
     except Exception as e:
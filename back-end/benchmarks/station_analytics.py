@@ -0,0 +1,171 @@
+"""Compares app.utils.station_analytics with the plain Python loops it replaced.
+
+Run from back-end/: python -m benchmarks.station_analytics [--days 30] [--repeat 5]
+"""
+import argparse
+import random
+import timeit
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import List
+
+import numpy as np
+
+from app.utils import is_generator_running
+from app.utils.station_analytics import StationSeries, largest_triangle_three_buckets
+
+
+def make_samples(days: int) -> List[dict]:
+    """One sample per minute with generator runs of random length."""
+    rng = random.Random(42)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    samples = []
+    running = False
+    for minute in range(days * 24 * 60):
+        if rng.random() < 0.01:
+            running = not running
+        samples.append({
+            "last_update_time": start + timedelta(minutes=minute),
+            "consumption_power": rng.uniform(200, 3000),
+            "generator_running": running,
+        })
+    return samples
+
+
+def make_rows(samples: List[dict]) -> List[SimpleNamespace]:
+    """StationData-like rows for the energy summary of the station details endpoint."""
+    rng = random.Random(7)
+    rows = []
+    for sample in samples:
+        charging = sample["generator_running"] or rng.random() < 0.2
+        rows.append(SimpleNamespace(
+            last_update_time  = sample["last_update_time"],
+            charge_power      = -rng.uniform(300, 3000) if charging else 0,
+            consumption_power = sample["consumption_power"],
+            discharge_power   = 0 if charging else rng.uniform(0, 2000),
+            generation_power  = rng.uniform(100, 2000) if sample["generator_running"] else 0,
+            wire_power        = 0 if sample["generator_running"] else rng.choice((0, 500)),
+        ))
+    return rows
+
+
+def python_energy(rows: List[SimpleNamespace]):
+    generator_seconds = charged = consumed = 0.0
+    for previous, row in zip(rows, rows[1:]):
+        seconds = (row.last_update_time - previous.last_update_time).total_seconds()
+        if is_generator_running(previous):
+            generator_seconds += seconds
+        charged += (max(-previous.charge_power, 0) + max(-row.charge_power, 0)) * 0.5 * seconds
+        consumed += (previous.consumption_power + row.consumption_power) * 0.5 * seconds
+    return generator_seconds, charged / 3_600_000, consumed / 3_600_000
+
+
+def numpy_energy(rows: List[SimpleNamespace]):
+    series = StationSeries.from_station_data(rows)
+    return (
+        series.generator_seconds(),
+        series.energy_kwh("charge_power", sign=-1),
+        series.energy_kwh("consumption_power"),
+    )
+
+
+def python_generator_periods(samples: List[dict]):
+    periods = []
+    since = None
+    for sample in samples:
+        if sample["generator_running"] and since is None:
+            since = sample["last_update_time"]
+        elif not sample["generator_running"] and since is not None:
+            periods.append((since, sample["last_update_time"]))
+            since = None
+    return periods, since
+
+
+def numpy_generator_periods(samples: List[dict]):
+    series = StationSeries(
+        np.fromiter((s["last_update_time"].timestamp() for s in samples), dtype=np.float64, count=len(samples)),
+        {},
+    )
+    running = np.fromiter((s["generator_running"] for s in samples), dtype=bool, count=len(samples))
+    return series.mask_periods(running), series.mask_open_since(running)
+
+
+def python_lttb(points: List[dict], threshold: int, value_key: str, time_key: str = "last_update_time") -> List[dict]:
+    if threshold <= 2 or len(points) <= threshold:
+        return points
+
+    def x(point):
+        return point[time_key].timestamp()
+
+    def y(point):
+        return point[value_key] or 0
+
+    result = [points[0]]
+    bucket_size = (len(points) - 2) / (threshold - 2)
+    selected = 0
+
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+
+        next_start = end
+        next_end = min(int((i + 2) * bucket_size) + 1, len(points))
+        next_bucket = points[next_start:next_end] or [points[-1]]
+        avg_x = sum(x(p) for p in next_bucket) / len(next_bucket)
+        avg_y = sum(y(p) for p in next_bucket) / len(next_bucket)
+
+        anchor_x, anchor_y = x(points[selected]), y(points[selected])
+        max_area = -1
+        for index in range(start, end):
+            area = abs(
+                (anchor_x - avg_x) * (y(points[index]) - anchor_y)
+                - (anchor_x - x(points[index])) * (avg_y - anchor_y)
+            )
+            if area > max_area:
+                max_area = area
+                selected = index
+        result.append(points[selected])
+
+    result.append(points[-1])
+    return result
+
+
+def best_ms(func, repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    samples = make_samples(args.days)
+    print(f"{len(samples)} samples, best of {args.repeat} runs")
+
+    python_result = python_generator_periods(samples)
+    numpy_result = numpy_generator_periods(samples)
+    assert len(python_result[0]) == len(numpy_result[0])
+    print(
+        f"generator periods: {best_ms(lambda: python_generator_periods(samples), args.repeat):.2f} ms in Python, "
+        f"{best_ms(lambda: numpy_generator_periods(samples), args.repeat):.2f} ms with NumPy"
+    )
+
+    rows = make_rows(samples)
+    assert np.allclose(python_energy(rows), numpy_energy(rows))
+    print(
+        f"energy summary (conversion included): {best_ms(lambda: python_energy(rows), args.repeat):.2f} ms in Python, "
+        f"{best_ms(lambda: numpy_energy(rows), args.repeat):.2f} ms with NumPy"
+    )
+
+    threshold = 1000
+    same = python_lttb(samples, threshold, "consumption_power") == largest_triangle_three_buckets(samples, threshold, "consumption_power")
+    print(
+        f"{threshold}-point LTTB: {best_ms(lambda: python_lttb(samples, threshold, 'consumption_power'), args.repeat):.2f} ms in Python, "
+        f"{best_ms(lambda: largest_triangle_three_buckets(samples, threshold, 'consumption_power'), args.repeat):.2f} ms with NumPy "
+        f"({'same' if same else 'different'} points)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 import { useEffect, useRef } from "react";
 import { eventsService } from "../services";
-import { EventItem } from "../types";
+import { EventItem, EventType } from "../types";
 
 export function useSubscribeEvents(callback: (event: EventItem) => void) {
   useEffect(() => {
@@ -24,7 +24,9 @@ export function useSubscribeEvent<T extends EventItem["type"]>(
 
   useEffect(() => {
     const listener = (event: EventItem) => {
-      if (event.type === type) {
+      // a resync means events were missed, so every data subscriber refetches
+      const isResync = event.type === EventType.Resync && type !== EventType.Shutdown;
+      if (event.type === type || isResync) {
         handlerRef.current(event as EventItem & { type: T });
       }
     };
@@ -61,10 +61,11 @@ const Component: FC<ComponentProps> = ({ authData, profile }) => {
     openProfileEditDialog(t);
   };
 
-  useSubscribeEvent(EventType.Shutdown, () => {
+  useSubscribeEvent(EventType.Shutdown, (event) => {
+    // the server spreads reconnects over a jittered delay
     setTimeout(() => {
       window.location.reload();
-    }, 5000);
+    }, Number(event.data?.retry) || 5000);
   });
 
   return (
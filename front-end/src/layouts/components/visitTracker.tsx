@@ -50,7 +50,7 @@ export const VisitTracker: FC = () => {
   }, [dispatch]);
 
   useSubscribeEvents((event: EventItem) => {
-    if (event.type === EventType.VisitsUpdated) {
+    if (event.type === EventType.VisitsUpdated || event.type === EventType.Resync) {
       fetchVisitStats();
     }
   });
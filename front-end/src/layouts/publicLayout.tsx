@@ -42,10 +42,11 @@ export const PublicLayout: FC<PublicLayoutProps> = ({ children }) => {
     };
   }, []);
 
-  useSubscribeEvent(EventType.Shutdown, () => {
+  useSubscribeEvent(EventType.Shutdown, (event) => {
+    // the server spreads reconnects over a jittered delay
     setTimeout(() => {
       window.location.reload();
-    }, 5000);
+    }, Number(event.data?.retry) || 5000);
   });
 
   const t = usePageTranslation('common');
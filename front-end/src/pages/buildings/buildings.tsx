@@ -8,6 +8,7 @@ import {
 import { useDocumentVisibility } from "@mantine/hooks";
 import { RootState, useAppDispatch, useAppSelector } from "../../stores/store";
 import { fetchBuildings, fetchBuildingsSummary, fetchDashboardConfig, fetchOutagesSchedule, saveBuildings, saveDashboardConfig } from "../../stores/thunks";
+import { applyBuildingSummary } from "../../stores/slices";
 import { BuildingsView, openDashboardEditDialog, PlannedOutages } from "./components";
 import { BuildingListItem, BuildingSummaryItem, DashboardConfig, OutagesScheduleData } from "../../stores/types";
 import { connect } from "react-redux";
@@ -152,13 +153,13 @@ const Component: FC<ComponentProps> = ({
     switch (event.type) {
       case EventType.BuildingsUpdated:
       case EventType.DashboardConfigUpdated:
+      case EventType.Resync:
         fetchData();
         fetchSummary(true);
         fetchOutages();
         break;
-      case EventType.ExtDataUpdated:
-      case EventType.StationDataUpdated:
-        fetchSummary(true);
+      case EventType.BuildingSummaryUpdated:
+        dispatch(applyBuildingSummary(event.data as BuildingSummaryItem));
         break;
       case EventType.OutagesUpdated:
         fetchOutages();
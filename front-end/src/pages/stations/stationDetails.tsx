@@ -24,7 +24,7 @@ import { StationDetailsData } from "../../stores/types";
 import { FontAwesomeIcon } from "@fortawesome/react-fontawesome";
 import { toLocalDateTime } from "../../utils/dateUtils";
 import { ObjectId } from "../../schemas";
-import { usePageTranslation } from "../../utils";
+import { formatDuration, usePageTranslation } from "../../utils";
 import useLocalStorage from "../../hooks/useLocalStorage";
 
 type ComponentProps = {
@@ -258,6 +258,57 @@ const Component: FC<ComponentProps> = ({
               </Grid>
             </Card>
 
+            {/* Energy Card */}
+            <Card withBorder radius="md" p="lg">
+              <Title order={4} mb="md">
+                {t('energy.title')}
+              </Title>
+              <Grid>
+                <Grid.Col span={{ base: 12, sm: 6, md: 3 }}>
+                  <Text size="sm" c="dimmed">
+                    {t('energy.generatorTime')}
+                  </Text>
+                  <Text fw={500}>{formatDuration(detailsData.energy.generatorSeconds, true)}</Text>
+                </Grid.Col>
+                <Grid.Col span={{ base: 12, sm: 6, md: 3 }}>
+                  <Text size="sm" c="dimmed">
+                    {t('energy.chargingTime')}
+                  </Text>
+                  <Text fw={500}>{formatDuration(detailsData.energy.chargingSeconds, true)}</Text>
+                </Grid.Col>
+                <Grid.Col span={{ base: 12, sm: 6, md: 3 }}>
+                  <Text size="sm" c="dimmed">
+                    {t('energy.dischargingTime')}
+                  </Text>
+                  <Text fw={500}>{formatDuration(detailsData.energy.dischargingSeconds, true)}</Text>
+                </Grid.Col>
+                <Grid.Col span={{ base: 12, sm: 6, md: 3 }}>
+                  <Text size="sm" c="dimmed">
+                    {t('energy.generated')}
+                  </Text>
+                  <Text fw={500}>{`${detailsData.energy.generatedKwh.toFixed(2)} ${t('units.kWh') ?? 'kWh'}`}</Text>
+                </Grid.Col>
+                <Grid.Col span={{ base: 12, sm: 6, md: 3 }}>
+                  <Text size="sm" c="dimmed">
+                    {t('energy.consumed')}
+                  </Text>
+                  <Text fw={500}>{`${detailsData.energy.consumedKwh.toFixed(2)} ${t('units.kWh') ?? 'kWh'}`}</Text>
+                </Grid.Col>
+                <Grid.Col span={{ base: 12, sm: 6, md: 3 }}>
+                  <Text size="sm" c="dimmed">
+                    {t('energy.charged')}
+                  </Text>
+                  <Text fw={500}>{`${detailsData.energy.chargedKwh.toFixed(2)} ${t('units.kWh') ?? 'kWh'}`}</Text>
+                </Grid.Col>
+                <Grid.Col span={{ base: 12, sm: 6, md: 3 }}>
+                  <Text size="sm" c="dimmed">
+                    {t('energy.discharged')}
+                  </Text>
+                  <Text fw={500}>{`${detailsData.energy.dischargedKwh.toFixed(2)} ${t('units.kWh') ?? 'kWh'}`}</Text>
+                </Grid.Col>
+              </Grid>
+            </Card>
+
             {chartData.length > 0 && statistics ? (
               <>
                 {/* Current Stats */}
@@ -2,6 +2,28 @@ import { EventItem, EventType } from "../types";
 
 type Listener = (event: EventItem) => void;
 
+// short-key frames requested with `compact`, defaults left out
+type CompactEventItem = {
+  t: EventType;
+  d?: Record<string, unknown>;
+  p?: 1;
+  u?: string;
+  s?: number;
+};
+
+const decodeEvent = (raw: EventItem | CompactEventItem): EventItem => {
+  if (!("t" in raw)) {
+    return raw;
+  }
+  return {
+    type: raw.t,
+    data: raw.d ?? {},
+    private: raw.p === 1,
+    user: raw.u,
+    seq: raw.s,
+  };
+};
+
 class EventsService {
   private evt?: EventSource;
   private listeners = new Set<Listener>();
@@ -14,6 +36,10 @@ class EventsService {
   private token?: string;
   private subscribersCount = 0;
 
+  private lastSeq = new Map<boolean, number>();
+  private lastEventId?: string;
+  private wasConnected = false;
+
   constructor(url: string) {
     this.url = url;
   }
@@ -68,7 +94,16 @@ class EventsService {
       clearTimeout(this.reconnectTimeout);
     }
 
-    const fullUrl = token ? `${this.url}?token=${token}` : this.url;
+    const params = new URLSearchParams({ compact: "1", deflate: "1" });
+    if (token) {
+      params.set("token", token);
+    }
+    // a stream transport replays what we missed, the rest answer with a resync
+    const replayFrom = this.wasConnected ? this.lastEventId : undefined;
+    if (replayFrom) {
+      params.set("lastEventId", replayFrom);
+    }
+    const fullUrl = `${this.url}?${params.toString()}`;
     console.log("[Events] Connecting to:", fullUrl);
 
     const evt = new EventSource(fullUrl);
@@ -77,11 +112,33 @@ class EventsService {
     evt.onopen = () => {
       console.log("[Events] connected");
       this.retryAttempt = 0;
+
+      // without a replay anything sent while we were away is lost
+      if (!replayFrom) {
+        this.lastSeq.clear();
+        if (this.wasConnected) {
+          this.notifyResync();
+        }
+      }
+      this.wasConnected = true;
     };
 
     evt.onmessage = (e) => {
       try {
-        const data: EventItem = JSON.parse(e.data);
+        const data = decodeEvent(JSON.parse(e.data));
+        if (e.lastEventId) {
+          this.lastEventId = e.lastEventId;
+        }
+        if (!this.checkSequence(data)) {
+          return;
+        }
+        if (data.type === EventType.Resync) {
+          // listeners are told to refetch once the new stream is open
+          console.info("[Events] reconnecting after falling behind");
+          this.lastEventId = undefined;
+          this.connect(this.token);
+          return;
+        }
         if (data.type === EventType.Shutdown) {
           console.info("[Events] disconnecting due to server shutdown");
           this.disconnect();
@@ -102,6 +159,30 @@ class EventsService {
     };
   }
 
+  // Returns false for stale events; a gap means deltas were missed
+  private checkSequence(event: EventItem) {
+    if (event.seq == null) {
+      return true;
+    }
+
+    const last = this.lastSeq.get(event.private);
+    if (last !== undefined && event.seq <= last) {
+      return false;
+    }
+
+    this.lastSeq.set(event.private, event.seq);
+    if (last !== undefined && event.seq > last + 1) {
+      console.info(`[Events] missed ${event.seq - last - 1} event(s), resyncing`);
+      this.notifyResync();
+    }
+    return true;
+  }
+
+  private notifyResync() {
+    const resync: EventItem = { type: EventType.Resync, data: {}, private: false };
+    this.listeners.forEach(listener => listener(resync));
+  }
+
   reconnect(token?: string) {
     this.token = token;
     this.disconnect();
@@ -112,6 +193,9 @@ class EventsService {
   }
 
   disconnect() {
+    this.wasConnected = false;
+    this.lastEventId = undefined;
+
     if (this.reconnectTimeout) {
       clearTimeout(this.reconnectTimeout);
       this.reconnectTimeout = undefined;
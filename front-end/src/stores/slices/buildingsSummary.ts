@@ -11,7 +11,15 @@ const initialState: BuildingsSummaryState = {
 export const buildingsSummarySlice = createSlice({
   name: 'buildingsSummary',
   initialState: initialState,
-  reducers: {},
+  reducers: {
+    applyBuildingSummary(state, { payload }: PayloadAction<BuildingSummaryItem>) {
+      const index = state.items.findIndex(item => item.id === payload.id);
+      // a building this page has not loaded arrives with its next fetch
+      if (index >= 0) {
+        state.items[index] = payload;
+      }
+    },
+  },
   extraReducers: (builder) => {
     builder
       .addCase(fetchBuildingsSummary.pending, (state) => {
@@ -29,4 +37,6 @@ export const buildingsSummarySlice = createSlice({
   },
 });
 
+export const { applyBuildingSummary } = buildingsSummarySlice.actions;
+
 export const buildingsSummaryReducer = buildingsSummarySlice.reducer;
\ No newline at end of file
@@ -45,10 +45,21 @@ export type StationInfo = {
   lastUpdateTime: Date | null;
 };
 
+export type StationEnergy = {
+  generatorSeconds: number;
+  chargingSeconds: number;
+  dischargingSeconds: number;
+  chargedKwh: number;
+  dischargedKwh: number;
+  consumedKwh: number;
+  generatedKwh: number;
+};
+
 export type StationDetailsData = {
   station: StationInfo;
   data: Array<StationDetailsDataPoint>;
   dataCount: number;
+  energy: StationEnergy;
 };
 
 export type StationsDataState = BaseState & {
@@ -8,13 +8,16 @@ export enum EventType {
   OutagesUpdated = "outages_updated",
   MessagesUpdated = "messages_updated",
   ChatsUpdated = "chats_updated",
+  BuildingSummaryUpdated = "building_summary_updated",
   Ping = "ping",
   Shutdown = "shutdown",
+  Resync = "resync",
 };
 
 export type EventItem = {
   type: EventType;
-  data: Record<string, string>;
+  data: Record<string, unknown>;
   private: boolean;
   user?: string;
+  seq?: number;
 };
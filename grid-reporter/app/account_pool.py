@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from collections import defaultdict
+
+from aiohttp import ClientSession
+
+from shared.services.deye_api import BaseDeyeClient, DeyeCredentials, TokenBucket
+
+from .client_worker import ClientWorker
+from .constants import POLL_BATCH_WINDOW
+from .settings import Settings
+
+
+class AccountPoller:
+    """Polls every station of one Deye account with a shared token and schedule."""
+
+    def __init__(self, creds: DeyeCredentials, session: ClientSession, settings: Settings):
+        self.creds = creds
+        self.settings = settings
+        self.deye_client = BaseDeyeClient(creds, session, TokenBucket(settings.rate_limit))
+        self.workers: list[ClientWorker] = []
+
+    def add_worker(self, worker: ClientWorker) -> None:
+        self.workers.append(worker)
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            await self.deye_client.init()
+
+            while True:
+                now = loop.time()
+                due = [worker for worker in self.workers if worker.is_due(now, POLL_BATCH_WINDOW)]
+                if due:
+                    try:
+                        await self._poll(due, now)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception:
+                        logging.exception("Account poll failed: %s", self.creds.email)
+
+                next_poll_at = min(worker.next_poll_at for worker in self.workers)
+                await asyncio.sleep(max(0.0, next_poll_at - loop.time()))
+        except asyncio.CancelledError:
+            logging.info("Account poller shutting down: %s", self.creds.email)
+            raise
+
+    async def _poll(self, workers: list[ClientWorker], now: float) -> None:
+        by_station: dict[int, list[ClientWorker]] = defaultdict(list)
+        for worker in workers:
+            worker.schedule_next(now)
+            by_station[worker.client.station_id].append(worker)
+
+        logging.info(
+            "Polling %d stations for %d clients of %s",
+            len(by_station),
+            len(workers),
+            self.creds.email,
+        )
+
+        async for station_id, raw in self.deye_client.iter_stations_data(
+            list(by_station),
+            concurrency=self.settings.max_concurrency,
+            timeout=self.settings.timeout,
+        ):
+            await asyncio.gather(
+                *(self._sync_worker(worker, raw) for worker in by_station[station_id])
+            )
+
+    async def _sync_worker(self, worker: ClientWorker, raw) -> None:
+        try:
+            await worker.sync(raw)
+        except Exception:
+            logging.exception("Client sync failed: %s", worker.client.client_id)
+
+
+class DeyeClientPool:
+    """Groups client workers by Deye account so each account logs in once."""
+
+    def __init__(self, session: ClientSession, settings: Settings):
+        self.session = session
+        self.settings = settings
+        self._pollers: dict[DeyeCredentials, AccountPoller] = {}
+
+    def add(self, worker: ClientWorker) -> None:
+        creds = worker.client.deye
+        poller = self._pollers.get(creds)
+        if poller is None:
+            poller = AccountPoller(creds, self.session, self.settings)
+            self._pollers[creds] = poller
+        poller.add_worker(worker)
+
+    @property
+    def pollers(self) -> list[AccountPoller]:
+        return list(self._pollers.values())
@@ -1,10 +1,8 @@
-import asyncio
 import logging
+from typing import Any
 
 from aiohttp import ClientSession
 
-from shared.services.deye_api import BaseDeyeClient
-
 from .config import ClientConfig
 from .service import send_ext_data
 from .settings import Settings
@@ -17,38 +15,25 @@ class ClientWorker:
     def __init__(
         self,
         client: ClientConfig,
-        deye_client: BaseDeyeClient,
         session: ClientSession,
         state_store: StateStore,
         settings: Settings,
     ):
         self.client = client
-        self.deye_client = deye_client
         self.session = session
         self.state_store = state_store
         self.settings = settings
         self.interval = client.poll_interval or settings.poll_interval
+        self.next_poll_at = 0.0
 
-    async def run(self) -> None:
-        try:
-            await self.deye_client.init()
+    def is_due(self, now: float, window: float = 0) -> bool:
+        return self.next_poll_at <= now + window
 
-            while True:
-                try:
-                    await self._poll_and_sync()
-                except asyncio.CancelledError:
-                    logging.info("Client loop cancelled: %s", self.client.client_id)
-                    raise
-                except Exception:
-                    logging.exception("Client loop failed: %s", self.client.client_id)
-                await asyncio.sleep(self.interval)
-        except asyncio.CancelledError:
-            logging.info("Client worker shutting down: %s", self.client.client_id)
-            raise
+    def schedule_next(self, now: float) -> None:
+        self.next_poll_at = now + self.interval
 
-    async def _poll_and_sync(self) -> None:
+    async def sync(self, raw: dict[str, Any] | None) -> None:
         prev_state = self.state_store.load(self.client.client_id)
-        raw = await self.deye_client.get_station_data(self.client.station_id)
         logging.info("DEYE raw for %s: %s", self.client.client_id, raw)
 
         if not raw or not raw.get("success", True):
@@ -75,4 +60,4 @@ class ClientWorker:
         payload = {"grid_power": {"state": bool(grid_state)}}
         sent = await send_ext_data(self.session, self.client, self.settings, payload)
         if sent:
-            self.state_store.save(self.client.client_id, current_state)
+            await self.state_store.save(self.client.client_id, current_state)
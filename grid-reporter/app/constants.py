@@ -1,3 +1,8 @@
 DEFAULT_POLL_INTERVAL = 240
 DEFAULT_TIMEOUT = 20
+DEFAULT_MAX_CONCURRENCY = 5
+DEFAULT_RATE_LIMIT = 5.0
+POLL_BATCH_WINDOW = 5
+STATE_LOG_COMPACT_MIN_ENTRIES = 1000
+STATE_FLUSH_DELAY = 5
 GRID_POWER_THRESHOLD = 0.1
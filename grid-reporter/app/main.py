@@ -9,12 +9,11 @@ from typing import Any
 import aiohttp
 from aiohttp import ClientTimeout
 
-from shared.services.deye_api import BaseDeyeClient
-
+from .account_pool import DeyeClientPool
 from .client_worker import ClientWorker
 from .service import load_clients
 from .settings import load_settings
-from .state_store import StateStore
+from .state_store import create_state_store
 
 
 _shutdown_event: asyncio.Event | None = None
@@ -52,13 +51,14 @@ async def run() -> ExitStack:
 
     timeout = ClientTimeout(total=settings.timeout)
     async with aiohttp.ClientSession(timeout=timeout) as session:
-        state_store = StateStore(settings.state_path)
-        tasks = []
+        state_store = create_state_store(settings.state_backend, settings.state_path, settings.state_dir)
+        pool = DeyeClientPool(session, settings)
 
         for client in clients:
-            deye_client = BaseDeyeClient(client.deye, session)
-            worker = ClientWorker(client, deye_client, session, state_store, settings)
-            tasks.append(asyncio.create_task(worker.run()))
+            pool.add(ClientWorker(client, session, state_store, settings))
+
+        logging.info("Polling %d clients over %d Deye accounts", len(clients), len(pool.pollers))
+        tasks = [asyncio.create_task(poller.run()) for poller in pool.pollers]
 
         try:
             shutdown_task = asyncio.create_task(_shutdown_event.wait())
@@ -83,3 +83,5 @@ async def run() -> ExitStack:
             logging.info("All tasks cancelled")
             logging.shutdown()
             raise
+        finally:
+            await state_store.close()
@@ -5,7 +5,7 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-from .constants import DEFAULT_POLL_INTERVAL, DEFAULT_TIMEOUT
+from .constants import DEFAULT_MAX_CONCURRENCY, DEFAULT_POLL_INTERVAL, DEFAULT_RATE_LIMIT, DEFAULT_TIMEOUT
 
 
 @dataclass
@@ -15,8 +15,12 @@ class Settings:
     ext_data_url: str | None
     ext_data_token: str | None
     state_path: Path
+    state_backend: str
+    state_dir: Path
     clients_path: Path
     timeout: int
+    max_concurrency: int
+    rate_limit: float
     log_level: str
 
     def __str__(self) -> str:
@@ -25,8 +29,12 @@ class Settings:
             f"deye_base_url={self.deye_base_url}, "
             f"ext_data_url={self.ext_data_url}, "
             f"state_path={self.state_path}, "
+            f"state_backend={self.state_backend}, "
+            f"state_dir={self.state_dir}, "
             f"clients_path={self.clients_path}, "
             f"timeout={self.timeout}, "
+            f"max_concurrency={self.max_concurrency}, "
+            f"rate_limit={self.rate_limit}, "
             f"log_level={self.log_level})"
         )
 
@@ -43,9 +51,19 @@ def _resolve_path(env_var: str, default: str) -> Path:
     return path
 
 
+def _resolve_state_dir(state_path: Path) -> Path:
+    # the log and sqlite backends need a directory; next to a state.json
+    # that is "state/", so the two layouts never collide
+    state_dir = os.getenv("STATE_DIR")
+    if state_dir:
+        return Path(state_dir)
+    return state_path.with_suffix("") if state_path.suffix else state_path
+
+
 def load_settings() -> Settings:
     load_dotenv()
 
+    state_path = _resolve_path("STATE_PATH", "state.json")
     s = Settings(
         poll_interval=int(
             os.getenv("POLL_INTERVAL", str(DEFAULT_POLL_INTERVAL))
@@ -53,9 +71,13 @@ def load_settings() -> Settings:
         deye_base_url=os.getenv("DEYE_BASE_URL"),
         ext_data_url=os.getenv("EXT_DATA_URL"),
         ext_data_token=os.getenv("EXT_DATA_TOKEN"),
-        state_path=_resolve_path("STATE_PATH", "state.json"),
+        state_path=state_path,
+        state_backend=os.getenv("STATE_BACKEND", "json").lower(),
+        state_dir=_resolve_state_dir(state_path),
         clients_path=_resolve_path("CLIENTS_PATH", "clients.json"),
         timeout=int(os.getenv("HTTP_TIMEOUT", str(DEFAULT_TIMEOUT))),
+        max_concurrency=int(os.getenv("MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY))),
+        rate_limit=float(os.getenv("DEYE_RATE_LIMIT", str(DEFAULT_RATE_LIMIT))),
         log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
     )
     logging.debug("Loaded settings: %s", s)
@@ -1,34 +1,129 @@
+import asyncio
+import errno
 import json
 import logging
+import os
+import sqlite3
+from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
+from .constants import STATE_FLUSH_DELAY, STATE_LOG_COMPACT_MIN_ENTRIES
 
-class StateStore:
-    def __init__(self, path: Path) -> None:
+
+class StateStore(ABC):
+    """Last reported state per client.
+
+    `load` serves from memory; `save` does its disk I/O off the event loop.
+    """
+
+    @abstractmethod
+    def load(self, client_id: str) -> dict[str, Any] | None:
+        ...
+
+    @abstractmethod
+    async def save(self, client_id: str, state: dict[str, Any]) -> None:
+        ...
+
+    async def close(self) -> None:
+        pass
+
+    def import_states(self, states: dict[str, dict[str, Any]]) -> bool:
+        """Seeds an empty store at startup; returns False if it already holds state."""
+        raise NotImplementedError
+
+
+def _fsync_dir(path: Path) -> None:
+    if os.name != "posix":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_atomic(path: Path, payload: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=True)
+        f.flush()
+        os.fsync(f.fileno())
+    try:
+        os.replace(tmp_path, path)
+    except OSError as e:
+        # a bind-mounted single file (docker-compose) cannot be replaced,
+        # only rewritten in place
+        if e.errno not in (errno.EBUSY, errno.EXDEV):
+            raise
+        tmp_path.unlink(missing_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=True)
+            f.flush()
+            os.fsync(f.fileno())
+        return
+    _fsync_dir(path.parent)
+
+
+class JsonStateStore(StateStore):
+    """One JSON file for all clients, or one file per client for a directory path.
+
+    The single file is rewritten at most once per `flush_delay` seconds, so a
+    burst of saves costs one write; a crash loses at most that window, after
+    which the affected clients report once more.
+    """
+
+    def __init__(self, path: Path, flush_delay: float = STATE_FLUSH_DELAY) -> None:
         self._path = path
         if self._path.suffix:
             self._path.parent.mkdir(parents=True, exist_ok=True)
         else:
             self._path.mkdir(parents=True, exist_ok=True)
+        self._per_client = self._path.is_dir()
+        self._states: dict[str, dict[str, Any] | None] = {}
+        self._flush_delay = flush_delay
+        self._flush_task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+        if not self._per_client:
+            data = self._load_file(self._path)
+            if isinstance(data, dict):
+                self._states.update(data)
 
     def load(self, client_id: str) -> dict[str, Any] | None:
-        if self._path.is_dir():
-            return self._load_file(self._path / f"{client_id}.json")
-        data = self._load_file(self._path)
-        if not isinstance(data, dict):
-            return None
-        return data.get(client_id)
+        if client_id not in self._states and self._per_client:
+            self._states[client_id] = self._load_file(self._path / f"{client_id}.json")
+        return self._states.get(client_id)
 
-    def save(self, client_id: str, state: dict[str, Any]) -> None:
-        if self._path.is_dir():
-            self._write_file(self._path / f"{client_id}.json", state)
-            return
-        data = self._load_file(self._path)
-        if not isinstance(data, dict):
-            data = {}
-        data[client_id] = state
-        self._write_file(self._path, data)
+    async def save(self, client_id: str, state: dict[str, Any]) -> None:
+        self._states[client_id] = state
+        if self._per_client:
+            await self._write(self._path / f"{client_id}.json", state)
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def close(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+            await self._flush()
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_delay)
+        self._flush_task = None
+        await self._flush()
+
+    async def _flush(self) -> None:
+        snapshot = {key: value for key, value in self._states.items() if value is not None}
+        async with self._lock:
+            await self._write(self._path, snapshot)
+
+    async def _write(self, path: Path, payload: Any) -> None:
+        try:
+            await asyncio.to_thread(_write_atomic, path, payload)
+        except Exception:
+            logging.exception("Failed to save state file: %s", path)
 
     def _load_file(self, path: Path) -> dict[str, Any] | None:
         if not path.exists():
@@ -39,9 +134,176 @@ class StateStore:
             logging.exception("Failed to load state file: %s", path)
             return None
 
-    def _write_file(self, path: Path, payload: dict[str, Any]) -> None:
+
+class AppendLogStateStore(StateStore):
+    """In-memory map backed by an fsync'd append-only log and a compacted snapshot."""
+
+    SNAPSHOT_NAME = "state.snapshot.json"
+    LOG_NAME = "state.log"
+
+    def __init__(self, path: Path, compact_min_entries: int = STATE_LOG_COMPACT_MIN_ENTRIES) -> None:
+        self._dir = path
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._snapshot_path = self._dir / self.SNAPSHOT_NAME
+        self._log_path = self._dir / self.LOG_NAME
+        self._compact_min_entries = compact_min_entries
+        # one writer at a time: appends and compaction share the log handle
+        self._lock = asyncio.Lock()
+
+        self._states: dict[str, dict[str, Any]] = {}
+        self._log_entries = 0
+        self._replay()
+        self._log = open(self._log_path, "a", encoding="utf-8")
+
+    def load(self, client_id: str) -> dict[str, Any] | None:
+        return self._states.get(client_id)
+
+    def import_states(self, states: dict[str, dict[str, Any]]) -> bool:
+        if self._states or self._log_entries:
+            return False
+        self._states.update(states)
+        _write_atomic(self._snapshot_path, self._states)
+        return True
+
+    async def save(self, client_id: str, state: dict[str, Any]) -> None:
+        self._states[client_id] = state
+        line = json.dumps({"client_id": client_id, "state": state}, ensure_ascii=True) + "\n"
+        async with self._lock:
+            try:
+                await asyncio.to_thread(self._append, line)
+                self._log_entries += 1
+
+                if self._log_entries >= max(self._compact_min_entries, len(self._states)):
+                    await asyncio.to_thread(self._compact, dict(self._states))
+            except Exception:
+                logging.exception("Failed to save state for %s", client_id)
+
+    async def close(self) -> None:
+        async with self._lock:
+            self._log.close()
+
+    def _append(self, line: str) -> None:
+        self._log.write(line)
+        self._log.flush()
+        os.fsync(self._log.fileno())
+
+    def _compact(self, states: dict[str, dict[str, Any]]) -> None:
+        # the snapshot lands before the log is cut, so a crash in between
+        # only replays entries the snapshot already holds
+        _write_atomic(self._snapshot_path, states)
+        self._log.close()
+        with open(self._log_path, "w", encoding="utf-8") as f:
+            f.flush()
+            os.fsync(f.fileno())
+        self._log = open(self._log_path, "a", encoding="utf-8")
+        self._log_entries = 0
+        logging.info("Compacted state log: %d clients", len(states))
+
+    def _replay(self) -> None:
+        if self._snapshot_path.exists():
+            try:
+                self._states.update(json.loads(self._snapshot_path.read_text(encoding="utf-8")))
+            except Exception:
+                logging.exception("Failed to load state snapshot: %s", self._snapshot_path)
+
+        if not self._log_path.exists():
+            return
+
+        with open(self._log_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # a torn trailing write from a crash
+                    logging.warning("Skipping corrupt state log entry")
+                    continue
+                self._states[entry["client_id"]] = entry["state"]
+                self._log_entries += 1
+
+
+class SqliteStateStore(StateStore):
+    """SQLite (WAL) table with an in-memory read cache."""
+
+    DB_NAME = "state.sqlite3"
+
+    def __init__(self, path: Path) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+        # writes run in worker threads, serialized by the lock
+        self._conn = sqlite3.connect(path / self.DB_NAME, isolation_level=None, check_same_thread=False)
+        self._lock = asyncio.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS client_state (client_id TEXT PRIMARY KEY, state TEXT NOT NULL)"
+        )
+        self._states: dict[str, dict[str, Any]] = {
+            client_id: json.loads(state)
+            for client_id, state in self._conn.execute("SELECT client_id, state FROM client_state")
+        }
+
+    def load(self, client_id: str) -> dict[str, Any] | None:
+        return self._states.get(client_id)
+
+    def import_states(self, states: dict[str, dict[str, Any]]) -> bool:
+        if self._states:
+            return False
+        # autocommit connection: one explicit transaction for the whole import
+        self._conn.execute("BEGIN")
         try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(json.dumps(payload, ensure_ascii=True, indent=2), encoding="utf-8")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO client_state (client_id, state) VALUES (?, ?)",
+                [(client_id, json.dumps(state, ensure_ascii=True)) for client_id, state in states.items()],
+            )
         except Exception:
-            logging.exception("Failed to save state file: %s", path)
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        self._states.update(states)
+        return True
+
+    async def save(self, client_id: str, state: dict[str, Any]) -> None:
+        self._states[client_id] = state
+        async with self._lock:
+            try:
+                await asyncio.to_thread(
+                    self._conn.execute,
+                    "INSERT OR REPLACE INTO client_state (client_id, state) VALUES (?, ?)",
+                    (client_id, json.dumps(state, ensure_ascii=True)),
+                )
+            except Exception:
+                logging.exception("Failed to save state for %s", client_id)
+
+    async def close(self) -> None:
+        async with self._lock:
+            self._conn.close()
+
+
+STATE_BACKENDS = {
+    "json": JsonStateStore,
+    "log": AppendLogStateStore,
+    "sqlite": SqliteStateStore,
+}
+
+
+def create_state_store(backend: str, path: Path, state_dir: Path) -> StateStore:
+    """`path` is the json backend's file or directory; the others live in `state_dir`.
+
+    On their first start the other backends import the json backend's single
+    file, so switching does not make every client report again.
+    """
+    store_class = STATE_BACKENDS.get(backend)
+    if store_class is None:
+        raise ValueError(f"Unknown state backend: {backend}")
+    if store_class is JsonStateStore:
+        return store_class(path)
+
+    store = store_class(state_dir)
+    if path.is_file():
+        try:
+            states = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            logging.exception("Failed to read %s for import", path)
+            states = None
+        if isinstance(states, dict) and store.import_states(states):
+            logging.info("Imported %d client states from %s", len(states), path)
+    return store
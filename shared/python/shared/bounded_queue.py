@@ -1,57 +1,89 @@
-from collections import deque
-import threading
 import asyncio
+import time
+from collections import deque
+from typing import Any, Callable
 
 
 class BoundedQueue:
-    def __init__(self, maxsize=100, deduplicate=True):
+    """Single event-loop queue that drops the oldest item when full.
+
+    A put never blocks or schedules anything: it appends and, if a reader
+    is parked, resolves its future. Consecutive duplicates are skipped by
+    identity, or by `key(item)` when a key function is given.
+
+    `lag()` is how long the reader has made no progress while items were
+    pending, which is what marks a stalled consumer.
+    """
+
+    __slots__ = (
+        "maxsize", "data", "deduplicate", "dropped",
+        "_key", "_last_item", "_last_key", "_waiter", "_pending_since",
+    )
+
+    def __init__(self, maxsize=100, deduplicate=True, key: Callable[[Any], Any] | None = None):
         self.maxsize = maxsize
         self.data = deque(maxlen=maxsize)
-        self.last_item = None
         self.deduplicate = deduplicate
-        self.cv = threading.Condition()
-        self.async_cv = asyncio.Condition()
-        self._loop = asyncio.get_event_loop()
+        self.dropped = 0
+        self._key = key
+        self._last_item = None
+        self._last_key = None
+        self._waiter: asyncio.Future | None = None
+        self._pending_since: float | None = None
 
     def put_nowait(self, item):
-        with self.cv:
-            if self.deduplicate and self.last_item == item:
+        if self.deduplicate and item is not None:
+            if item is self._last_item:
                 return
+            if self._key is not None:
+                item_key = self._key(item)
+                if self._last_key is not None and item_key == self._last_key:
+                    return
+                self._last_key = item_key
+            self._last_item = item
 
-            self.last_item = item
-            self.data.append(item)
-            self.cv.notify()
-        asyncio.run_coroutine_threadsafe(self._notify_async(), self._loop)
+        if len(self.data) == self.maxsize:
+            self.dropped += 1
+        elif not self.data:
+            self._pending_since = time.monotonic()
+        self.data.append(item)
 
-    async def async_put(self, item):
-        with self.cv:
-            if self.deduplicate and self.last_item == item:
-                return
-            self.last_item = item
-            self.data.append(item)
-            self.cv.notify()
+        waiter = self._waiter
+        if waiter is not None:
+            self._waiter = None
+            if not waiter.done():
+                waiter.set_result(None)
 
-        async with self.async_cv:
-            self.async_cv.notify()
+    async def async_put(self, item):
+        self.put_nowait(item)
 
-    def get(self):
-        with self.cv:
-            while not self.data:
-                self.cv.wait()
-            return self.data.popleft()
+    def get_nowait(self):
+        item = self.data.popleft()
+        self._mark_progress()
+        return item
 
     async def async_get(self):
-        if self.data:
-            return self.data.popleft()
+        while not self.data:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiter = waiter
+            try:
+                await waiter
+            finally:
+                if self._waiter is waiter:
+                    self._waiter = None
+        return self.get_nowait()
+
+    def clear(self):
+        self.data.clear()
+        self._pending_since = None
 
-        async with self.async_cv:
-            while not self.data:
-                await self.async_cv.wait()
-            return self.data.popleft()
+    def lag(self, now: float | None = None) -> float:
+        if self._pending_since is None:
+            return 0.0
+        return (time.monotonic() if now is None else now) - self._pending_since
 
-    async def _notify_async(self):
-        async with self.async_cv:
-            self.async_cv.notify()
+    def _mark_progress(self):
+        self._pending_since = time.monotonic() if self.data else None
 
     def __len__(self):
         return len(self.data)
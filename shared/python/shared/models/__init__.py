@@ -8,6 +8,7 @@ from .dashboard_config import DashboardConfig
 from .ext_data import ExtData
 from .ext_device import ExtDevice
 from .message import Message
+from .power_timeline import PowerTimeline, PowerPeriod, PowerPeriodKind
 from .station import Station
 from .station_data import StationData
 from .user import User, ReportMode
@@ -20,10 +21,10 @@ __all__ = [
     User, ReportMode, Message, Station, Building,
     StationData, ExtData, ExtDevice, DashboardConfig,
     VisitCounter, DailyVisitCounter, LookupValue,
-    LocalizableValue,
+    LocalizableValue, PowerTimeline, PowerPeriod, PowerPeriodKind,
 ]
 
 BEANIE_MODELS = [Bot, AllowedChat, ChatRequest,
     User, Message, Station, Building,
     StationData, ExtData, ExtDevice, DashboardConfig,
-    VisitCounter, DailyVisitCounter]
\ No newline at end of file
+    VisitCounter, DailyVisitCounter, PowerTimeline, PowerPeriod]
\ No newline at end of file
@@ -0,0 +1,46 @@
+from enum import Enum
+from typing import List, Optional
+from datetime import datetime
+from beanie import Document
+from beanie.odm.fields import PydanticObjectId
+from pymongo import ASCENDING, IndexModel
+
+
+class PowerPeriodKind(str, Enum):
+    AVAILABILITY = "availability"
+    GENERATOR = "generator"
+
+
+class PowerTimeline(Document):
+    building_id: PydanticObjectId
+    report_user_ids: List[PydanticObjectId] = []
+    station_id: Optional[PydanticObjectId] = None
+
+    is_available: Optional[bool] = None
+    available_since: Optional[datetime] = None
+    last_ext_data_at: Optional[datetime] = None
+
+    generator_since: Optional[datetime] = None
+    last_station_data_at: Optional[datetime] = None
+
+    class Settings:
+        name = "power_timelines"
+        indexes = [
+            IndexModel([("building_id", ASCENDING)], unique=True),
+            IndexModel([("report_user_ids", ASCENDING)]),
+            IndexModel([("station_id", ASCENDING)]),
+        ]
+
+
+class PowerPeriod(Document):
+    building_id: PydanticObjectId
+    kind: PowerPeriodKind
+    start_time: datetime
+    end_time: datetime
+    is_available: bool = True
+
+    class Settings:
+        name = "power_periods"
+        indexes = [
+            IndexModel([("building_id", ASCENDING), ("kind", ASCENDING), ("end_time", ASCENDING)]),
+        ]
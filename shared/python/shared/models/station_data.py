@@ -3,6 +3,7 @@ from typing import Optional
 
 from beanie import Document
 from beanie.odm.fields import PydanticObjectId
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 from .station import Station
 
@@ -33,6 +34,9 @@ class StationData(Document):
             "meta_field": "station_id",
             "granularity": "minutes",
         }
+        indexes = [
+            IndexModel([("station_id", ASCENDING), ("last_update_time", DESCENDING)]),
+        ]
 
     @property
     async def station(self):
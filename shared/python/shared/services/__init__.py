@@ -1,5 +1,6 @@
 from .events import EventsService, EventItem, EventsServiceConfig
 from .translation import TranslationService
-from .deye_api import BaseDeyeClient, DeyeCredentials
+from .deye_api import BaseDeyeClient, DeyeCredentials, TokenBucket
 
-__all__ = [EventsService, EventItem, EventsServiceConfig, TranslationService, BaseDeyeClient, DeyeCredentials]
\ No newline at end of file
+__all__ = [EventsService, EventItem, EventsServiceConfig, TranslationService, BaseDeyeClient, DeyeCredentials,
+           TokenBucket]
\ No newline at end of file
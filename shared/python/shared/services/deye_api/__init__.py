@@ -1,3 +1,4 @@
 from .client import BaseDeyeClient, DeyeCredentials
+from .rate_limiter import TokenBucket
 
-__all__ = ["BaseDeyeClient", "DeyeCredentials"]
+__all__ = ["BaseDeyeClient", "DeyeCredentials", "TokenBucket"]
@@ -1,10 +1,13 @@
+import asyncio
 import hashlib
 import logging
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, AsyncIterator, Iterable
 import aiohttp
 from aiohttp import ClientSession
 
+from .rate_limiter import TokenBucket
+
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +24,14 @@ class DeyeCredentials:
 class BaseDeyeClient:
     """Framework-agnostic Deye API client."""
 
-    def __init__(self, creds: DeyeCredentials, session: ClientSession | None = None):
+    def __init__(
+        self,
+        creds: DeyeCredentials,
+        session: ClientSession | None = None,
+        rate_limiter: TokenBucket | None = None,
+    ):
         self._creds = creds
+        self._rate_limiter = rate_limiter
         self._session = session
         self._owns_session = session is None
         self._token: str | None = None
@@ -69,6 +78,8 @@ class BaseDeyeClient:
         self._set_authorization_token(headers, self._token)
 
         for attempt in range(2):
+            if self._rate_limiter:
+                await self._rate_limiter.acquire()
             try:
                 async with self._session.request(method, url, json=payload, headers=headers) as resp:
                     if resp.status == 401 and attempt == 0:
@@ -94,5 +105,61 @@ class BaseDeyeClient:
     async def get_station_list(self, page: int = 1, size: int = 30) -> dict[str, Any] | None:
         return await self.request("POST", "/station/list", {"page": page, "size": size})
 
+    async def iter_station_pages(self, size: int = 30) -> AsyncIterator[dict[str, Any]]:
+        """Yields /station/list pages until `total` stations have been seen.
+
+        A failed page is yielded as-is and ends the iteration.
+        """
+        page = 1
+        seen = 0
+        while True:
+            data = await self.get_station_list(page, size)
+            yield data
+            if data is None or not data.get("success", False):
+                return
+
+            stations = data.get("stationList") or []
+            seen += len(stations)
+            if not stations or seen >= int(data.get("total") or 0):
+                return
+            page += 1
+
+    async def iter_stations(self, size: int = 30) -> AsyncIterator[dict[str, Any]]:
+        """Yields every station; raises ConnectionError if a page fails, rather than ending early."""
+        async for data in self.iter_station_pages(size):
+            if data is None or not data.get("success", False):
+                raise ConnectionError(f"Cannot list stations: {data.get('msg') if data else 'No data'}")
+            for station in data.get("stationList") or []:
+                yield station
+
     async def get_station_data(self, station_id: int) -> dict[str, Any] | None:
         return await self.request("POST", "/station/latest", {"stationId": station_id})
+
+    async def iter_stations_data(
+        self,
+        station_ids: Iterable[int],
+        concurrency: int = 5,
+        timeout: float | None = None,
+    ) -> AsyncIterator[tuple[int, dict[str, Any] | None]]:
+        """Yields `(station_id, data)` as responses arrive.
+
+        /station/latest takes a single station, so the fleet is covered with
+        at most `concurrency` requests in flight instead of one at a time.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(station_id: int):
+            async with semaphore:
+                try:
+                    return station_id, await asyncio.wait_for(self.get_station_data(station_id), timeout)
+                except asyncio.TimeoutError:
+                    logger.warning(f"Timed out fetching data for station {station_id}")
+                    return station_id, None
+
+        tasks = [asyncio.create_task(fetch(station_id)) for station_id in station_ids]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -1,4 +1,5 @@
 from .service import EventsService
-from .models import EventItem, EventsServiceConfig
+from .models import EventFrame, EventItem, EventsServiceConfig
+from .encoding import StreamEncoder
 
-__all__ = ["EventsService", "EventItem", "EventsServiceConfig"]
+__all__ = ["EventsService", "EventFrame", "EventItem", "EventsServiceConfig", "StreamEncoder"]
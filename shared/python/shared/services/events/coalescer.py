@@ -0,0 +1,78 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Hashable, Tuple
+
+from .models import EventItem
+
+
+logger = logging.getLogger(__name__)
+
+
+PublishCallback = Callable[[str, EventItem], Awaitable[None]]
+CoalesceKey = Tuple[str, Hashable]
+
+
+class EventCoalescer:
+    """Merges repeated events per (channel, key) within a time window.
+
+    The first event of a burst is published at once and opens the window;
+    anything arriving while it is open replaces the pending event, which is
+    published when the window closes (last one wins). A burst therefore costs
+    at most one event per window instead of one per call.
+
+    Without an explicit key only events without data are merged, by type:
+    two events of one type may carry different payloads, and dropping either
+    would lose information.
+    """
+
+    def __init__(self, window_seconds: float, publish: PublishCallback):
+        self.window_seconds = window_seconds
+        self.merged = 0
+        self._publish = publish
+        self._pending: Dict[CoalesceKey, EventItem] = {}
+        self._windows: Dict[CoalesceKey, asyncio.Task] = {}
+
+    async def submit(self, channel: str, event: EventItem, key: Hashable = None):
+        if self.window_seconds <= 0 or (key is None and event.data is not None):
+            await self._publish(channel, event)
+            return
+
+        window_key = (channel, event.type if key is None else key)
+        if window_key in self._windows:
+            if window_key in self._pending:
+                self.merged += 1
+            self._pending[window_key] = event
+            return
+
+        self._windows[window_key] = asyncio.create_task(self._hold_window(window_key))
+        await self._publish(channel, event)
+
+    async def flush(self):
+        """Publishes every pending event now and closes all windows."""
+        for task in self._windows.values():
+            task.cancel()
+        self._windows.clear()
+
+        pending, self._pending = self._pending, {}
+        for (channel, _), event in pending.items():
+            try:
+                await self._publish(channel, event)
+            except Exception:
+                logger.exception(f"Cannot publish coalesced event '{event.type}'")
+
+    async def _hold_window(self, window_key: CoalesceKey):
+        channel = window_key[0]
+        try:
+            while True:
+                await asyncio.sleep(self.window_seconds)
+                event = self._pending.pop(window_key, None)
+                if event is None:
+                    break
+                await self._publish(channel, event)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception(f"Cannot publish coalesced event on '{channel}'")
+        finally:
+            if self._windows.get(window_key) is asyncio.current_task():
+                del self._windows[window_key]
@@ -0,0 +1,43 @@
+import zlib
+
+from .models import EventFrame
+
+
+class StreamEncoder:
+    """Per-connection SSE encoding the client opted into.
+
+    `compact` selects EventFrame's short-key JSON. `deflate` runs the whole
+    stream through one zlib context, sync-flushed after every frame so no
+    event is held back; the small window keeps it at a few KB per client.
+    """
+
+    DEFLATE_LEVEL = 6
+    DEFLATE_WBITS = 10
+    DEFLATE_MEM_LEVEL = 2
+
+    def __init__(self, compact: bool = False, deflate: bool = False):
+        self.compact = compact
+        self._compressor = zlib.compressobj(
+            self.DEFLATE_LEVEL,
+            zlib.DEFLATED,
+            self.DEFLATE_WBITS,
+            self.DEFLATE_MEM_LEVEL,
+        ) if deflate else None
+
+    @classmethod
+    def negotiate(cls, compact: bool, deflate: bool, accept_encoding: str | None) -> "StreamEncoder":
+        accepted = {
+            token.split(";")[0].strip().lower()
+            for token in (accept_encoding or "").split(",")
+        }
+        return cls(compact, deflate and "deflate" in accepted)
+
+    @property
+    def headers(self) -> dict:
+        return {"Content-Encoding": "deflate"} if self._compressor else {}
+
+    def encode(self, frame: EventFrame, user: str | None = None) -> bytes:
+        data = frame.encode(user, self.compact)
+        if self._compressor is None:
+            return data
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
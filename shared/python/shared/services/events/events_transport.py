@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Callable, Dict, List, Tuple
 
 from .models import EventItem
 
@@ -7,16 +7,35 @@ from .models import EventItem
 class EventsTransport(ABC):
 
     @abstractmethod
-    async def publish(self, channel: str, event: EventItem):
+    async def publish(self, channel: str, event: EventItem, sequenced: bool = False):
+        """Publishes the event; a sequenced one gets the channel's next `seq` first."""
         pass
 
     @abstractmethod
     async def start_subscriber(self, handler: Callable[[str, EventItem], None]):
         pass
 
+    async def replay(self, channel: str, after_id: str) -> List[Tuple[str, EventItem]] | None:
+        """(channel, event) pairs stored after `after_id`, or None when they cannot be replayed."""
+        return None
+
+    async def store_stats(self, worker_id: str, stats: dict, ttl: float):
+        """Shares this worker's stats with the others for `ttl` seconds."""
+        pass
+
+    async def load_stats(self, ttl: float) -> Dict[str, dict] | None:
+        """Stats of every live worker by worker id, or None when they are not shared."""
+        return None
+
 
 class LocalTransport(EventsTransport):
-    async def publish(self, channel, event):
+    def __init__(self):
+        self.handler = None
+        self._sequences: Dict[str, int] = {}
+
+    async def publish(self, channel, event, sequenced=False):
+        if sequenced:
+            event.seq = self._sequences[channel] = self._sequences.get(channel, 0) + 1
         if self.handler:
             await self.handler(channel, event)
 
@@ -1,16 +1,56 @@
+import json
 from dataclasses import dataclass
+from typing import Dict, Tuple
 
 
 class EventsServiceConfig:
     redis_uri: str
     is_debug: bool
+    max_lag_seconds: float
+    coalesce_window_seconds: float
+    transport: str
+    stream_maxlen: int
+    redis_max_connections: int
+    publish_queue_size: int
+    publish_overflow: str
+    reconnect_delay_ms: Tuple[int, int]
+    serve_private: bool
+    drain_seconds: float
 
-    def __init__(self, redis_uri: str, is_debug: bool):
+    def __init__(
+        self,
+        redis_uri: str,
+        is_debug: bool,
+        max_lag_seconds: float = 30,
+        coalesce_window_seconds: float = 0.5,
+        transport: str = "pubsub",
+        stream_maxlen: int = 10000,
+        redis_max_connections: int = 10,
+        publish_queue_size: int = 10000,
+        publish_overflow: str = "drop_oldest",
+        reconnect_delay_ms: Tuple[int, int] = (1000, 15000),
+        serve_private: bool = True,
+        drain_seconds: float = 8,
+    ):
         self.redis_uri = redis_uri
         self.is_debug = is_debug
+        self.max_lag_seconds = max_lag_seconds
+        self.coalesce_window_seconds = coalesce_window_seconds
+        self.transport = transport
+        self.stream_maxlen = stream_maxlen
+        self.redis_max_connections = redis_max_connections
+        self.publish_queue_size = publish_queue_size
+        self.publish_overflow = publish_overflow
+        self.reconnect_delay_ms = reconnect_delay_ms
+        self.serve_private = serve_private
+        self.drain_seconds = drain_seconds
 
     def __str__(self):
-        return (f'EventsServiceConfig(redis={self.redis_uri}, debug={self.is_debug})')
+        return (
+            f'EventsServiceConfig(redis={self.redis_uri}, debug={self.is_debug}, '
+            f'max_lag={self.max_lag_seconds}, coalesce_window={self.coalesce_window_seconds}, '
+            f'transport={self.transport})'
+        )
 
 
 @dataclass
@@ -19,11 +59,110 @@ class EventItem:
     data: dict
     private: bool
     user: str = None
+    seq: int = None
+    id: str = None
 
     def to_dict(self):
         return {
             "type": self.type,
             "data": self.data,
             "private": self.private,
-            "user": self.user
+            "user": self.user,
+            "seq": self.seq,
         }
+
+
+def stream_id_key(event_id: str) -> Tuple[int, int]:
+    """Orders Redis stream ids ("<ms>-<seq>")."""
+    ms, _, seq = event_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+PING_EVENT = "ping"
+
+
+class EventFrame:
+    """Pre-encoded SSE frame of one event, shared by every listener.
+
+    The anonymous frame is encoded once; frames carrying a `user` or the
+    compact encoding are built on first use and cached. `retry` (ms)
+    becomes the SSE reconnection-delay hint. Pings are sent as a bare SSE
+    comment, which keeps the connection alive without waking `onmessage`.
+    """
+
+    __slots__ = ("event", "retry", "_anonymous", "_variants")
+
+    KEEPALIVE = b":\n\n"
+
+    def __init__(self, event: EventItem, retry: int | None = None):
+        self.event = event
+        self.retry = retry
+        self._anonymous: bytes | None = None
+        self._variants: Dict[Tuple[str | None, bool], bytes] = {}
+
+    @property
+    def type(self) -> str:
+        return self.event.type
+
+    @property
+    def private(self) -> bool:
+        return self.event.private
+
+    def encode(self, user: str | None = None, compact: bool = False) -> bytes:
+        if user is None and not compact:
+            if self._anonymous is None:
+                self._anonymous = self._build(None, False)
+            return self._anonymous
+
+        key = (user, compact)
+        frame = self._variants.get(key)
+        if frame is None:
+            frame = self._variants[key] = self._build(user, compact)
+        return frame
+
+    def dedup_key(self) -> bytes:
+        return self.encode(None)
+
+    def published_after(self, event_id: str | None) -> bool:
+        if event_id is None or self.event.id is None:
+            return True
+        return stream_id_key(self.event.id) > stream_id_key(event_id)
+
+    def _build(self, user: str | None, compact: bool) -> bytes:
+        if self.event.type == PING_EVENT:
+            return self.KEEPALIVE
+
+        if compact:
+            # one-letter keys, defaults left out
+            payload = {"t": self.event.type}
+            if self.event.data is not None:
+                payload["d"] = self.event.data
+            if self.event.private:
+                payload["p"] = 1
+            if user is not None:
+                payload["u"] = user
+            if self.event.seq is not None:
+                payload["s"] = self.event.seq
+            data = json.dumps(payload, separators=(",", ":"))
+        else:
+            data = json.dumps({
+                "type": self.event.type,
+                "data": self.event.data,
+                "private": self.event.private,
+                "user": user,
+                "seq": self.event.seq,
+            })
+
+        frame = f"data: {data}\n\n"
+        if self.event.id is not None:
+            frame = f"id: {self.event.id}\n{frame}"
+        if self.retry is not None:
+            frame = f"retry: {self.retry}\n{frame}"
+        return frame.encode("utf-8")
+
+    def __eq__(self, other):
+        if isinstance(other, EventFrame):
+            return self.event == other.event
+        return NotImplemented
+
+    __hash__ = None
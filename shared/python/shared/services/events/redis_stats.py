@@ -0,0 +1,34 @@
+import json
+import time
+from typing import Dict
+
+
+class RedisStatsMixin:
+    """Per-worker stats in one Redis hash, so any worker can report them all.
+
+    Every field carries its report time; a worker that stopped reporting
+    (killed, scaled down) is dropped once its entry is older than the TTL.
+    """
+
+    STATS_KEY = "sse_stats"
+
+    async def store_stats(self, worker_id: str, stats: dict, ttl: float):
+        payload = json.dumps({"reported_at": time.time(), **stats})
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hset(self.STATS_KEY, worker_id, payload)
+            pipe.expire(self.STATS_KEY, max(int(ttl), 1))
+            await pipe.execute()
+
+    async def load_stats(self, ttl: float) -> Dict[str, dict] | None:
+        entries = await self.redis.hgetall(self.STATS_KEY)
+        threshold = time.time() - ttl
+        stats, stale = {}, []
+        for worker_id, payload in entries.items():
+            report = json.loads(payload)
+            if report.pop("reported_at", 0) < threshold:
+                stale.append(worker_id)
+            else:
+                stats[worker_id] = report
+        if stale:
+            await self.redis.hdel(self.STATS_KEY, *stale)
+        return stats
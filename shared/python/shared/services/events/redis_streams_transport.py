@@ -0,0 +1,171 @@
+import json
+import asyncio
+import logging
+from typing import Dict, List, Tuple
+from redis.asyncio import Redis, ConnectionError, TimeoutError
+
+from .events_transport import EventsTransport
+from .models import EventItem, stream_id_key
+from .redis_stats import RedisStatsMixin
+
+
+logger = logging.getLogger(__name__)
+
+
+class RedisStreamsTransport(RedisStatsMixin, EventsTransport):
+    """Events kept in capped Redis Streams, so readers resume from a cursor.
+
+    `streams` maps every channel to the stream it is appended to; channels
+    sharing a stream share one id space, which is what SSE replay relies on.
+    """
+
+    SEQUENCE_KEY_PREFIX = "sse_seq:"
+    READ_BLOCK_MS = 5000
+    READ_COUNT = 500
+    REPLAY_LIMIT = 1000
+
+    # same contract as RedisTransport: the seq is numbered in the order the
+    # entries land in the stream
+    SEQUENCED_XADD_SCRIPT = """
+local seq = redis.call('INCR', KEYS[2])
+local payload = '{"seq": ' .. seq .. ', ' .. string.sub(ARGV[3], 2)
+local id = redis.call('XADD', KEYS[1], 'MAXLEN', '~', ARGV[1], '*', 'channel', ARGV[2], 'payload', payload)
+return {seq, id}
+"""
+
+    def __init__(self, redis_uri: str, streams: Dict[str, str], maxlen: int = 10000):
+        self.redis_uri = redis_uri
+        self.redis = Redis.from_url(redis_uri, decode_responses=True)
+        self.streams = streams
+        self.maxlen = maxlen
+        self._subscriber_task = None
+        self._stopped = False
+        self._sequenced_xadd = self.redis.register_script(self.SEQUENCED_XADD_SCRIPT)
+
+    async def publish(self, channel: str, event: EventItem, sequenced: bool = False):
+        stream = self.streams[channel]
+        payload = event.to_dict()
+        if sequenced:
+            payload.pop("seq")
+        payload = json.dumps(payload)
+
+        delay = 0.5
+        while True:
+            try:
+                if sequenced:
+                    event.seq, event.id = await self._sequenced_xadd(
+                        keys=[stream, f"{self.SEQUENCE_KEY_PREFIX}{channel}"],
+                        args=[self.maxlen, channel, payload],
+                        client=self.redis,
+                    )
+                else:
+                    event.id = await self.redis.xadd(
+                        stream,
+                        {"channel": channel, "payload": payload},
+                        maxlen=self.maxlen,
+                        approximate=True,
+                    )
+                return
+            except (ConnectionError, TimeoutError):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 5)
+                self.redis = Redis.from_url(self.redis_uri, decode_responses=True)
+
+    async def start_subscriber(self, handler):
+        if self._subscriber_task:
+            return
+
+        self._subscriber_task = asyncio.create_task(
+            self._subscriber_loop(handler)
+        )
+
+    async def replay(self, channel: str, after_id: str) -> List[Tuple[str, EventItem]] | None:
+        stream = self.streams[channel]
+        try:
+            after = stream_id_key(after_id)
+            first = await self.redis.xrange(stream, count=1)
+            if first and stream_id_key(first[0][0]) > after:
+                # the stream was trimmed past the client's cursor
+                return None
+
+            entries = await self.redis.xrange(stream, min=f"({after_id}", count=self.REPLAY_LIMIT + 1)
+        except (ValueError, ConnectionError, TimeoutError) as e:
+            logger.warning(f"[RedisStreamsTransport] Cannot replay after {after_id}: {e}")
+            return None
+
+        if len(entries) > self.REPLAY_LIMIT:
+            return None
+        return [self._parse_entry(entry_id, fields) for entry_id, fields in entries]
+
+    async def _subscriber_loop(self, handler):
+        cursors = await self._initial_cursors()
+        backoff = 1.0
+
+        while not self._stopped:
+            try:
+                response = await self.redis.xread(cursors, count=self.READ_COUNT, block=self.READ_BLOCK_MS)
+                for stream, entries in response or []:
+                    for entry_id, fields in entries:
+                        # a failing entry is logged and skipped; letting it
+                        # escape would drop the rest of the batch, and
+                        # retrying it would stall the stream behind it
+                        try:
+                            channel, event = self._parse_entry(entry_id, fields)
+                            await handler(channel, event)
+                        except asyncio.CancelledError:
+                            raise
+                        except Exception:
+                            logger.exception(f"[RedisStreamsTransport] Cannot handle entry {entry_id} on {stream}")
+                        cursors[stream] = entry_id
+                backoff = 1.0
+
+            except (ConnectionError, TimeoutError) as e:
+                # the cursors survive, so the reconnect resumes where it stopped
+                logger.warning(f"[RedisStreamsTransport] Lost connection: {e}. Reconnecting in {backoff:.1f}s...")
+
+                await asyncio.sleep(backoff)
+
+                self.redis = Redis.from_url(self.redis_uri, decode_responses=True)
+
+                backoff = min(backoff * 2, 10)
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                logger.error(f"[RedisStreamsTransport] Subscriber error: {e}. Recovering in 1s...")
+                await asyncio.sleep(1)
+
+    async def _initial_cursors(self) -> Dict[str, str]:
+        cursors = {}
+        for stream in set(self.streams.values()):
+            while not self._stopped:
+                try:
+                    last = await self.redis.xrevrange(stream, count=1)
+                    cursors[stream] = last[0][0] if last else "0-0"
+                    break
+                except (ConnectionError, TimeoutError) as e:
+                    logger.warning(f"[RedisStreamsTransport] Cannot read {stream}: {e}. Retrying in 1s...")
+                    await asyncio.sleep(1)
+                    self.redis = Redis.from_url(self.redis_uri, decode_responses=True)
+        return cursors
+
+    def _parse_entry(self, entry_id: str, fields: Dict[str, str]) -> Tuple[str, EventItem]:
+        payload = json.loads(fields["payload"])
+        event = EventItem(
+            type=payload["type"],
+            data=payload.get("data"),
+            private=payload.get("private"),
+            seq=payload.get("seq"),
+            id=entry_id,
+        )
+        return fields["channel"], event
+
+    async def stop(self):
+        self._stopped = True
+        try:
+            await self.redis.close()
+        except:
+            pass
+        if self._subscriber_task:
+            self._subscriber_task.cancel()
@@ -1,36 +1,130 @@
 import json
 import asyncio
 import logging
-from redis.asyncio import Redis, ConnectionError, TimeoutError
+from redis.asyncio import BlockingConnectionPool, Redis, ConnectionError, TimeoutError
 
 from .events_transport import EventsTransport
 from .models import EventItem
+from .redis_stats import RedisStatsMixin
+from ...bounded_queue import BoundedQueue
 
 
 logger = logging.getLogger(__name__)
 
 
-class RedisTransport(EventsTransport):
+class RedisTransport(RedisStatsMixin, EventsTransport):
+    """Redis pub/sub transport with a background, pipelined publisher.
+
+    `publish` only encodes the event and queues it; one task drains the
+    queue in batches, one pipeline round trip per batch, over a bounded
+    connection pool. While Redis is down the batch is retried and the queue
+    absorbs new events up to `queue_size`, then `overflow` decides whether
+    the oldest ("drop_oldest") or the incoming ("drop_newest") event is lost.
+    """
+
+    SEQUENCE_KEY_PREFIX = "sse_seq:"
+    BATCH_SIZE = 100
+    STOP_FLUSH_TIMEOUT = 5
+
+    # INCR and PUBLISH run as one script, so replicas can never deliver
+    # sequence numbers out of order; the payload arrives without "seq"
+    SEQUENCED_PUBLISH_SCRIPT = """
+local seq = redis.call('INCR', KEYS[1])
+redis.call('PUBLISH', ARGV[1], '{"seq": ' .. seq .. ', ' .. string.sub(ARGV[2], 2))
+return seq
+"""
+
+    def __init__(
+        self,
+        redis_uri: str,
+        *channels: str,
+        max_connections: int = 10,
+        queue_size: int = 10000,
+        overflow: str = "drop_oldest",
+    ):
+        if overflow not in ("drop_oldest", "drop_newest"):
+            raise ValueError(f"Unknown publish overflow policy: {overflow}")
 
-    def __init__(self, redis_uri: str, *channels: str):
         self.redis_uri = redis_uri
-        self.redis = Redis.from_url(redis_uri, decode_responses=True)
+        self.pool = BlockingConnectionPool.from_url(
+            redis_uri,
+            max_connections=max_connections,
+            decode_responses=True,
+        )
+        self.redis = Redis(connection_pool=self.pool)
         self.channels = channels
+        self.overflow = overflow
         self._subscriber_task = None
+        self._publisher_task: asyncio.Task | None = None
+        self._outgoing = BoundedQueue(maxsize=queue_size, deduplicate=False)
+        self._dropped_newest = 0
         self._stopped = False
+        self._sequenced_publish = self.redis.register_script(self.SEQUENCED_PUBLISH_SCRIPT)
+
+    @property
+    def dropped(self) -> int:
+        return self._outgoing.dropped + self._dropped_newest
 
-    async def publish(self, channel: str, event: EventItem):
-        payload = json.dumps(event.to_dict())
+    @property
+    def backlog(self) -> int:
+        return len(self._outgoing)
 
+    async def publish(self, channel: str, event: EventItem, sequenced: bool = False):
+        payload = event.to_dict()
+        if sequenced:
+            payload.pop("seq")
+
+        if self.overflow == "drop_newest" and len(self._outgoing) >= self._outgoing.maxsize:
+            self._dropped_newest += 1
+            return
+
+        self._outgoing.put_nowait((channel, json.dumps(payload), sequenced))
+        if self._publisher_task is None:
+            self._publisher_task = asyncio.create_task(self._publisher_loop())
+
+    async def _publisher_loop(self):
+        while True:
+            batch = [await self._outgoing.async_get()]
+            while len(batch) < self.BATCH_SIZE and len(self._outgoing):
+                batch.append(self._outgoing.get_nowait())
+
+            # None is the stop marker; everything queued before it still goes out
+            stop = None in batch
+            batch = [item for item in batch if item is not None]
+            if batch:
+                await self._publish_batch(batch)
+            if stop:
+                return
+
+    async def _publish_batch(self, batch):
         delay = 0.5
         while True:
             try:
-                await self.redis.publish(channel, payload)
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for channel, payload, sequenced in batch:
+                        if sequenced:
+                            await self._sequenced_publish(
+                                keys=[f"{self.SEQUENCE_KEY_PREFIX}{channel}"],
+                                args=[channel, payload],
+                                client=pipe,
+                            )
+                        else:
+                            pipe.publish(channel, payload)
+                    await pipe.execute()
                 return
-            except (ConnectionError, TimeoutError):
+            except (ConnectionError, TimeoutError) as e:
+                if self._stopped:
+                    logger.warning(f"[RedisTransport] Dropping {len(batch)} events on stop: {e}")
+                    return
+                logger.warning(
+                    f"[RedisTransport] Cannot publish {len(batch)} events: {e}. "
+                    f"Retrying in {delay:.1f}s ({len(self._outgoing)} queued)..."
+                )
                 await asyncio.sleep(delay)
                 delay = min(delay * 2, 5)
-                self.redis = Redis.from_url(self.redis_uri, decode_responses=True)
+            except Exception:
+                logger.exception(f"[RedisTransport] Dropping {len(batch)} events after publish error")
+                return
 
     async def start_subscriber(self, handler):
         if self._subscriber_task:
@@ -45,33 +139,35 @@ class RedisTransport(EventsTransport):
 
         while not self._stopped:
             try:
-                pubsub = self.redis.pubsub()
-                await pubsub.subscribe(*self.channels)
+                # closing the pubsub hands its connection back to the bounded
+                # pool; a reconnect would otherwise leak one per attempt
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(*self.channels)
 
-                async for message in pubsub.listen():
-                    if message is None:
-                        continue
-                    if message["type"] != "message":
-                        continue
+                    async for message in pubsub.listen():
+                        if message is None:
+                            continue
+                        if message["type"] != "message":
+                            continue
 
-                    payload = json.loads(message["data"])
-                    event = EventItem(
-                        type=payload["type"],
-                        data=payload.get("data"),
-                        private=payload.get("private"),
-                    )
+                        payload = json.loads(message["data"])
+                        event = EventItem(
+                            type=payload["type"],
+                            data=payload.get("data"),
+                            private=payload.get("private"),
+                            seq=payload.get("seq"),
+                        )
 
-                    await handler(message["channel"], event)
+                        await handler(message["channel"], event)
 
-                raise ConnectionError("Redis pubsub listener ended unexpectedly")
+                    raise ConnectionError("Redis pubsub listener ended unexpectedly")
 
             except (ConnectionError, TimeoutError) as e:
                 logger.warning(f"[RedisTransport] Lost connection: {e}. Reconnecting in {backoff:.1f}s...")
 
+                # the pool drops broken connections and dials new ones
                 await asyncio.sleep(backoff)
 
-                self.redis = Redis.from_url(self.redis_uri, decode_responses=True)
-
                 backoff = min(backoff * 2, 10)
 
             except Exception as e:
@@ -81,8 +177,15 @@ class RedisTransport(EventsTransport):
 
     async def stop(self):
         self._stopped = True
+        if self._publisher_task:
+            self._outgoing.put_nowait(None)
+            try:
+                await asyncio.wait_for(self._publisher_task, self.STOP_FLUSH_TIMEOUT)
+            except (asyncio.TimeoutError, Exception):
+                logger.warning(f"[RedisTransport] {len(self._outgoing)} events left unpublished on stop")
         try:
-            await self.redis.close()
+            await self.redis.aclose()
+            await self.pool.aclose()
         except:
             pass
         if self._subscriber_task:
@@ -1,29 +1,82 @@
-from typing import Set
+from typing import Awaitable, Callable, Hashable, List, Set
 import asyncio
+import logging
+import math
+import os
+import random
+import socket
+import time
 
-from .models import EventItem, EventsServiceConfig
+from .coalescer import EventCoalescer
+from .models import PING_EVENT, EventFrame, EventItem, EventsServiceConfig
 from .events_transport import EventsTransport, LocalTransport
+from .redis_streams_transport import RedisStreamsTransport
 from .redis_transport import RedisTransport
+from .stats import EventsStats
 from ...bounded_queue import BoundedQueue
 
 
+logger = logging.getLogger(__name__)
+
+
+InternalEventHandler = Callable[[EventItem], Awaitable[None]]
+
+
 class EventsService:
     REDIS_PUBLIC_CHANNEL = "sse_public"
     REDIS_PRIVATE_CHANNEL = "sse_private"
+    REDIS_INTERNAL_CHANNEL = "internal"
+    REDIS_SSE_STREAM = "sse_stream"
+    REDIS_INTERNAL_STREAM = "internal_stream"
+    RESYNC_EVENT = "resync"
+    DRAIN_BATCH_INTERVAL = 0.25
+    STATS_REPORT_INTERVAL = 5
+    STATS_TTL = 15
+    # identical on every worker (each one sees every event), or percentiles
+    # that cannot be added up: the cluster figure is the worst worker's
+    MAX_STATS = ("max_lag_seconds", "events_total", "events_per_second", "fanout_p50_ms", "fanout_p99_ms")
 
     def __init__(self, config: EventsServiceConfig):
+        channels = [self.REDIS_PUBLIC_CHANNEL, self.REDIS_INTERNAL_CHANNEL]
+        if config.serve_private:
+            channels.insert(1, self.REDIS_PRIVATE_CHANNEL)
+
         if config.is_debug:
             self.transport: EventsTransport = LocalTransport()
+        elif config.transport == "streams":
+            # public and private share a stream, so one SSE id orders both
+            self.transport: EventsTransport = RedisStreamsTransport(
+                config.redis_uri,
+                {
+                    self.REDIS_PUBLIC_CHANNEL: self.REDIS_SSE_STREAM,
+                    self.REDIS_PRIVATE_CHANNEL: self.REDIS_SSE_STREAM,
+                    self.REDIS_INTERNAL_CHANNEL: self.REDIS_INTERNAL_STREAM,
+                },
+                config.stream_maxlen,
+            )
         else:
             self.transport: EventsTransport = RedisTransport(
                 config.redis_uri,
-                self.REDIS_PUBLIC_CHANNEL,
-                self.REDIS_PRIVATE_CHANNEL,
+                *channels,
+                max_connections = config.redis_max_connections,
+                queue_size      = config.publish_queue_size,
+                overflow        = config.publish_overflow,
             )
 
         self._public_clients: Set[BoundedQueue] = set()
         self._private_clients: Set[BoundedQueue] = set()
+        self._internal_handlers: List[InternalEventHandler] = []
         self._subscriber_task: asyncio.Task | None = None
+        self._max_lag_seconds = config.max_lag_seconds
+        self._reconnect_delay_ms = config.reconnect_delay_ms
+        self._drain_seconds = config.drain_seconds
+        self._drain_task: asyncio.Task | None = None
+        self.draining = False
+        self.serve_private = config.serve_private
+        self._coalescer = EventCoalescer(config.coalesce_window_seconds, self._publish_sequenced)
+        self.stats = EventsStats()
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._stats_task: asyncio.Task | None = None
 
     async def start(self):
         if self._subscriber_task:
@@ -33,17 +86,56 @@ class EventsService:
             self.transport.start_subscriber(self._handle_incoming_event)
         )
 
+    def start_stats_reporter(self):
+        """Publishes `get_stats` periodically, for `get_cluster_stats` on any worker."""
+        if self._stats_task is None:
+            self._stats_task = asyncio.create_task(self._report_stats())
+
+    async def _report_stats(self):
+        while True:
+            try:
+                await self.transport.store_stats(self.worker_id, self.get_stats(), self.STATS_TTL)
+            except Exception as e:
+                logger.warning(f"Failed to report SSE stats: {e}")
+            await asyncio.sleep(self.STATS_REPORT_INTERVAL)
+
     async def request_shutdown(self):
-        shutdown_event = EventItem("shutdown", None, False)
+        if self._drain_task is None:
+            self._drain_task = asyncio.create_task(self.drain())
 
-        for clients in (self._public_clients, self._private_clients):
-            for q in clients:
-                try:
-                    q.put_nowait(shutdown_event)
-                except Exception:
-                    pass
+    async def drain(self, deadline: float | None = None):
+        """Refuses new streams and closes the open ones in paced batches within `deadline` seconds."""
+        self.draining = True
+        deadline = self._drain_seconds if deadline is None else deadline
+
+        clients = list(self._public_clients | self._private_clients)
+        batches = max(1, int(deadline / self.DRAIN_BATCH_INTERVAL))
+        batch_size = max(1, math.ceil(len(clients) / batches))
+        logger.info(f"Draining {len(clients)} SSE clients in batches of {batch_size} over {deadline}s")
+
+        # every client also gets its own retry delay, so a restart does not
+        # bring the whole audience back to the remaining replicas at once
+        low, high = self._reconnect_delay_ms
+        for start in range(0, len(clients), batch_size):
+            if start:
+                await asyncio.sleep(self.DRAIN_BATCH_INTERVAL)
+            for q in clients[start:start + batch_size]:
+                self._detach(q)
+                retry = random.randint(low, high)
+                q.put_nowait(EventFrame(EventItem("shutdown", {"retry": retry}, False), retry=retry))
+                q.put_nowait(None)
+
+    def retry_after(self) -> int:
+        """Seconds a client refused while draining should wait."""
+        low, high = self._reconnect_delay_ms
+        return max(1, random.randint(low, high) // 1000)
 
     async def shutdown(self):
+        if self._drain_task:
+            await self._drain_task
+        await self._coalescer.flush()
+        if self._stats_task:
+            self._stats_task.cancel()
         if hasattr(self.transport, "stop"):
             await self.transport.stop()
         await self.cleanup_all()
@@ -52,37 +144,154 @@ class EventsService:
         self._public_clients.add(q)
 
     def add_private_client(self, q: BoundedQueue):
-        self._private_clients.add(q)
+        if self.serve_private:
+            self._private_clients.add(q)
 
     def remove_client(self, q: BoundedQueue):
+        if self._detach(q):
+            self.stats.disconnected_total += 1
+
+    def _detach(self, q: BoundedQueue) -> bool:
+        attached = q in self._public_clients or q in self._private_clients
         self._public_clients.discard(q)
         self._private_clients.discard(q)
+        if attached:
+            self.stats.dropped_closed += q.dropped
+        return attached
+
+    def get_stats(self) -> dict:
+        clients = self._public_clients | self._private_clients
+        now = time.monotonic()
+        return {
+            "subscribers": len(clients),
+            "private_subscribers": len(self._private_clients),
+            "queued_frames": sum(len(q) for q in clients),
+            "max_lag_seconds": round(max((q.lag(now) for q in clients), default=0.0), 3),
+            "events_total": self.stats.events_total,
+            "events_per_second": round(self.stats.events_per_second(now), 3),
+            "frames_total": self.stats.frames_total,
+            "dropped_frames": self.stats.dropped_closed + sum(q.dropped for q in clients),
+            "evicted_total": self.stats.evicted_total,
+            "disconnected_total": self.stats.disconnected_total,
+            "fanout_p50_ms": round(self.stats.fanout_percentile(50) * 1000, 3),
+            "fanout_p99_ms": round(self.stats.fanout_percentile(99) * 1000, 3),
+            "coalesced_total": self._coalescer.merged,
+            "publish_backlog": getattr(self.transport, "backlog", 0),
+            "publish_dropped": getattr(self.transport, "dropped", 0),
+        }
 
-    async def broadcast_public(self, type: str, data: dict = None):
+    async def get_cluster_stats(self) -> dict:
+        """`get_stats` summed over every live worker, with the per-worker figures.
+
+        Falls back to this worker alone when the transport does not share
+        stats or Redis is unreachable.
+        """
+        own = self.get_stats()
+        try:
+            workers = await self.transport.load_stats(self.STATS_TTL)
+        except Exception as e:
+            logger.warning(f"Failed to load SSE stats: {e}")
+            workers = None
+        workers = dict(workers or {})
+        # this worker's figures are fresher than its last report
+        workers[self.worker_id] = own
+
+        totals = {}
+        for key in own:
+            values = [stats.get(key, 0) for stats in workers.values()]
+            totals[key] = max(values) if key in self.MAX_STATS else round(sum(values), 3)
+        return {
+            "worker_id": self.worker_id,
+            "workers": len(workers),
+            **totals,
+            "per_worker": workers,
+        }
+
+    async def replay(self, last_event_id: str, include_private: bool) -> List[EventFrame]:
+        """Frames a reconnecting client missed since `last_event_id`.
+
+        When the transport cannot cover the gap, a single resync frame is
+        returned instead, so the client refetches.
+        """
+        events = await self.transport.replay(self.REDIS_PUBLIC_CHANNEL, last_event_id)
+        if events is None:
+            return [EventFrame(EventItem(self.RESYNC_EVENT, None, False))]
+
+        channels = {self.REDIS_PUBLIC_CHANNEL}
+        if include_private and self.serve_private:
+            channels.add(self.REDIS_PRIVATE_CHANNEL)
+        return [EventFrame(event) for channel, event in events if channel in channels]
+
+    def add_internal_handler(self, handler: InternalEventHandler):
+        self._internal_handlers.append(handler)
+
+    async def broadcast_public(self, type: str, data: dict = None, coalesce_key: Hashable = None):
         evt = EventItem(type, data, False)
+        await self._coalescer.submit(self.REDIS_PUBLIC_CHANNEL, evt, coalesce_key)
+
+    async def broadcast_private(self, type: str, data: dict = None, coalesce_key: Hashable = None):
+        evt = EventItem(type, data, True)
+        await self._coalescer.submit(self.REDIS_PRIVATE_CHANNEL, evt, coalesce_key)
+
+    async def broadcast_keepalive(self):
+        """Ping for idle streams; unnumbered, as clients only see an SSE comment."""
+        evt = EventItem(PING_EVENT, None, False)
         await self.transport.publish(self.REDIS_PUBLIC_CHANNEL, evt)
 
-    async def broadcast_private(self, type: str, data: dict = None):
+    async def broadcast_internal(self, type: str, data: dict = None):
         evt = EventItem(type, data, True)
-        await self.transport.publish(self.REDIS_PRIVATE_CHANNEL, evt)
+        await self.transport.publish(self.REDIS_INTERNAL_CHANNEL, evt)
+
+    async def _publish_sequenced(self, channel: str, event: EventItem):
+        # numbered after coalescing, so a merged burst leaves no gap
+        await self.transport.publish(channel, event, sequenced=True)
 
     async def _broadcast_to_local(self, clients: Set[BoundedQueue], event: EventItem):
+        frame = EventFrame(event)
+        started = time.monotonic()
         dead = set()
+        stalled = []
         for q in clients:
+            if q.lag(started) > self._max_lag_seconds:
+                stalled.append(q)
+                continue
             try:
-                q.put_nowait(event)
+                q.put_nowait(frame)
             except Exception:
                 dead.add(q)
 
         for q in dead:
             clients.discard(q)
 
+        for q in stalled:
+            self._evict(q)
+
+        self.stats.record_fanout(len(clients), time.monotonic() - started)
+
+    def _evict(self, q: BoundedQueue):
+        """Drops a stalled client's backlog; it is told to refetch and is closed."""
+        logger.warning(f"Evicting SSE client lagging {q.lag():.1f}s with {len(q)} queued frames")
+        if self._detach(q):
+            self.stats.evicted_total += 1
+        q.clear()
+        q.put_nowait(EventFrame(EventItem(self.RESYNC_EVENT, None, False)))
+        q.put_nowait(None)
+
 
     async def _handle_incoming_event(self, channel: str, event: EventItem):
         if channel == self.REDIS_PUBLIC_CHANNEL:
             await self._broadcast_to_local(self._public_clients, event)
-        elif channel == self.REDIS_PRIVATE_CHANNEL:
+        elif channel == self.REDIS_PRIVATE_CHANNEL and self.serve_private:
             await self._broadcast_to_local(self._private_clients, event)
+        elif channel == self.REDIS_INTERNAL_CHANNEL:
+            await self._dispatch_internal(event)
+
+    async def _dispatch_internal(self, event: EventItem):
+        for handler in self._internal_handlers:
+            try:
+                await handler(event)
+            except Exception:
+                logger.exception(f"Internal event handler failed for '{event.type}'")
 
 
     async def cleanup_all(self):
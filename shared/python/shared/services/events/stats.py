@@ -0,0 +1,46 @@
+import time
+from collections import deque
+from typing import Deque
+
+
+class EventsStats:
+    """Fan-out counters of one process, with rates over a sliding window."""
+
+    WINDOW_SECONDS = 60
+    LATENCY_SAMPLES = 1000
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.events_total = 0
+        self.frames_total = 0
+        self.evicted_total = 0
+        self.disconnected_total = 0
+        self.dropped_closed = 0
+        self._event_times: Deque[float] = deque()
+        self._fanout_latencies: Deque[float] = deque(maxlen=self.LATENCY_SAMPLES)
+
+    def record_fanout(self, clients: int, duration: float, now: float | None = None):
+        now = time.monotonic() if now is None else now
+        self.events_total += 1
+        self.frames_total += clients
+        self._event_times.append(now)
+        self._fanout_latencies.append(duration)
+        self._trim(now)
+
+    def events_per_second(self, now: float | None = None) -> float:
+        now = time.monotonic() if now is None else now
+        self._trim(now)
+        window = min(self.WINDOW_SECONDS, max(now - self.started_at, 1.0))
+        return len(self._event_times) / window
+
+    def fanout_percentile(self, percentile: float) -> float:
+        if not self._fanout_latencies:
+            return 0.0
+        ordered = sorted(self._fanout_latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[index]
+
+    def _trim(self, now: float):
+        threshold = now - self.WINDOW_SECONDS
+        while self._event_times and self._event_times[0] < threshold:
+            self._event_times.popleft()
@@ -1,5 +1,5 @@
 from datetime import timedelta
-from typing import Annotated
+from typing import Annotated, Literal
 from pydantic import BaseModel, Field, computed_field
 from pydantic.networks import RedisDsn, UrlConstraints
 from pydantic_core import MultiHostUrl
@@ -55,6 +55,59 @@ class BaseRedisSettings(BaseModel):
         description="Redis DSN (redis:// or rediss://)."
     )
 
+
+class BaseEventsSettings(BaseModel):
+    SSE_MAX_LAG_SECONDS: float = Field(
+        default=30,
+        description="SSE clients stalled longer than this are evicted and told to resync."
+    )
+
+    SSE_COALESCE_WINDOW: float = Field(
+        default=0.5,
+        description="Seconds within which repeated public/private events of one type are merged (0 disables)."
+    )
+
+    SSE_TRANSPORT: Literal["pubsub", "streams"] = Field(
+        default="pubsub",
+        description="Redis pub/sub, or Redis Streams that let reconnecting clients replay missed events."
+    )
+
+    SSE_STREAM_MAXLEN: int = Field(
+        default=10000,
+        description="Approximate number of events kept in the Redis stream for replay."
+    )
+
+    SSE_REDIS_MAX_CONNECTIONS: int = Field(
+        default=10,
+        description="Size of the Redis connection pool used by the pub/sub transport."
+    )
+
+    SSE_PUBLISH_QUEUE_SIZE: int = Field(
+        default=10000,
+        description="Events held in memory while Redis is unreachable."
+    )
+
+    SSE_PUBLISH_OVERFLOW: Literal["drop_oldest", "drop_newest"] = Field(
+        default="drop_oldest",
+        description="Which event is lost once the publish queue is full."
+    )
+
+    SSE_RECONNECT_MIN_MS: int = Field(
+        default=1000,
+        description="Lower bound of the jittered reconnect delay sent to clients on shutdown."
+    )
+
+    SSE_RECONNECT_MAX_MS: int = Field(
+        default=15000,
+        description="Upper bound of the jittered reconnect delay sent to clients on shutdown."
+    )
+
+    SSE_DRAIN_SECONDS: float = Field(
+        default=8,
+        description="Deadline for closing open SSE streams on shutdown; keep it below the stop grace period."
+    )
+
+
 class BaseMongoSettings(BaseModel):
     MONGO_URI: MongoDsn = Field(
         default=None,
@@ -17,12 +17,22 @@ def register_chained_signal_handlers(
         else:
             signals = (signal.SIGINT, signal.SIGBREAK)
 
+    # signal handlers run between any two bytecodes of the main thread, so the
+    # coroutine is handed to the loop rather than scheduled from in there
+    loop = asyncio.get_running_loop()
+    tasks = set()
+
+    def spawn(signum: int):
+        task = loop.create_task(handler(signum))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
     for sig in signals:
         original_handler = signal.getsignal(sig)
 
         def make_handler(original):
             def wrapper(signum, frame):
-                asyncio.create_task(handler(signum))
+                loop.call_soon_threadsafe(spawn, signum)
 
                 if callable(original):
                     original(signum, frame)
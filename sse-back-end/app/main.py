@@ -26,6 +26,7 @@ async def make_shutdown_handler(events: EventsService):
 async def lifespan(app: FastAPI):
     events: EventsService = app.state.events
     await events.start()
+    events.start_stats_reporter()
 
     register_chained_signal_handlers(
         handler=await make_shutdown_handler(events)
@@ -42,7 +43,20 @@ def create_app(settings: Settings = None):
         lifespan = lifespan,
     )
 
-    config = EventsServiceConfig(str(settings.REDIS_URI), settings.DEBUG)
+    config = EventsServiceConfig(
+        redis_uri               = str(settings.REDIS_URI),
+        is_debug                = settings.DEBUG,
+        max_lag_seconds         = settings.SSE_MAX_LAG_SECONDS,
+        coalesce_window_seconds = settings.SSE_COALESCE_WINDOW,
+        transport               = settings.SSE_TRANSPORT,
+        stream_maxlen           = settings.SSE_STREAM_MAXLEN,
+        redis_max_connections   = settings.SSE_REDIS_MAX_CONNECTIONS,
+        publish_queue_size      = settings.SSE_PUBLISH_QUEUE_SIZE,
+        publish_overflow        = settings.SSE_PUBLISH_OVERFLOW,
+        reconnect_delay_ms      = (settings.SSE_RECONNECT_MIN_MS, settings.SSE_RECONNECT_MAX_MS),
+        drain_seconds           = settings.SSE_DRAIN_SECONDS,
+        serve_private           = settings.SSE_SERVE_PRIVATE,
+    )
     events = EventsService(config)
     app.state.events = events
     register_routes(app, events, settings)
@@ -1,10 +1,10 @@
 import asyncio
-import json
-from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, Header, HTTPException, Query
 from fastapi.responses import StreamingResponse
 
 from shared import BoundedQueue
 from shared.services import EventsService
+from shared.services.events import EventFrame, StreamEncoder
 from shared.utils.jwt_utils import InvalidTokenError, decode_jwt
 from app.settings import Settings
 
@@ -26,9 +26,31 @@ def make_get_claims(settings: Settings):
 def register(app: FastAPI, service: EventsService, settings: Settings):
     get_claims = make_get_claims(settings)
 
+    @app.get("/api/events/stats")
+    async def events_stats(claims: dict | None = Depends(get_claims)):
+        if claims is None:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        return await service.get_cluster_stats()
+
     @app.get("/api/events")
-    async def events(claims: dict | None = Depends(get_claims)):
-        q = BoundedQueue(maxsize=100)
+    async def events(
+        claims: dict | None = Depends(get_claims),
+        last_event_id: str | None = Query(default=None, alias="lastEventId"),
+        last_event_id_header: str | None = Header(default=None, alias="Last-Event-ID"),
+        compact: bool = Query(default=False),
+        deflate: bool = Query(default=False),
+        accept_encoding: str | None = Header(default=None),
+    ):
+        if service.draining:
+            raise HTTPException(
+                status_code=503,
+                detail="Events stream is shutting down",
+                headers={"Retry-After": str(service.retry_after())},
+            )
+
+        q = BoundedQueue(maxsize=100, key=EventFrame.dedup_key)
+        last_event_id = last_event_id_header or last_event_id
+        encoder = StreamEncoder.negotiate(compact, deflate, accept_encoding)
 
         user = claims["sub"] if claims else None
         is_auth = user is not None
@@ -37,22 +59,29 @@ def register(app: FastAPI, service: EventsService, settings: Settings):
         if is_auth:
             service.add_private_client(q)
 
+        # subscribed first, so nothing published during the replay is lost
+        backlog = await service.replay(last_event_id, is_auth) if last_event_id else []
+        replayed_until = backlog[-1].event.id if backlog else None
+
         async def event_generator():
             try:
+                for frame in backlog:
+                    yield encoder.encode(frame, user)
+
                 while True:
-                    event = await q.async_get()
-                    if event is None:
+                    frame = await q.async_get()
+                    if frame is None:
                         break
 
-                    if event.private and not is_auth:
+                    if frame.private and not is_auth:
                         continue
 
-                    if user:
-                        event.user = user
+                    if not frame.published_after(replayed_until):
+                        continue
 
-                    yield f"data: {json.dumps(event.to_dict())}\n\n"
+                    yield encoder.encode(frame, user)
 
-                    if event.type == "shutdown":
+                    if frame.type == "shutdown":
                         await asyncio.sleep(0)
                         break
             finally:
@@ -64,5 +93,6 @@ def register(app: FastAPI, service: EventsService, settings: Settings):
             headers={
                 "Cache-Control": "no-cache",
                 "X-Accel-Buffering": "no",
+                **encoder.headers,
             },
         )
@@ -1,11 +1,12 @@
 from functools import lru_cache
 import os
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from shared.settings.base import BaseAppSettings, BaseJWTSettings, BaseRedisSettings
+from shared.settings.base import BaseAppSettings, BaseEventsSettings, BaseJWTSettings, BaseRedisSettings
 
 
-class Settings(BaseSettings, BaseAppSettings, BaseJWTSettings, BaseRedisSettings):
+class Settings(BaseSettings, BaseAppSettings, BaseJWTSettings, BaseRedisSettings, BaseEventsSettings):
     model_config = SettingsConfigDict(
         env_file          = "../.env",
         env_file_encoding = "utf-8",
@@ -13,6 +14,24 @@ class Settings(BaseSettings, BaseAppSettings, BaseJWTSettings, BaseRedisSettings
         extra             = "ignore"
     )
 
+    HOST: str = "0.0.0.0"
+    PORT: int = 5005
+
+    SSE_WORKERS: int = Field(
+        default=1,
+        description=(
+            "Worker processes, each with its own SO_REUSEPORT socket and Redis subscription. "
+            "Each worker has its own coalescer and drain: on shutdown every worker spreads its "
+            "own clients over SSE_DRAIN_SECONDS, so SSE_DRAIN_SECONDS + 5s must stay below "
+            "the stop grace period whatever the count."
+        )
+    )
+
+    SSE_SERVE_PRIVATE: bool = Field(
+        default=True,
+        description="Subscribe to private events; False makes a public-only replica."
+    )
+
 
 class ProductionSettings(Settings):
     DEBUG: bool = False
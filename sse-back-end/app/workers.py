@@ -0,0 +1,109 @@
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import time
+
+import uvicorn
+
+from app.settings import Settings
+from shared.services.events.redis_transport import RedisTransport
+
+
+logger = logging.getLogger(__name__)
+
+
+APP = "run:app"
+LISTEN_BACKLOG = 4096
+# after its drain a worker still flushes the publisher and closes Redis;
+# SSE_DRAIN_SECONDS plus this must stay below the compose stop_grace_period
+# (8 + 5 < 15), or the supervisor and then docker kill workers mid-drain
+STOP_MARGIN = RedisTransport.STOP_FLUSH_TIMEOUT
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    # every worker listens on its own socket; the kernel spreads accepts
+    # across them instead of waking all workers on a shared one
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(LISTEN_BACKLOG)
+    return sock
+
+
+def _run_worker(host: str, port: int):
+    # a terminal Ctrl+C reaches only the supervisor, which forwards it once;
+    # a second SIGINT would make uvicorn skip its graceful shutdown
+    os.setpgrp()
+    sock = _bind(host, port)
+    config = uvicorn.Config(APP, backlog=LISTEN_BACKLOG, log_level="info")
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+class WorkerSupervisor:
+    """Keeps `workers` SO_REUSEPORT uvicorn processes alive and stops them together."""
+
+    def __init__(self, host: str, port: int, workers: int, stop_timeout: float):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.stop_timeout = stop_timeout
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: list[multiprocessing.Process] = []
+        self._stop_signal: int | None = None
+
+    def run(self):
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, self._on_signal)
+
+        self._processes = [self._spawn() for _ in range(self.workers)]
+        logger.info(f"Started {self.workers} SSE workers on {self.host}:{self.port}")
+
+        while self._stop_signal is None:
+            for i, process in enumerate(self._processes):
+                if not process.is_alive():
+                    logger.warning(f"SSE worker {process.pid} exited with {process.exitcode}, restarting")
+                    self._processes[i] = self._spawn()
+            time.sleep(1)
+
+        self._stop()
+
+    def _spawn(self) -> multiprocessing.Process:
+        process = self._context.Process(target=_run_worker, args=(self.host, self.port), daemon=False)
+        process.start()
+        return process
+
+    def _on_signal(self, signum, frame):
+        self._stop_signal = signum
+
+    def _stop(self):
+        # each worker drains its own clients on the forwarded signal, all in
+        # parallel, so stopping takes one drain window whatever the count
+        for process in self._processes:
+            if process.is_alive():
+                os.kill(process.pid, self._stop_signal)
+
+        deadline = time.monotonic() + self.stop_timeout
+        for process in self._processes:
+            process.join(max(deadline - time.monotonic(), 0))
+
+        for process in self._processes:
+            if process.is_alive():
+                logger.warning(f"SSE worker {process.pid} did not stop in time, killing")
+                process.kill()
+                process.join()
+
+
+def serve(settings: Settings):
+    workers = max(settings.SSE_WORKERS, 1)
+
+    if workers == 1:
+        uvicorn.run(APP, host=settings.HOST, port=settings.PORT, backlog=LISTEN_BACKLOG)
+    elif not hasattr(socket, "SO_REUSEPORT"):
+        # one shared socket handed to uvicorn's own process manager
+        uvicorn.run(APP, host=settings.HOST, port=settings.PORT, backlog=LISTEN_BACKLOG, workers=workers)
+    else:
+        stop_timeout = settings.SSE_DRAIN_SECONDS + STOP_MARGIN
+        WorkerSupervisor(settings.HOST, settings.PORT, workers, stop_timeout).run()
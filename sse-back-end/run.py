@@ -2,6 +2,7 @@
 
 from app.settings import get_settings, Settings
 from app.main import create_app
+from app.workers import serve
 from fastapi import FastAPI
 import uvicorn
 
@@ -10,9 +11,12 @@ settings: Settings = get_settings()
 app: FastAPI = create_app(settings)
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "run:app",
-        host="0.0.0.0",
-        port=5005,
-        reload=settings.DEBUG
-    )
+    if settings.DEBUG:
+        uvicorn.run(
+            "run:app",
+            host=settings.HOST,
+            port=settings.PORT,
+            reload=True
+        )
+    else:
+        serve(settings)